@@ -28,6 +28,7 @@ import {
   TouchableOpacity,
   SafeAreaView,
   ActivityIndicator,
+  Platform,
 } from 'react-native';
 import { StatusBar } from 'expo-status-bar';
 import { gcm } from '@noble/ciphers/aes';
@@ -508,6 +509,16 @@ export default function App() {
       addLog('ERROR', `${failed} test(s) failed. See details above.`);
     }
 
+    // Machine-readable run record for the report generator (docgen.results):
+    // adb logcat -s ReactNativeJS > POC6-NobleCiphers/results/<device>.jsonl
+    console.log(`POC_RESULT ${JSON.stringify({
+      poc: 'POC6',
+      timestamp: new Date().toISOString(),
+      platform: Platform.OS,
+      device: (Platform.constants as { Model?: string }).Model ?? Platform.OS,
+      results: allResults,
+    })}`);
+
     setResults(allResults);
     setRunning(false);
     setCompleted(true);
@@ -0,0 +1,8 @@
+"""
+Shared document generation for HOS-13.
+
+The report content lives in declarative JSON specs under ``docgen/specs/``;
+``docgen.render`` compiles them into render plans and writes the .docx files.
+"""
+
+OUTPUT_DIR = r"d:\Data_Delimited\Family_OS\jira\HOS13"
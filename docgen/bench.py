@@ -0,0 +1,205 @@
+"""
+Benchmark suite for HOS-13 document generation.
+
+    python -m docgen bench [--only SUBSTR] [--repeat N] [--quick] [--stream]
+                           [--baseline FILE] [--update-baseline] [--tolerance F]
+
+Two kinds of case are measured:
+
+    generate/<spec>     a real document rendered end to end, as its generator does
+    table_rows/<n>      one table with n rows (10 .. 100k)
+    code_blocks/<n>     n code blocks (10 .. 10k)
+    sections/<n>        n sections of heading, text, table and code (1 .. 1000)
+
+Each case runs in a fresh process so that its peak RSS is its own. The best
+wall time over ``--repeat`` runs, the peak RSS and the output size are written
+as JSON, and compared against a stored baseline. Any metric that grows by more
+than the tolerance is reported as a regression and the command exits with
+status 1.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from docgen.reproducible import save_docx
+from docgen.specs import list_specs
+
+BENCH_DIR = ".docgen-bench"
+RESULTS_NAME = "results.json"
+BASELINE_NAME = "baseline.json"
+
+SCALING = {
+    "table_rows": (10, 100, 1000, 10000, 100000),
+    "code_blocks": (10, 100, 1000, 10000),
+    "sections": (1, 10, 100, 1000),
+}
+QUICK_LIMIT = 1000
+
+# Differences below these floors are noise, whatever the relative change.
+_FLOORS = {"seconds": 0.05, "peak_rss_kb": 8 * 1024, "output_bytes": 1024}
+
+
+def case_names(quick=False):
+    names = [f"generate/{name}" for name in list_specs()]
+    for kind, sizes in SCALING.items():
+        names.extend(f"{kind}/{n}" for n in sizes if not quick or n <= QUICK_LIMIT)
+    return names
+
+
+def _table_spec(n):
+    rows = [[f"row-{i}", "react-native-example", "1.2.3", "MIT", "PASS", "note text"] for i in range(n)]
+    header = ["Name", "Package", "Version", "License", "Status", "Notes"]
+    return [{"id": "1", "title": "Table", "blocks": [{"type": "table", "header": header, "rows": rows}]}]
+
+
+def _code_spec(n):
+    code = "const key = await deriveKey(password, salt);\nconsole.log(key);"
+    blocks = [{"type": "code", "code": f"// block {i}\n{code}"} for i in range(n)]
+    return [{"id": "1", "title": "Code", "blocks": blocks}]
+
+
+def _sections_spec(n):
+    return [
+        {
+            "id": str(i + 1),
+            "title": f"Section {i + 1}",
+            "blocks": [
+                {"type": "heading", "text": f"{i + 1}. Section {i + 1}", "level": 1},
+                {"type": "paragraph", "text": "Body text for the section. " * 4},
+                {"type": "table", "header": ["Key", "Value"], "rows": [[f"k{j}", f"v{i}-{j}"] for j in range(5)]},
+                {"type": "code", "code": f"npm run poc -- --section {i + 1}"},
+            ],
+        }
+        for i in range(n)
+    ]
+
+
+_SYNTHETIC = {"table_rows": _table_spec, "code_blocks": _code_spec, "sections": _sections_spec}
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _run_case(name, output_dir, stream):
+    """Render one case into ``output_dir``; runs in a fresh worker process."""
+    from docgen.render import compile_spec, render_to_file
+    from docgen.stream import stream_to_file
+    kind, _, arg = name.partition("/")
+    if kind == "generate":
+        start = time.perf_counter()
+        filepath = render_to_file(arg, output_dir, stream=stream)
+        seconds = time.perf_counter() - start
+    else:
+        spec = {"name": name, "title": name, "filename": f"{kind}_{arg}.docx",
+                "sections": _SYNTHETIC[kind](int(arg))}
+        filepath = os.path.join(output_dir, spec["filename"])
+        start = time.perf_counter()
+        plan = compile_spec(spec)
+        if stream:
+            stream_to_file(plan, filepath)
+        else:
+            save_docx(plan.render(), filepath)
+        seconds = time.perf_counter() - start
+    return {"seconds": seconds, "peak_rss_kb": _peak_rss_kb(), "output_bytes": os.path.getsize(filepath)}
+
+
+def measure(name, repeat=1, stream=False):
+    """Run case ``name`` ``repeat`` times in fresh processes; keep the best time."""
+    context = multiprocessing.get_context("spawn")
+    best = None
+    with tempfile.TemporaryDirectory(prefix="docgen-bench-") as output_dir:
+        for _ in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(_run_case, name, output_dir, stream).result()
+            if best is None or result["seconds"] < best["seconds"]:
+                best = result
+    return best
+
+
+def compare(results, baseline, tolerance):
+    """Return ``(case, metric, old, new)`` for every metric that regressed."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for metric, floor in _FLOORS.items():
+            before, after = old.get(metric), result.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > floor:
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def _load_cases(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["cases"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save(path, cases, stream):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "stream": stream,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cases": cases,
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def run_bench(names, repeat=1, stream=False, results_path=None, baseline_path=None,
+              update_baseline=False, tolerance=0.25):
+    """Measure ``names``, store the results and compare them with the baseline.
+
+    Returns 1 if any case regressed against the baseline, else 0. With
+    ``update_baseline`` the results replace (or extend) the baseline instead.
+    """
+    results_path = results_path or os.path.join(BENCH_DIR, RESULTS_NAME)
+    baseline_path = baseline_path or os.path.join(BENCH_DIR, BASELINE_NAME)
+    print(f"{'case':<28} {'seconds':>9} {'peak MB':>9} {'output KB':>10}")
+    results = {}
+    for name in names:
+        result = results[name] = measure(name, repeat, stream)
+        rss = result["peak_rss_kb"]
+        rss = f"{rss / 1024:9.1f}" if rss is not None else f"{'-':>9}"
+        print(f"{name:<28} {result['seconds']:9.3f} {rss} {result['output_bytes'] / 1024:10.1f}")
+    _save(results_path, results, stream)
+    print(f"Results written to {results_path}")
+
+    baseline = _load_cases(baseline_path)
+    if update_baseline:
+        _save(baseline_path, {**(baseline or {}), **results}, stream)
+        print(f"Baseline updated: {baseline_path}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+    regressions = compare(results, baseline, tolerance)
+    for name, metric, before, after in regressions:
+        print(f"  REGRESSION  {name} {metric}: {before:g} -> {after:g} (+{(after / before - 1) * 100:.0f}%)")
+    print(f"{len(regressions)} regression(s) against {baseline_path} (tolerance {tolerance:.0%})")
+    return 1 if regressions else 0
@@ -0,0 +1,196 @@
+"""
+Multi-document build for HOS-13.
+
+Every document is independent, so ``build`` fans them out to a process pool
+and reports the wall time of each one as it finishes. Every requested
+format of a document (.docx, HTML, Markdown; see docgen.export) is its own
+pool task; PDFs are converted from the built .docx afterwards (see
+docgen.pdf). Outputs whose inputs match the build manifest (see
+docgen.manifest) are skipped. Charts of all
+documents are drawn first, in the same pool size (see docgen.charts), and
+changed POC package.json files are parsed (see docgen.packages).
+"""
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from docgen.charts import prepare_charts, spec_charts
+from docgen.manifest import Manifest, input_hash
+from docgen.packages import prepare_packages
+from docgen.specs import load_spec
+
+
+CACHE_DIRNAME = os.path.join(".docgen-cache", "fragments")
+
+
+def _label(name, fmt):
+    return name if fmt == "docx" else f"{name} [{fmt}]"
+
+
+def _build_one(name, output_dir, cache_bytes, stream=False, profile=False, fmt="docx", plan=None):
+    """Render one spec in one format to ``output_dir``; runs inside a pool worker.
+
+    ``plan`` is the already compiled plan when the parent shares one between
+    formats; otherwise the worker compiles it.
+    """
+    from docgen.export import write_plan
+    from docgen.fragments import get_fragment_cache
+    from docgen.render import get_plan
+    start = time.perf_counter()
+    if plan is None:
+        plan = get_plan(name)
+    if profile and fmt == "docx":
+        # No fragment cache: a cached section would be profiled as one splice.
+        from docgen.profiling import profile_to_file
+        filepath = os.path.join(output_dir, plan.filename)
+        profile_to_file(plan, filepath)
+    else:
+        cache = None
+        if cache_bytes and fmt == "docx":
+            cache = get_fragment_cache(os.path.join(output_dir, CACHE_DIRNAME), cache_bytes)
+        filepath = write_plan(plan, fmt, output_dir, cache, stream)
+    return filepath, time.perf_counter() - start
+
+
+def build(targets, output_dir, jobs=None, cache_bytes=None, stream=False, profile=False):
+    """Render ``(name, format)`` targets into ``output_dir``, yielding results as they finish.
+
+    Each result is ``(name, format, filepath, seconds, error)``; ``error`` is
+    None on success. ``jobs=1`` renders in-process without a pool. A document
+    wanted in several formats is compiled once here and its plan shared by
+    the format workers. Section fragments are cached under ``output_dir`` up
+    to ``cache_bytes`` (0 disables). ``stream`` writes each .docx
+    incrementally (see docgen.stream); ``profile`` writes a per-section
+    profile instead (see docgen.profiling).
+    """
+    if cache_bytes is None:
+        from docgen.fragments import DEFAULT_MAX_BYTES
+        cache_bytes = DEFAULT_MAX_BYTES
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(targets)))
+    plans = {}
+    counts = Counter(name for name, _fmt in targets)
+    if jobs > 1 and any(n > 1 for n in counts.values()):
+        from docgen.render import get_plan
+        plans = {name: get_plan(name) for name, n in counts.items() if n > 1}
+    if jobs == 1:
+        for name, fmt in targets:
+            try:
+                filepath, seconds = _build_one(name, output_dir, cache_bytes, stream, profile, fmt)
+            except Exception as exc:
+                yield name, fmt, None, 0.0, exc
+            else:
+                yield name, fmt, filepath, seconds, None
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_build_one, name, output_dir, cache_bytes, stream, profile, fmt, plans.get(name)): (name, fmt)
+            for name, fmt in targets
+        }
+        for future in as_completed(futures):
+            name, fmt = futures[future]
+            try:
+                filepath, seconds = future.result()
+            except Exception as exc:
+                yield name, fmt, None, 0.0, exc
+            else:
+                yield name, fmt, filepath, seconds, None
+
+
+def convert_pdfs(names, output_dir, manifest, jobs=None, force=False):
+    """Convert the built .docx of ``names`` to PDF; returns the number of failures.
+
+    A PDF is skipped while its .docx content hash matches the manifest (see
+    docgen.pdf); the rest go through one pool of warm converters.
+    """
+    from docgen.pdf import ConverterError, ConverterPool, docx_digest
+    pending = {}
+    for name in names:
+        source = os.path.join(output_dir, load_spec(name)["filename"])
+        digest = docx_digest(source)
+        if not force and manifest.is_current(name, digest, "pdf"):
+            print(f"  skipped  {_label(name, 'pdf')} (unchanged)")
+            continue
+        pending[source] = (name, digest)
+    if not pending:
+        return 0
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    try:
+        pool = ConverterPool(min(jobs, len(pending)))
+    except ConverterError as exc:
+        for name, _digest in pending.values():
+            print(f"  FAILED  {_label(name, 'pdf')}: {exc}")
+        return len(pending)
+    failed = 0
+    with pool:
+        if not pool.warm:
+            print("  pdf: UNO bindings not found, converting with one-shot soffice calls")
+        pairs = [(source, os.path.splitext(source)[0] + ".pdf") for source in pending]
+        for source, target, seconds, error in pool.convert_all(pairs):
+            name, digest = pending[source]
+            if error is not None:
+                failed += 1
+                print(f"  FAILED  {_label(name, 'pdf')}: {error}")
+            else:
+                manifest.record(name, digest, "pdf")
+                print(f"  {seconds:7.2f}s  {_label(name, 'pdf')} -> {target}")
+    return failed
+
+
+def run_build(names, output_dir, jobs=None, force=False, cache_bytes=None, stream=False, profile=False,
+              formats=("docx",)):
+    """Build ``names`` in ``formats`` and print per-output timings; returns an exit status.
+
+    Unless ``force`` or ``profile`` is set, outputs whose input hash matches
+    the manifest in ``output_dir`` are skipped. The "pdf" format converts the
+    .docx after it is built, so it implies "docx".
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    manifest = Manifest.load(output_dir)
+    digests = {name: input_hash(name) for name in names}
+    force = force or profile
+    pdf = "pdf" in formats
+    formats = [fmt for fmt in formats if fmt != "pdf"]
+    if pdf and "docx" not in formats:
+        formats.insert(0, "docx")
+    targets = [(name, fmt) for name in names for fmt in formats]
+    stale = [(name, fmt) for name, fmt in targets if force or not manifest.is_current(name, digests[name], fmt)]
+    for name, fmt in targets:
+        if (name, fmt) not in stale:
+            print(f"  skipped  {_label(name, fmt)} (unchanged)")
+    if not stale and not pdf:
+        print(f"Nothing to build in {output_dir}")
+        return 0
+    if stale:
+        print(f"Building {len(stale)} output(s) into {output_dir}")
+    stale_names = list(dict.fromkeys(name for name, _fmt in stale))
+    parsed = prepare_packages(jobs)
+    if parsed:
+        print(f"  packages: {parsed} file(s) parsed")
+    charts = [chart for name in stale_names for chart in spec_charts(load_spec(name))]
+    if charts:
+        drawn = prepare_charts(charts, jobs)
+        print(f"  charts: {drawn} drawn, {len(charts) - drawn} cached")
+    failed = 0
+    broken = set()
+    for name, fmt, filepath, seconds, error in build(stale, output_dir, jobs, cache_bytes, stream, profile):
+        if error is not None:
+            failed += 1
+            broken.add(name)
+            print(f"  FAILED  {_label(name, fmt)}: {error}")
+        else:
+            same = manifest.record(name, digests[name], fmt)
+            print(f"  {seconds:7.2f}s  {_label(name, fmt)} -> {filepath}" + (" (identical)" if same else ""))
+    if pdf:
+        failed += convert_pdfs([name for name in names if name not in broken], output_dir, manifest, jobs, force)
+    manifest.save()
+    if profile:
+        from docgen.profiling import PROFILE_DIRNAME
+        print(f"Profiles written to {os.path.join(output_dir, PROFILE_DIRNAME)}")
+    print(f"Done in {time.perf_counter() - start:.2f}s ({failed} failed)")
+    return 1 if failed else 0
@@ -0,0 +1,173 @@
+"""
+Benchmark charts for the HOS-13 reports.
+
+A chart block (see docgen.specs) is drawn with matplotlib into a PNG and
+embedded as a centred picture. PNGs are content-addressed: the file name is
+a hash of the chart's kind, labels and data, the chart style and this
+module's source, so an unchanged chart is never redrawn and identical
+charts are shared between documents and output directories.
+
+``prepare_charts`` draws every missing chart up front in a process pool;
+``python -m docgen build`` calls it for all documents before rendering them.
+A chart that was not prepared is drawn in-process on first use.
+
+matplotlib is optional. Without it charts are left out of the documents
+with a warning.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from docgen.results import ROOT_DIR, expand_section
+
+CHART_DIR = os.path.join(ROOT_DIR, ".docgen-cache", "charts")
+DEFAULT_WIDTH = 6.0  # inches
+DPI = 150
+
+CHART_STYLE = {
+    "size": (6.4, 3.6),
+    "font_size": 9,
+    "colors": {"encrypt": "#2C3E50", "decrypt": "#C47800", "box": "#2C3E50"},
+}
+
+# Fields of a chart block that change the picture (width only scales it).
+_DRAWN_FIELDS = ("kind", "title", "xlabel", "ylabel", "data")
+
+
+@functools.lru_cache(maxsize=None)
+def _renderer_version():
+    with open(os.path.abspath(__file__), "rb") as f:
+        h = hashlib.sha256(f.read())
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+        h.update(version("matplotlib").encode())
+    except (ImportError, PackageNotFoundError):
+        pass
+    return h.hexdigest()
+
+
+def chart_key(chart):
+    """Content hash of a chart block: its drawn fields, the style and the renderer."""
+    drawn = {field: chart.get(field) for field in _DRAWN_FIELDS}
+    h = hashlib.sha256(json.dumps([drawn, CHART_STYLE], sort_keys=True).encode())
+    h.update(_renderer_version().encode())
+    return h.hexdigest()
+
+
+def chart_path(key):
+    return os.path.join(CHART_DIR, key + ".png")
+
+
+def _draw_latency(ax, data):
+    colors = CHART_STYLE["colors"]
+    x = range(len(data["labels"]))
+    for op, series in data["series"].items():
+        ax.plot(x, series["median"], marker="o", color=colors[op], label=f"{op} (median)")
+        ax.plot(x, series["p95"], linestyle="--", color=colors[op], alpha=0.6, label=f"{op} (p95)")
+    ax.set_xticks(list(x), data["labels"])
+    ax.legend(frameon=False)
+
+
+def _draw_distribution(ax, data):
+    groups = data["groups"]
+    ax.boxplot(
+        list(groups.values()),
+        showfliers=False,
+        patch_artist=True,
+        boxprops={"facecolor": "none", "edgecolor": CHART_STYLE["colors"]["box"]},
+        medianprops={"color": CHART_STYLE["colors"]["decrypt"]},
+    )
+    ax.set_xticks(range(1, len(groups) + 1), [f"{name}\n(n={len(v)})" for name, v in groups.items()])
+
+
+_DRAW = {"latency": _draw_latency, "distribution": _draw_distribution}
+
+
+def draw_chart(chart):
+    """Render a chart block to PNG bytes."""
+    import io
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=CHART_STYLE["size"])
+    ax = fig.add_subplot()
+    _DRAW[chart["kind"]](ax, chart["data"])
+    ax.set_title(chart.get("title", ""), fontsize=CHART_STYLE["font_size"] + 2)
+    ax.set_xlabel(chart.get("xlabel", ""), fontsize=CHART_STYLE["font_size"])
+    ax.set_ylabel(chart.get("ylabel", ""), fontsize=CHART_STYLE["font_size"])
+    ax.tick_params(labelsize=CHART_STYLE["font_size"])
+    ax.grid(axis="y", alpha=0.3)
+    fig.tight_layout()
+    out = io.BytesIO()
+    # No Software/date metadata, so equal charts give equal bytes.
+    fig.savefig(out, format="png", dpi=DPI, metadata={"Software": None})
+    return out.getvalue()
+
+
+def _write_chart(chart, key):
+    """Draw ``chart`` into the cache; runs in a pool worker."""
+    png = draw_chart(chart)
+    os.makedirs(CHART_DIR, exist_ok=True)
+    tmp = chart_path(key) + f".{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(png)
+    os.replace(tmp, chart_path(key))
+    return key
+
+
+def prepare_charts(charts, jobs=None):
+    """Draw the charts not in the cache yet; returns how many were drawn.
+
+    Returns 0 without drawing anything if matplotlib is not installed.
+    """
+    missing = {}
+    for chart in charts:
+        key = chart_key(chart)
+        if not os.path.exists(chart_path(key)):
+            missing[key] = chart
+    if not missing:
+        return 0
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError:
+        warnings.warn("matplotlib is not installed; charts are left out", stacklevel=2)
+        return 0
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(missing)))
+    if jobs == 1:
+        for key, chart in missing.items():
+            _write_chart(chart, key)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for future in [pool.submit(_write_chart, chart, key) for key, chart in missing.items()]:
+                future.result()
+    return len(missing)
+
+
+def ensure_chart(chart, key):
+    """Path of the chart's PNG, drawing it now if needed; None without matplotlib."""
+    path = chart_path(key)
+    if os.path.exists(path):
+        return path
+    try:
+        _write_chart(chart, key)
+    except ImportError:
+        warnings.warn("matplotlib is not installed; charts are left out", stacklevel=2)
+        return None
+    return path
+
+
+def spec_charts(spec):
+    """The chart blocks of a spec, with result-sourced data filled in."""
+    return [
+        block
+        for section in spec["sections"]
+        for block in expand_section(section)["blocks"]
+        if block["type"] == "chart"
+    ]
@@ -0,0 +1,411 @@
+"""
+Command line interface for the HOS-13 document generators.
+
+    python -m docgen list [--json]
+    python -m docgen sections NAME [--json]
+    python -m docgen manifest [--output-dir DIR] [--json]
+    python -m docgen validate [NAME ...]
+    python -m docgen packages [--drift] [--jobs N] [--json]
+    python -m docgen build [--only NAME[,NAME]] [--jobs N] [--output-dir DIR]
+                           [--force] [--no-cache] [--cache-size MB]
+                           [--stream | --profile] [--format FMT[,FMT]]
+    python -m docgen watch [--only NAME[,NAME]] [--output-dir DIR] [--format FMT[,FMT]]
+                           [--interval S] [--no-cache] [--cache-size MB] [--stream]
+    python -m docgen serve [--host HOST] [--port N | --socket PATH] [--jobs N]
+                           [--no-cache] [--cache-size MB] [--quiet]
+    python -m docgen variants TABLE [--spec NAME] [--output-dir DIR] [--jobs N]
+                              [--cache-size MB]
+    python -m docgen diff OLD NEW [--json | --rows]
+    python -m docgen optimize FILE [FILE ...] [--output-dir DIR] [--level N]
+                              [--keep-spacers]
+    python -m docgen bench [--only SUBSTR] [--repeat N] [--quick] [--stream]
+                           [--baseline FILE] [--update-baseline] [--tolerance F]
+
+The metadata commands (list, sections, manifest, validate, packages) only read specs
+and never import python-docx or lxml; rendering modules are imported by the
+commands that need them.
+"""
+
+import argparse
+import json
+
+from docgen import OUTPUT_DIR
+from docgen.specs import list_specs, load_spec, validate_spec
+
+# docgen.export.FORMATS (which imports python-docx) plus "pdf" (docgen.pdf).
+FORMATS = ("docx", "html", "md", "pdf")
+
+
+def _selected(parser, only):
+    """Resolve repeated/comma-separated ``--only`` values to spec names."""
+    available = list_specs()
+    if not only:
+        return available
+    names = []
+    for value in only:
+        for name in value.split(","):
+            name = name.strip()
+            if name not in available:
+                parser.error(f"unknown document {name!r} (choose from {', '.join(available)})")
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _print_json(data):
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _cmd_list(parser, args):
+    docs = []
+    for name in list_specs():
+        spec = load_spec(name)
+        docs.append({"name": name, "filename": spec["filename"], "title": spec["title"],
+                     "sections": len(spec["sections"])})
+    if args.json:
+        _print_json(docs)
+    else:
+        for doc in docs:
+            print(f"{doc['name']:<18} {doc['sections']:>3} sections  {doc['filename']}")
+    return 0
+
+
+def _cmd_sections(parser, args):
+    (name,) = _selected(parser, [args.name])
+    sections = [{"id": s["id"], "title": s["title"], "blocks": len(s["blocks"])}
+                for s in load_spec(name)["sections"]]
+    if args.json:
+        _print_json(sections)
+    else:
+        for section in sections:
+            print(f"{section['id']:<8} {section['title']}")
+    return 0
+
+
+def _cmd_manifest(parser, args):
+    from docgen.manifest import Manifest, input_hash
+    manifest = Manifest.load(args.output_dir)
+    docs = []
+    for name in list_specs():
+        entry = manifest.entries.get(name)
+        if entry is None:
+            status = "never built"
+        elif manifest.is_current(name, input_hash(name)):
+            status = "current"
+        else:
+            status = "stale"
+        docs.append({"name": name, "status": status, **(entry or {})})
+    if args.json:
+        _print_json({"path": manifest.path, "documents": docs})
+    else:
+        print(manifest.path)
+        for doc in docs:
+            print(f"  {doc['name']:<18} {doc['status']:<12} {doc.get('hash', '')[:12]}")
+    return 0
+
+
+def _cmd_validate(parser, args):
+    failed = 0
+    for name in _selected(parser, args.names):
+        try:
+            errors = validate_spec(load_spec(name))
+        except ValueError as exc:  # malformed JSON
+            errors = [str(exc)]
+        if errors:
+            failed += 1
+            print(f"{name}: {len(errors)} problem(s)")
+            for error in errors:
+                print(f"  {error}")
+        else:
+            print(f"{name}: ok")
+    return 1 if failed else 0
+
+
+def _cmd_packages(parser, args):
+    from docgen.packages import drift_report, load_matrix
+    matrix = load_matrix(args.jobs)
+    if args.drift:
+        report = drift_report([load_spec(name) for name in list_specs()], matrix)
+        if args.json:
+            _print_json(report)
+        else:
+            print(f"Version drift between POCs: {len(report['pocs'])}")
+            for package, per_poc in report["pocs"].items():
+                print(f"  {package:<40} " + ", ".join(f"{poc} {v}" for poc, v in per_poc.items()))
+            print(f"Table cells out of date: {len(report['tables'])}")
+            for cell in report["tables"]:
+                print(f"  {cell['spec']}: {cell['package']} {cell['column']}: "
+                      f"table {cell['table']!r}, POCs {cell['pocs']!r}")
+        return 1 if report["pocs"] or report["tables"] else 0
+    if args.json:
+        _print_json(matrix.as_dict())
+        return 0
+    width = max(len(package) for package in matrix.packages)
+    print(f"{'package':<{width}}  " + "  ".join(f"{poc:<10}" for poc in matrix.pocs))
+    for package in matrix.packages:
+        cells = [
+            matrix.version(package, poc) if poc in matrix.versions[package] else "-"
+            for poc in matrix.pocs
+        ]
+        print(f"{package:<{width}}  " + "  ".join(f"{cell:<10}" for cell in cells))
+    return 0
+
+
+def _formats(parser, values):
+    """Resolve repeated/comma-separated ``--format`` values."""
+    formats = []
+    for value in values or ["docx"]:
+        for fmt in value.split(","):
+            fmt = fmt.strip().lower()
+            fmt = {"markdown": "md"}.get(fmt, fmt)
+            if fmt not in FORMATS:
+                parser.error(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+            if fmt not in formats:
+                formats.append(fmt)
+    return formats
+
+
+def _cmd_build(parser, args):
+    from docgen.build import run_build
+    cache_bytes = 0 if args.no_cache else int(args.cache_size * 1024 * 1024)
+    return run_build(_selected(parser, args.only), args.output_dir, args.jobs, args.force, cache_bytes,
+                     args.stream, args.profile, _formats(parser, args.format))
+
+
+def _cmd_watch(parser, args):
+    from docgen.watch import watch
+    formats = _formats(parser, args.format)
+    if "pdf" in formats:
+        parser.error("watch does not convert to pdf; use 'build --format pdf'")
+    cache_bytes = 0 if args.no_cache else int(args.cache_size * 1024 * 1024)
+    return watch(_selected(parser, args.only), args.output_dir, formats, cache_bytes, args.stream,
+                 args.interval)
+
+
+def _cmd_serve(parser, args):
+    from docgen.server import serve
+    cache_bytes = 0 if args.no_cache else int(args.cache_size * 1024 * 1024)
+    return serve(args.host, args.port, args.socket, args.jobs, cache_bytes, args.quiet)
+
+
+def _cmd_variants(parser, args):
+    import os
+
+    from docgen.variants import run_variants
+    spec_name = _selected(parser, [args.spec])[0] if args.spec else None
+    output_dir = args.output_dir or os.path.join(OUTPUT_DIR, "variants")
+    try:
+        return run_variants(args.table, output_dir, spec_name, jobs=args.jobs,
+                            cache_bytes=int(args.cache_size * 1024 * 1024))
+    except (OSError, ValueError) as exc:
+        print(f"{args.table}: {exc}" if isinstance(exc, OSError) else exc)
+        return 1
+
+
+def _cmd_diff(parser, args):
+    import zipfile
+
+    from lxml import etree
+
+    from docgen.diff import correction_rows, diff_docx
+    try:
+        changes = diff_docx(args.old, args.new)
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as exc:
+        print(f"cannot diff {args.old} and {args.new}: {exc}")
+        return 1
+    if args.rows:
+        _print_json(correction_rows(changes))
+    elif args.json:
+        _print_json(changes)
+    else:
+        for change in changes:
+            where = " / ".join(change[key] for key in ("section", "row", "column") if change.get(key))
+            print(f"{change['op']:<8} {change['kind']:<9} {where}")
+            if change["old"] is not None:
+                print(f"    - {change['old']}")
+            if change["new"] is not None:
+                print(f"    + {change['new']}")
+        print(f"{len(changes)} change(s)")
+    return 0
+
+
+def _cmd_optimize(parser, args):
+    import os
+    import zipfile
+
+    from lxml import etree
+
+    from docgen.optimize import optimize_docx
+    if not 0 <= args.level <= 9:
+        parser.error("--level must be between 0 and 9")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    failed = 0
+    for path in args.files:
+        target = os.path.join(args.output_dir, os.path.basename(path)) if args.output_dir else path
+        try:
+            stats = optimize_docx(path, target, args.level, not args.keep_spacers)
+        except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as exc:
+            failed += 1
+            print(f"{path}: {exc}")
+            continue
+        before, after = stats.pop("bytes before"), stats.pop("bytes after")
+        print(f"{path}: {before:,} -> {after:,} bytes ({(after - before) / before:+.1%})")
+        for name, count in stats.items():
+            if count:
+                print(f"  {name}: {count}")
+    return 1 if failed else 0
+
+
+def _cmd_bench(parser, args):
+    from docgen.bench import case_names, run_bench
+    names = case_names(args.quick)
+    if args.only:
+        names = [n for n in names if any(pattern in n for pattern in args.only)]
+        if not names:
+            parser.error(f"no benchmark case matches {', '.join(args.only)}")
+    return run_bench(names, args.repeat, args.stream, args.output, args.baseline,
+                     args.update_baseline, args.tolerance)
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog="python -m docgen", description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="list the documents that can be built")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=_cmd_list)
+
+    p = sub.add_parser("sections", help="list the sections of a document")
+    p.add_argument("name", help="document name (see 'list')")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=_cmd_sections)
+
+    p = sub.add_parser("manifest", help="show which documents are current in an output directory")
+    p.add_argument("--output-dir", "-o", default=OUTPUT_DIR,
+                   help="output directory (default: %(default)s)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=_cmd_manifest)
+
+    p = sub.add_parser("validate", help="check specs against the block schema")
+    p.add_argument("names", nargs="*", metavar="NAME", help="documents to check (default: all)")
+    p.set_defaults(func=_cmd_validate)
+
+    p = sub.add_parser("packages", help="show the POC package version matrix or its drift")
+    p.add_argument("--drift", action="store_true",
+                   help="report versions that differ between POCs or from the spec tables (exit 1 if any)")
+    p.add_argument("--jobs", "-j", type=int, default=None,
+                   help="processes for parsing changed files (default: CPU count)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=_cmd_packages)
+
+    p = sub.add_parser("build", help="render documents in parallel")
+    p.add_argument("--only", action="append", metavar="NAME",
+                   help="only build these documents (repeatable, comma-separated)")
+    p.add_argument("--jobs", "-j", type=int, default=None,
+                   help="worker processes (default: CPU count)")
+    p.add_argument("--output-dir", "-o", default=OUTPUT_DIR,
+                   help="output directory (default: %(default)s)")
+    p.add_argument("--force", action="store_true",
+                   help="rebuild even if the manifest says a document is unchanged")
+    p.add_argument("--no-cache", action="store_true",
+                   help="render every section instead of reusing cached fragments")
+    p.add_argument("--cache-size", type=float, default=64, metavar="MB",
+                   help="fragment cache size cap (default: %(default)s MB)")
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("--stream", action="store_true",
+                      help="write document.xml incrementally to keep memory flat for very large documents")
+    mode.add_argument("--profile", action="store_true",
+                      help="record per-section time, allocations and helper element counts "
+                           "(JSON + collapsed stacks)")
+    p.add_argument("--format", "-f", action="append", metavar="FMT",
+                   help=f"output formats: {', '.join(FORMATS)} (repeatable, comma-separated; default: docx)")
+    p.set_defaults(func=_cmd_build)
+
+    p = sub.add_parser("watch", help="rebuild documents in-process whenever their inputs change")
+    p.add_argument("--only", action="append", metavar="NAME",
+                   help="only watch these documents (repeatable, comma-separated)")
+    p.add_argument("--output-dir", "-o", default=OUTPUT_DIR,
+                   help="output directory (default: %(default)s)")
+    p.add_argument("--format", "-f", action="append", metavar="FMT",
+                   help="output formats: docx, html, md (repeatable, comma-separated; default: docx)")
+    p.add_argument("--interval", type=float, default=0.25, metavar="S",
+                   help="seconds between polls (default: %(default)s)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="render every section instead of reusing cached fragments")
+    p.add_argument("--cache-size", type=float, default=64, metavar="MB",
+                   help="fragment cache size cap (default: %(default)s MB)")
+    p.add_argument("--stream", action="store_true", help="write document.xml incrementally")
+    p.set_defaults(func=_cmd_watch)
+
+    p = sub.add_parser("serve", help="render documents on request over localhost HTTP or a Unix socket")
+    p.add_argument("--host", default="127.0.0.1",
+                   help="address to listen on (default: %(default)s)")
+    where = p.add_mutually_exclusive_group()
+    where.add_argument("--port", type=int, default=8765, help="TCP port (default: %(default)s)")
+    where.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    p.add_argument("--jobs", "-j", type=int, default=None,
+                   help="render worker processes (default: CPU count)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="render every section instead of reusing cached fragments")
+    p.add_argument("--cache-size", type=float, default=64, metavar="MB",
+                   help="fragment cache size cap per worker (default: %(default)s MB)")
+    p.add_argument("--quiet", action="store_true", help="do not log requests")
+    p.set_defaults(func=_cmd_serve)
+
+    p = sub.add_parser("variants", help="render one document per row of a CSV table of param values")
+    p.add_argument("table",
+                   help="CSV file: a 'variant' column (output name), 'spec' and one column per param")
+    p.add_argument("--spec", metavar="NAME",
+                   help="document for every row (instead of a 'spec' column)")
+    p.add_argument("--output-dir", "-o", help="output directory (default: <output>/variants)")
+    p.add_argument("--jobs", "-j", type=int, default=None,
+                   help="worker processes (default: CPU count)")
+    p.add_argument("--cache-size", type=float, default=32, metavar="MB",
+                   help="fragment cache size cap per worker (default: %(default)s MB)")
+    p.set_defaults(func=_cmd_variants)
+
+    p = sub.add_parser("diff",
+                       help="list the changed headings, paragraphs and table cells between two .docx files")
+    p.add_argument("old", help="earlier version (.docx)")
+    p.add_argument("new", help="later version (.docx)")
+    out = p.add_mutually_exclusive_group()
+    out.add_argument("--json", action="store_true", help="machine-readable changes")
+    out.add_argument("--rows", action="store_true",
+                     help="corrections table rows (#, issue, old value, correction) as JSON")
+    p.set_defaults(func=_cmd_diff)
+
+    p = sub.add_parser("optimize",
+                       help="rewrite .docx files smaller (merged runs, no spacer paragraphs, zip level)")
+    p.add_argument("files", nargs="+", metavar="FILE", help=".docx files to optimize")
+    p.add_argument("--output-dir", "-o",
+                   help="write the optimized copies here (default: replace the files)")
+    p.add_argument("--level", type=int, default=9, metavar="N",
+                   help="zip deflate level 0-9, 0 stores (default: %(default)s)")
+    p.add_argument("--keep-spacers", action="store_true",
+                   help="keep empty spacer paragraphs instead of folding them into spacing")
+    p.set_defaults(func=_cmd_optimize)
+
+    p = sub.add_parser("bench", help="time generators and synthetic scaling cases")
+    p.add_argument("--only", action="append", metavar="SUBSTR",
+                   help="only run cases whose name contains SUBSTR (repeatable)")
+    p.add_argument("--repeat", type=int, default=1, metavar="N",
+                   help="runs per case; the best time is kept (default: %(default)s)")
+    p.add_argument("--quick", action="store_true", help="skip scaling cases above 1000")
+    p.add_argument("--stream", action="store_true", help="render with the streaming writer")
+    p.add_argument("--output", metavar="FILE",
+                   help="results file (default: .docgen-bench/results.json)")
+    p.add_argument("--baseline", metavar="FILE",
+                   help="baseline file (default: .docgen-bench/baseline.json)")
+    p.add_argument("--update-baseline", action="store_true",
+                   help="store these results as the baseline instead of comparing")
+    p.add_argument("--tolerance", type=float, default=0.25, metavar="F",
+                   help="allowed relative growth per metric (default: %(default)s)")
+    p.set_defaults(func=_cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    return args.func(parser, args)
@@ -0,0 +1,122 @@
+"""
+Low-level paragraph and run building for the rendering helpers.
+
+python-docx formats a run one property at a time: every ``run.font.bold``,
+``.size`` or ``.color.rgb`` assignment walks the ``w:rPr`` children to find
+its insertion point, and every ``add_paragraph(style=...)`` or
+``add_heading`` looks the style up by name in styles.xml. The helpers in
+docgen.render run thousands of times per build, so this module does that
+work once:
+
+- ``run_properties`` / ``paragraph_properties`` build a ``w:rPr`` / ``w:pPr``
+  per distinct formatting through python-docx itself (so the XML is exactly
+  what property-by-property formatting gives) and keep it as a template;
+  each use appends a deep copy.
+- ``style_id`` caches style name -> style id per document.
+- ``add_paragraph`` / ``add_run`` create the elements directly and return
+  the usual python-docx proxies.
+"""
+
+import copy
+import functools
+import weakref
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+# DocumentPart -> {style name: style id}; documents cloned from the same
+# template get their own entry, since a caller may add styles to one.
+_STYLE_IDS = weakref.WeakKeyDictionary()
+
+
+def style_id(doc, name):
+    """Id of the paragraph style ``name`` in ``doc``; None for the default style.
+
+    Raises like python-docx when ``name`` is unknown or not a paragraph style.
+    """
+    ids = _STYLE_IDS.get(doc.part)
+    if ids is None:
+        ids = _STYLE_IDS[doc.part] = {}
+    try:
+        return ids[name]
+    except KeyError:
+        ids[name] = doc.part.get_style_id(name, WD_STYLE_TYPE.PARAGRAPH)
+        return ids[name]
+
+
+@functools.lru_cache(maxsize=None)
+def run_properties(bold=None, size=None, color=None, font_name=None, style_id=None):
+    """The ``w:rPr`` template for this run formatting; never modify it.
+
+    ``style_id`` is a character style id, e.g. from
+    docgen.styles.character_style_id.
+    """
+    run = Run(OxmlElement("w:r"), None)
+    if style_id is not None:
+        run._r.get_or_add_rPr().style = style_id
+    if bold is not None:
+        run.font.bold = bold
+    if size is not None:
+        run.font.size = size
+    if color is not None:
+        run.font.color.rgb = color
+    if font_name is not None:
+        run.font.name = font_name
+    return run._r.rPr
+
+
+@functools.lru_cache(maxsize=None)
+def paragraph_properties(space_before=None, space_after=None, left_indent=None, alignment=None):
+    """The ``w:pPr`` template for this paragraph formatting; never modify it."""
+    paragraph = Paragraph(OxmlElement("w:p"), None)
+    fmt = paragraph.paragraph_format
+    if space_before is not None:
+        fmt.space_before = space_before
+    if space_after is not None:
+        fmt.space_after = space_after
+    if left_indent is not None:
+        fmt.left_indent = left_indent
+    if alignment is not None:
+        fmt.alignment = alignment
+    return paragraph._p.pPr
+
+
+@functools.lru_cache(maxsize=None)
+def shading(fill):
+    """The ``w:shd`` template for a solid ``fill`` (RRGGBB); never modify it."""
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:fill"), fill)
+    shd.set(qn("w:val"), "clear")
+    return shd
+
+
+def add_paragraph(doc, text="", style=None, p_pr=None):
+    """``doc.add_paragraph(text, style)`` with a cached style lookup.
+
+    ``p_pr`` is a ``paragraph_properties`` template; it cannot be combined
+    with ``style``.
+    """
+    p = doc.element.body.add_p()
+    if style is not None:
+        p_pr = p.get_or_add_pPr()
+        sid = style_id(doc, style)
+        if sid is not None:
+            p_pr.style = sid
+    elif p_pr is not None:
+        p.append(copy.deepcopy(p_pr))
+    if text:
+        p.add_r().text = text
+    return Paragraph(p, doc._body)
+
+
+def add_run(paragraph, text, r_pr=None):
+    """``paragraph.add_run(text)`` formatted with a ``run_properties`` template."""
+    r = paragraph._p.add_r()
+    if r_pr is not None:
+        r.append(copy.deepcopy(r_pr))
+    if text:
+        r.text = text
+    return Run(r, paragraph)
@@ -0,0 +1,313 @@
+"""
+Structural diff between two versions of a report.
+
+``diff_docx`` reads ``word/document.xml`` of each .docx with lxml's
+``iterparse``: body paragraphs and table rows are turned into text as soon
+as they are parsed and then dropped from the tree, so memory stays flat
+however long the document is. Each file becomes an outline of headings,
+paragraphs and tables (rows of cell texts), and the outlines are aligned:
+
+- sections (everything under a heading) by heading text, ignoring the
+  number, so a renumbered section still matches;
+- paragraphs within a section by text (difflib);
+- tables within a section by header, rows by their key (the first column
+  whose cells are unique and not just numbers, so a "#" or rank column
+  that shifts is skipped) and cells by column header.
+
+The result is a list of changes, each a dict::
+
+    {"op": "changed" | "added" | "removed",
+     "kind": "section" | "paragraph" | "table" | "row" | "cell",
+     "section": heading, "row": row key, "column": header,
+     "old": text or None, "new": text or None, "version": bool}
+
+with ``row`` and ``column`` only where they apply; ``version`` marks cells
+that hold a version number on either side. ``correction_rows`` turns the
+corrections among them, version cells and reworded paragraphs, into rows
+of a corrections table (#, issue, old value, correction). A table block
+with ``"diff": {"old": PATH, "new": PATH}`` (paths relative to the
+repository root) gets those rows at compile time, leaving out the changes
+to its own section; while either file is missing it keeps its
+hand-written rows.
+``python -m docgen diff OLD NEW`` prints the changes.
+"""
+
+import difflib
+import os
+import re
+import zipfile
+
+from docgen.results import ROOT_DIR
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = _W + "body"
+_SDT_CONTENT = _W + "sdtContent"
+_P = _W + "p"
+_TR = _W + "tr"
+_TC = _W + "tc"
+_T = _W + "t"
+_TAB = _W + "tab"
+_BREAKS = (_W + "br", _W + "cr")
+_PSTYLE = f"{_W}pPr/{_W}pStyle"
+_VAL = _W + "val"
+
+_DOCUMENT_PART = "word/document.xml"
+_HEADING_STYLE = re.compile(r"^(?:Heading(\d)|Title)$")
+_NUMBERING = re.compile(r"^(?:\d+(?:\.\d+)*\.?|[A-Z]\.)\s+")
+_VERSION = re.compile(r"\d+\.\d+(?:\.\d+)?")
+
+NOT_MENTIONED = "Not mentioned"
+UNTITLED = "Opening text"  # issue name for changes before the first heading
+
+
+# ============================================================
+# READING
+# ============================================================
+def _text(p):
+    return "".join([
+        (el.text or "") if el.tag == _T else ("\t" if el.tag == _TAB else "\n")
+        for el in p.iter(_T, _TAB, *_BREAKS)
+    ]).strip()
+
+
+def _drop(el):
+    """Free ``el`` and everything before it in its parent."""
+    el.clear()
+    parent = el.getparent()
+    while el.getprevious() is not None:
+        del parent[0]
+
+
+def read_outline(path):
+    """The body of the .docx at ``path`` as a list of outline items.
+
+    Items are ``("heading", text, level)`` (level 0 for the Title style),
+    ``("paragraph", text)`` and ``("table", rows)``, rows being tuples of
+    cell texts. Empty paragraphs and rows are left out; nested tables are
+    read as text of their cell.
+    """
+    from lxml import etree
+    items = []
+    table = None
+    with zipfile.ZipFile(path) as zf, zf.open(_DOCUMENT_PART) as f:
+        for _event, el in etree.iterparse(f, events=("end",), tag=(_P, _TR)):
+            parent = el.getparent()
+            if el.tag == _TR:
+                if parent.getparent().tag not in (_BODY, _SDT_CONTENT):
+                    continue  # nested table: part of its outer cell
+                cells = tuple("\n".join(filter(None, map(_text, tc.iter(_P)))) for tc in el.iterchildren(_TC))
+                if table is None or table[0] is not parent:
+                    table = (parent, [])
+                    items.append(("table", table[1]))
+                if any(cells):
+                    table[1].append(cells)
+                _drop(el)
+            elif parent.tag in (_BODY, _SDT_CONTENT):
+                text = _text(el)
+                style = el.find(_PSTYLE)
+                match = _HEADING_STYLE.match(style.get(_VAL, "")) if style is not None else None
+                if match and text:
+                    items.append(("heading", text, int(match.group(1) or 0)))
+                elif text:
+                    items.append(("paragraph", text))
+                _drop(el)
+    return [item for item in items if item[0] != "table" or item[1]]
+
+
+def _sections(items):
+    """Group outline items under their headings: ``[(heading, paragraphs, tables)]``."""
+    sections = [("", [], [])]
+    for item in items:
+        if item[0] == "heading":
+            sections.append((item[1], [], []))
+        elif item[0] == "paragraph":
+            sections[-1][1].append(item[1])
+        else:
+            sections[-1][2].append(item[1])
+    return sections if sections[0][1] or sections[0][2] else sections[1:]
+
+
+# ============================================================
+# ALIGNMENT
+# ============================================================
+def _heading_key(text):
+    return _NUMBERING.sub("", text).casefold()
+
+
+def _pairs(old, new, key=None):
+    """Align two lists; yields ``(old item or None, new item or None)``.
+
+    Equal items (by ``key``) pair up, and so do replaced ones in order;
+    the rest are added or removed.
+    """
+    a = [key(x) for x in old] if key else old
+    b = [key(x) for x in new] if key else new
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        olds, news = old[i1:i2], new[j1:j2]
+        for k in range(max(len(olds), len(news))):
+            yield (olds[k] if k < len(olds) else None), (news[k] if k < len(news) else None)
+
+
+def _key_column(rows):
+    """Index of the column that identifies the rows of a table body."""
+    width = min(map(len, rows), default=0)
+    for j in range(width):
+        values = [row[j] for row in rows]
+        if len(set(values)) == len(values) and not all(value.isdigit() for value in values):
+            return j
+    return 0
+
+
+def _keyed_rows(rows, column):
+    """``{row key: row}`` in order; repeated keys get ``#2``, ``#3``..."""
+    keyed = {}
+    for row in rows:
+        key = row[column] if column < len(row) else ""
+        n = 1
+        unique = key
+        while unique in keyed:
+            n += 1
+            unique = f"{key} #{n}"
+        keyed[unique] = row
+    return keyed
+
+
+def _row_text(row):
+    return " | ".join(cell for cell in row if cell)
+
+
+def _diff_table(section, old, new, changes):
+    old_header, new_header = old[0], new[0]
+    if old_header != new_header:
+        changes.append({"op": "changed", "kind": "table", "section": section,
+                        "old": _row_text(old_header), "new": _row_text(new_header)})
+    columns = [(name, old_header.index(name), j) for j, name in enumerate(new_header) if name in old_header]
+    new_key = _key_column(new[1:])
+    name = new_header[new_key] if new_key < len(new_header) else None
+    old_key = old_header.index(name) if name in old_header else _key_column(old[1:])
+    old_rows, new_rows = _keyed_rows(old[1:], old_key), _keyed_rows(new[1:], new_key)
+    for key, row in old_rows.items():
+        if key not in new_rows:
+            changes.append({"op": "removed", "kind": "row", "section": section, "row": key,
+                            "old": _row_text(row), "new": None})
+    for key, row in new_rows.items():
+        before = old_rows.get(key)
+        if before is None:
+            changes.append({"op": "added", "kind": "row", "section": section, "row": key,
+                            "old": None, "new": _row_text(row)})
+            continue
+        for name, i, j in columns:
+            a = before[i] if i < len(before) else ""
+            b = row[j] if j < len(row) else ""
+            if a != b:
+                changes.append({"op": "changed", "kind": "cell", "section": section, "row": key, "column": name,
+                                "old": a, "new": b, "version": bool(_VERSION.search(a) or _VERSION.search(b))})
+
+
+def _diff_section(section, old, new, changes):
+    _heading, old_paragraphs, old_tables = old
+    _heading, new_paragraphs, new_tables = new
+    for a, b in _pairs(old_paragraphs, new_paragraphs):
+        if a != b:
+            op = "changed" if a is not None and b is not None else ("added" if a is None else "removed")
+            changes.append({"op": op, "kind": "paragraph", "section": section, "old": a, "new": b})
+    for a, b in _pairs(old_tables, new_tables, key=lambda rows: rows[0]):
+        if a is not None and b is not None:
+            _diff_table(section, a, b, changes)
+        else:
+            rows = a if b is None else b
+            changes.append({"op": "removed" if b is None else "added", "kind": "table", "section": section,
+                            "old": a and _row_text(rows[0]), "new": b and _row_text(rows[0])})
+
+
+def diff_outlines(old, new):
+    """The changes from outline ``old`` to outline ``new`` (see read_outline)."""
+    changes = []
+    for a, b in _pairs(_sections(old), _sections(new), key=lambda s: _heading_key(s[0])):
+        if a is None or b is None:
+            changes.append({"op": "removed" if b is None else "added", "kind": "section",
+                            "section": (a or b)[0], "old": a and a[0], "new": b and b[0]})
+            continue
+        if a[0] != b[0]:
+            changes.append({"op": "changed", "kind": "section", "section": b[0], "old": a[0], "new": b[0]})
+        _diff_section(b[0], a, b, changes)
+    return changes
+
+
+def diff_docx(old_path, new_path):
+    """The changes from the .docx at ``old_path`` to the one at ``new_path``."""
+    return diff_outlines(read_outline(old_path), read_outline(new_path))
+
+
+# ============================================================
+# CORRECTIONS TABLE
+# ============================================================
+def _is_correction(change):
+    """Whether ``change`` corrects something: a version cell or a reworded paragraph."""
+    if change["kind"] == "cell":
+        return change["version"]
+    return change["kind"] == "paragraph" and change["op"] == "changed"
+
+
+def _issue(change):
+    section = _NUMBERING.sub("", change["section"]) or UNTITLED
+    if change["kind"] == "cell":
+        return f"{section} - {change['row']}: {change['column']}"
+    return f"{section} (paragraph)"
+
+
+def _one_line(text):
+    """``text`` with its lines joined by spaces, for a table cell."""
+    return " ".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def correction_rows(changes, exclude=None):
+    """Rows of a corrections table (#, issue, old value, correction) for ``changes``.
+
+    Only corrections are kept (see _is_correction), and none from the
+    section headed ``exclude``, matched ignoring its number.
+    """
+    skip = _heading_key(exclude) if exclude else None
+    rows = []
+    for change in changes:
+        if not _is_correction(change) or (skip is not None and _heading_key(change["section"]) == skip):
+            continue
+        old = _one_line(change["old"])
+        rows.append([str(len(rows) + 1), _issue(change), old or NOT_MENTIONED,
+                     f"CORRECTED: {_one_line(change['new'])}"])
+    return rows
+
+
+def _diff_paths(block):
+    return [os.path.join(ROOT_DIR, block["diff"][side]) for side in ("old", "new")]
+
+
+def expand_diffs(section):
+    """Return ``section`` with diff-sourced table rows filled in."""
+    blocks = section["blocks"]
+    if not any("diff" in block for block in blocks):
+        return section
+    expanded = []
+    for block in blocks:
+        if "diff" not in block:
+            expanded.append(block)
+            continue
+        paths = _diff_paths(block)
+        table = {key: value for key, value in block.items() if key != "diff"}
+        if all(os.path.isfile(path) for path in paths):
+            table["rows"] = correction_rows(diff_docx(*paths), section["title"])
+            table.pop("styles", None)
+        expanded.append(table)
+    return {**section, "blocks": expanded}
+
+
+def diff_sources(spec):
+    """The .docx files every diff table of ``spec`` reads, of those that exist."""
+    return [
+        path
+        for section in spec["sections"]
+        for block in section["blocks"]
+        if "diff" in block
+        for path in _diff_paths(block)
+        if os.path.isfile(path)
+    ]
@@ -0,0 +1,303 @@
+"""
+HTML and Markdown output for the HOS-13 documents.
+
+The compiled RenderPlan is the document model: per section, the ops the
+.docx helpers stand for (add_heading, add_step, add_note, add_code_block,
+add_styled_table...) with their arguments already resolved. The docx
+backend executes those ops against python-docx; the backends here walk the
+same ops and emit HTML or Markdown, so the spec is loaded, ingested and
+compiled once whatever the output format. ``write_plan`` dispatches a plan
+to any backend, and ``python -m docgen build --format`` fans the formats out
+to the build's process pool.
+
+Charts are copied next to the output into ``<stem>_files/``.
+"""
+
+import html
+import os
+import re
+import shutil
+
+from docgen.render import (
+    _op_bullets,
+    _op_chart,
+    _op_code,
+    _op_heading,
+    _op_note,
+    _op_page_break,
+    _op_paragraph,
+    _op_runs,
+    _op_spacer,
+    _op_step,
+    _op_table,
+)
+from docgen.reproducible import save_docx
+from docgen.styles import CHARACTER_STYLES, HEADER_FILL
+
+FORMATS = ("docx", "html", "md")
+EXTENSIONS = {"docx": ".docx", "html": ".html", "md": ".md"}
+
+# "1." or "1)" opening a line would start an ordered list in Markdown.
+_MD_ORDINAL = re.compile(r"^(\s*\d{1,9})([.)])(?=\s|$)", re.MULTILINE)
+
+_ALIGN_CSS = {"LEFT": "left", "CENTER": "center", "RIGHT": "right", "JUSTIFY": "justify"}
+
+_CSS = f"""
+body {{ font-family: Calibri, Arial, sans-serif; font-size: 11pt; max-width: 60em; margin: 2em auto; }}
+h1.title {{ font-size: 24pt; }}
+table {{ border-collapse: collapse; margin: 0 auto 1em; font-size: 9pt; }}
+th, td {{ border: 1px solid #000; padding: 2pt 6pt; vertical-align: top; text-align: left; }}
+th {{ background: #{HEADER_FILL}; color: #fff; }}
+pre {{ font-family: Consolas, monospace; font-size: 9pt; color: #1E1E1E; margin-left: 0.5cm; }}
+.step-label {{ color: #2C3E50; }}
+.note-label {{ color: #C47800; }}
+hr.page-break {{ border: 0; border-top: 1px dashed #bbb; margin: 2em 0; }}
+img {{ max-width: 100%; }}
+""" + "".join(
+    f".{style_id} {{ font-weight: bold; color: #{color}; }}\n" for style_id, color in CHARACTER_STYLES.values()
+)
+
+
+def output_path(plan, output_dir, fmt):
+    stem = os.path.splitext(plan.filename)[0]
+    return os.path.join(output_dir, stem + EXTENSIONS[fmt])
+
+
+def _copy_chart(chart, key, filepath):
+    """Copy a chart PNG next to ``filepath``; returns its relative path or None."""
+    from docgen.charts import ensure_chart
+    source = ensure_chart(chart, key)
+    if source is None:
+        return None
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    relative = f"{stem}_files/{key[:16]}.png"
+    target = os.path.join(os.path.dirname(filepath), relative)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.copyfile(source, target)
+    return relative
+
+
+# ============================================================
+# HTML
+# ============================================================
+def _html_text(text):
+    return html.escape(text).replace("\n", "<br>")
+
+
+def _html_run(text, bold, size, color, font_name, char_style):
+    style = []
+    if size is not None:
+        style.append(f"font-size: {size.pt:g}pt")
+    if color is not None:
+        style.append(f"color: #{color}")
+    if font_name is not None:
+        style.append(f"font-family: {font_name}")
+    out = _html_text(text)
+    if bold:
+        out = f"<strong>{out}</strong>"
+    if char_style is not None:
+        out = f'<span class="{CHARACTER_STYLES[char_style][0]}">{out}</span>'
+    if style:
+        out = f'<span style="{"; ".join(style)}">{out}</span>'
+    return out
+
+
+def _html_cell(tag, text, style):
+    text = _html_text(text)
+    if style:
+        text = f'<span class="{CHARACTER_STYLES[style][0]}">{text}</span>'
+    return f"<{tag}>{text}</{tag}>"
+
+
+def _html_cells(tag, cells, cols, styles=()):
+    cells = list(cells) + [""] * (cols - len(cells))
+    styles = list(styles) + [None] * (cols - len(styles))
+    return "<tr>" + "".join(_html_cell(tag, c, style) for c, style in zip(cells, styles)) + "</tr>"
+
+
+class HtmlWriter:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.parts = []
+
+    def spacer(self, count):
+        pass
+
+    def page_break(self):
+        self.parts.append('<hr class="page-break">')
+
+    def heading(self, text, level):
+        if level == 0:
+            self.parts.append(f'<h1 class="title">{_html_text(text)}</h1>')
+        else:
+            tag = f"h{min(level + 1, 6)}"
+            self.parts.append(f"<{tag}>{_html_text(text)}</{tag}>")
+
+    def paragraph(self, text, style):
+        self.parts.append(f"<p>{_html_text(text)}</p>")
+
+    def runs(self, alignment, runs):
+        attr = f' style="text-align: {_ALIGN_CSS[alignment.name]}"' if alignment is not None else ""
+        self.parts.append(f"<p{attr}>" + "".join(_html_run(*run) for run in runs) + "</p>")
+
+    def bullets(self, items, style):
+        cls = ' class="nested"' if style.endswith(" 2") else ""
+        items = "".join(f"<li>{_html_text(item)}</li>" for item in items)
+        self.parts.append(f"<ul{cls}>{items}</ul>")
+
+    def table(self, header, rows, cell_styles=None):
+        cols = len(header)
+        cell_styles = cell_styles or [()] * len(rows)
+        body = "".join(_html_cells("td", row, cols, styles) for row, styles in zip(rows, cell_styles))
+        self.parts.append(f"<table><thead>{_html_cells('th', header, cols)}</thead><tbody>{body}</tbody></table>")
+
+    def code(self, code):
+        self.parts.append(f"<pre><code>{html.escape(code)}</code></pre>")
+
+    def step(self, number, text):
+        self.parts.append(f'<p><strong class="step-label">Step {number}: </strong>{_html_text(text)}</p>')
+
+    def note(self, text):
+        self.parts.append(f'<p><strong class="note-label">NOTE: </strong>{_html_text(text)}</p>')
+
+    def chart(self, chart, key, width):
+        src = _copy_chart(chart, key, self.filepath)
+        if src is not None:
+            alt = html.escape(chart.get("title", ""))
+            width = round(width.inches * 96)
+            self.parts.append(f'<p style="text-align: center"><img src="{src}" alt="{alt}" width="{width}"></p>')
+
+    def finish(self, plan):
+        head = (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{html.escape(plan.title)}</title>\n<style>{_CSS}</style>\n</head>\n<body>\n"
+        )
+        return head + "\n".join(self.parts) + "\n</body>\n</html>\n"
+
+
+# ============================================================
+# MARKDOWN
+# ============================================================
+def _md_escape(text):
+    for char in "\\`*_[]<>|":
+        text = text.replace(char, "\\" + char)
+    return text
+
+
+def _md_block(text):
+    """``text`` escaped for the start of a block: a leading ordinal stays text."""
+    return _MD_ORDINAL.sub(r"\1\\\2", _md_escape(text))
+
+
+def _md_cell(text, style=None):
+    text = _md_escape(text).replace("\n", "<br>")
+    if style and text.strip():
+        text = f"**{text.strip()}**"
+    return text
+
+
+def _md_row(cells, cols, styles=()):
+    cells = list(cells) + [""] * (cols - len(cells))
+    styles = list(styles) + [None] * (cols - len(styles))
+    return "| " + " | ".join(_md_cell(c, style) for c, style in zip(cells, styles)) + " |"
+
+
+class MarkdownWriter:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.parts = []
+
+    def spacer(self, count):
+        pass
+
+    def page_break(self):
+        self.parts.append("---")
+
+    def heading(self, text, level):
+        self.parts.append("#" * (level + 1) + " " + _md_escape(text))
+
+    def paragraph(self, text, style):
+        self.parts.append(_md_block(text).replace("\n", "  \n"))
+
+    def runs(self, alignment, runs):
+        out = []
+        for text, bold, _size, _color, _font, char_style in runs:
+            text = _md_escape(text)
+            if (bold or char_style) and text.strip():
+                core = text.strip()
+                lead = text[:len(text) - len(text.lstrip())]
+                trail = text[len(text.rstrip()):]
+                text = f"{lead}**{core}**{trail}"
+            out.append(text)
+        text = "".join(out).strip("\n")
+        self.parts.append(_MD_ORDINAL.sub(r"\1\\\2", text).replace("\n", "  \n"))
+
+    def bullets(self, items, style):
+        indent = "  " if style.endswith(" 2") else ""
+        self.parts.append("\n".join(f"{indent}- {_md_block(item)}" for item in items))
+
+    def table(self, header, rows, cell_styles=None):
+        cols = len(header)
+        cell_styles = cell_styles or [()] * len(rows)
+        lines = [_md_row(header, cols), "|" + " --- |" * cols]
+        lines.extend(_md_row(row, cols, styles) for row, styles in zip(rows, cell_styles))
+        self.parts.append("\n".join(lines))
+
+    def code(self, code):
+        fence = "````" if "```" in code else "```"
+        self.parts.append(f"{fence}\n{code}\n{fence}")
+
+    def step(self, number, text):
+        self.parts.append(f"**Step {number}:** {_md_escape(text)}")
+
+    def note(self, text):
+        self.parts.append(f"> **NOTE:** {_md_escape(text)}")
+
+    def chart(self, chart, key, width):
+        src = _copy_chart(chart, key, self.filepath)
+        if src is not None:
+            self.parts.append(f"![{_md_escape(chart.get('title', ''))}]({src})")
+
+    def finish(self, plan):
+        return "\n\n".join(self.parts) + "\n"
+
+
+WRITERS = {"html": HtmlWriter, "md": MarkdownWriter}
+
+# Plan op -> writer method name.
+_METHODS = {
+    _op_spacer: "spacer",
+    _op_page_break: "page_break",
+    _op_heading: "heading",
+    _op_paragraph: "paragraph",
+    _op_runs: "runs",
+    _op_bullets: "bullets",
+    _op_table: "table",
+    _op_code: "code",
+    _op_step: "step",
+    _op_note: "note",
+    _op_chart: "chart",
+}
+
+
+def export_plan(plan, fmt, filepath):
+    """Write ``plan`` as HTML or Markdown to ``filepath``."""
+    writer = WRITERS[fmt](filepath)
+    for _section_id, _title, _key, ops in plan.sections:
+        for op, args in ops:
+            getattr(writer, _METHODS[op])(*args)
+    with open(filepath, "w", encoding="utf-8", newline="\n") as f:
+        f.write(writer.finish(plan))
+    return filepath
+
+
+def write_plan(plan, fmt, output_dir, cache=None, stream=False):
+    """Write ``plan`` in format ``fmt`` into ``output_dir``; returns the file path."""
+    filepath = output_path(plan, output_dir, fmt)
+    if fmt != "docx":
+        return export_plan(plan, fmt, filepath)
+    if stream:
+        from docgen.stream import stream_to_file
+        return stream_to_file(plan, filepath, cache)
+    save_docx(plan.render(cache), filepath)
+    return filepath
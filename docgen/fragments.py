@@ -0,0 +1,208 @@
+"""
+Section-level cache of rendered OOXML fragments.
+
+Each spec section renders to a run of ``w:p``/``w:tbl`` elements in the
+document body. The cache stores that run as serialized XML under a hash of
+the section's content and the renderer's code version, and later renders
+splice the cached elements straight into the body instead of replaying the
+section's python-docx calls. Identical sections shared between documents
+(e.g. a title page or footer) are rendered once and cloned.
+
+Entries live in an in-memory LRU and, optionally, in a directory on disk so
+that later builds can reuse them; both are capped at ``max_bytes``.
+"""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from lxml import etree
+
+from docgen.manifest import code_version, template_version
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_SECT_PR = f"{{{_W_NS}}}sectPr"
+_R_PREFIX = f"{{{_R_NS}}}"
+
+
+def section_key(section):
+    """Content hash of a spec section, including the renderer version."""
+    h = hashlib.sha256()
+    h.update(json.dumps(section, sort_keys=True, ensure_ascii=False).encode())
+    h.update(code_version().encode())
+    h.update(template_version().encode())
+    return h.hexdigest()
+
+
+def content_end(body):
+    """Index just past the last content element of a ``w:body``."""
+    n = len(body)
+    if n and body[n - 1].tag == _SECT_PR:
+        return n - 1
+    return n
+
+
+def adopt(parent, element, index=None):
+    """Move ``element`` from another lxml document into ``parent``.
+
+    Inserts at ``index``, or appends when it is None. lxml's cross-document
+    move is quadratic in the size of the moved subtree, so elements with many
+    children (tables, long fragments) are moved shell first and their
+    children one at a time.
+    """
+    children = list(element)
+    split = len(children) > 8
+    if split:
+        for child in children:
+            element.remove(child)
+    if index is None:
+        parent.append(element)
+    else:
+        parent.insert(index, element)
+    if split:
+        for child in children:
+            adopt(element, child)
+
+
+def _uses_relationships(elements):
+    """True if any element references a part relationship (image, link...)."""
+    for element in elements:
+        for node in element.iter():
+            for attr in node.attrib:
+                if attr.startswith(_R_PREFIX):
+                    return True
+    return False
+
+
+def capture_fragment(body, start):
+    """Serialize the body elements from ``start`` up to sectPr.
+
+    Returns None when the run cannot be reused in another document because it
+    depends on the source document's relationships.
+    """
+    elements = body[start:content_end(body)]
+    if not elements or _uses_relationships(elements):
+        return None
+    wrapper = etree.Element(body.tag, nsmap=body.nsmap)
+    wrapper.extend(copy.deepcopy(e) for e in elements)
+    return etree.tostring(wrapper, encoding="UTF-8")
+
+
+def fragment_content(fragment):
+    """The serialized elements of a fragment, without its wrapper element."""
+    start = fragment.index(b">", fragment.index(b"<w:body")) + 1
+    if fragment[start - 2:start] == b"/>":
+        return b""
+    return fragment[start:fragment.rindex(b"</w:body>")]
+
+
+def wrap_fragment(body, content):
+    """Build a fragment from serialized elements, as ``capture_fragment`` would."""
+    empty = etree.tostring(etree.Element(body.tag, nsmap=body.nsmap), encoding="UTF-8")
+    return empty[:-2] + b">" + content + b"</w:body>"
+
+
+def splice_fragment(body, fragment):
+    """Insert the elements of a captured fragment before the body's sectPr."""
+    from docx.oxml.parser import oxml_parser
+    wrapper = etree.fromstring(fragment, oxml_parser)
+    end = content_end(body)
+    for offset, element in enumerate(list(wrapper)):
+        adopt(body, element, end + offset)
+
+
+class FragmentCache:
+    """LRU cache of rendered section fragments, keyed by content hash."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".xml")
+
+    def get(self, key):
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        elif self.directory:
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+                os.utime(self._path(key))
+            except OSError:
+                data = None
+            if data is not None:
+                self._remember(key, data)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        self._remember(key, data)
+        if self.directory:
+            tmp = self._path(key) + f".{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+            self._prune_directory()
+
+    def _remember(self, key, data):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _prune_directory(self):
+        """Delete the least recently used files until the directory fits."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".xml"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+            total += st.st_size
+        entries.sort()
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+_CACHES = {}
+
+
+def get_fragment_cache(directory=None, max_bytes=DEFAULT_MAX_BYTES):
+    """Return the process-wide cache for ``directory`` (None: memory only)."""
+    cache = _CACHES.get(directory)
+    if cache is None:
+        cache = _CACHES[directory] = FragmentCache(max_bytes, directory)
+    cache.max_bytes = max_bytes
+    return cache
@@ -0,0 +1,141 @@
+"""
+Build manifest for incremental document builds.
+
+The manifest lives next to the generated files and records, per document, a
+hash of everything that goes into it: the spec JSON, any POC result dumps,
+risk registers, POC package.json files and diffed reports it reads, the
+source of the rendering modules, the python-docx template and the
+timestamp stamped into the output (``SOURCE_DATE_EPOCH``). A document
+whose hash and output file are unchanged is skipped by ``python -m docgen
+build``. Each entry also keeps the SHA-256 of the output itself; outputs are
+reproducible (see docgen.reproducible), so a rebuild whose hash is unchanged
+produced the same bytes.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+
+from docgen.diff import diff_sources
+from docgen.packages import package_sources
+from docgen.reproducible import build_epoch
+from docgen.results import result_sources
+from docgen.risks import register_sources
+from docgen.specs import load_spec, spec_path
+
+MANIFEST_NAME = ".docgen-manifest.json"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules whose source affects rendered output; editing any of them
+# invalidates every document.
+RENDER_MODULES = (
+    "render.py",
+    "specs.py",
+    "fragments.py",
+    "tables.py",
+    "styles.py",
+    "stream.py",
+    "template.py",
+    "results.py",
+    "charts.py",
+    "export.py",
+    "risks.py",
+    "packages.py",
+    "core.py",
+    "reproducible.py",
+    "diff.py",
+)
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """Hash of the rendering modules' source."""
+    h = hashlib.sha256()
+    for module in RENDER_MODULES:
+        h.update(module.encode())
+        h.update(_file_digest(os.path.join(_PACKAGE_DIR, module)).encode())
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def template_version():
+    """Hash of python-docx's default template, found without importing docx."""
+    spec = importlib.util.find_spec("docx")
+    if spec is None or not spec.submodule_search_locations:
+        return "missing"
+    path = os.path.join(spec.submodule_search_locations[0], "templates", "default.docx")
+    return _file_digest(path) if os.path.exists(path) else "missing"
+
+
+def input_sources(spec):
+    """The data files ``spec`` reads besides itself: result dumps, risk registers, POC manifests, diffed reports."""
+    return result_sources(spec) + register_sources(spec) + package_sources(spec) + diff_sources(spec)
+
+
+def input_hash(name):
+    """Hash of every input of the named document."""
+    h = hashlib.sha256()
+    h.update(_file_digest(spec_path(name)).encode())
+    for path in input_sources(load_spec(name)):
+        h.update(path.encode())
+        h.update(_file_digest(path).encode())
+    h.update(code_version().encode())
+    h.update(template_version().encode())
+    h.update(str(build_epoch()).encode())
+    return h.hexdigest()
+
+
+class Manifest:
+    """Per-document input hashes recorded by the last successful build."""
+
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, output_dir):
+        path = os.path.join(output_dir, MANIFEST_NAME)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f).get("documents", {})
+        except (OSError, ValueError):
+            entries = {}
+        return cls(path, entries)
+
+    @staticmethod
+    def _key(name, fmt):
+        return name if fmt == "docx" else f"{name}.{fmt}"
+
+    def is_current(self, name, digest, fmt="docx"):
+        """True if ``name`` was built as ``fmt`` from ``digest`` and its output still exists."""
+        entry = self.entries.get(self._key(name, fmt))
+        if entry is None or entry.get("hash") != digest:
+            return False
+        return os.path.exists(os.path.join(os.path.dirname(self.path), entry["filename"]))
+
+    def record(self, name, digest, fmt="docx"):
+        """Record ``name`` as built from ``digest``; True if its output bytes did not change."""
+        filename = load_spec(name)["filename"]
+        if fmt != "docx":
+            filename = os.path.splitext(filename)[0] + "." + fmt
+        output = _file_digest(os.path.join(os.path.dirname(self.path), filename))
+        previous = self.entries.get(self._key(name, fmt), {}).get("output")
+        self.entries[self._key(name, fmt)] = {"hash": digest, "filename": filename, "output": output}
+        return output == previous
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"documents": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -0,0 +1,368 @@
+"""
+Size optimizer for .docx files.
+
+``optimize_docx`` rewrites any .docx (ours or one saved by Word) into an
+equivalent, smaller file for the mobile Document Vault:
+
+- adjacent runs with identical properties are merged into one run, after
+  dropping the revision-session ids (``w:rsid*``) and spell-check markers
+  (``w:proofErr``) that otherwise keep Word's runs apart;
+- run properties that only restate the document default (``<w:sz>`` equal
+  to the default size, ``<w:b w:val="0"/>`` where nothing is bold...) are
+  dropped, and so are ``w:rPr``/``w:pPr`` left empty;
+- repeated ``w:shd`` elements in one property block are reduced to the
+  last, which is the one Word applies;
+- runs of empty spacer paragraphs (``doc.add_paragraph("")``) in the body
+  become space before the next paragraph;
+- the zip is rewritten at a chosen deflate level (0 stores the parts),
+  reproducibly (see docgen.reproducible).
+
+Only the story parts (document, headers, footers, foot- and endnotes) are
+rewritten; other parts are copied as they are, recompressed.
+
+A spacer's height is estimated as Word lays out an empty line: its spacing
+before and after plus font size x 1.22 (Calibri's line height) x the line
+spacing. ``spacers=False`` keeps the paragraphs when an exact layout
+matters more than size.
+"""
+
+import io
+import os
+import re
+import zipfile
+from collections import Counter
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from docgen.reproducible import write_package
+
+DEFAULT_LEVEL = 9
+
+_STORY_PART = re.compile(r"word/(document|header\d*|footer\d*|footnotes|endnotes)\.xml$")
+_STYLES_PART = "word/styles.xml"
+
+_LINE_HEIGHT = 1.22  # single line height / font size, Calibri metrics
+
+_W = qn("w:p").split("}")[0] + "}"
+_P, _R, _T, _TAB, _BR = qn("w:p"), qn("w:r"), qn("w:t"), qn("w:tab"), qn("w:br")
+_PPR, _RPR, _PSTYLE, _RSTYLE = qn("w:pPr"), qn("w:rPr"), qn("w:pStyle"), qn("w:rStyle")
+_SHD, _SPACING, _SZ, _VAL = qn("w:shd"), qn("w:spacing"), qn("w:sz"), qn("w:val")
+_TC = qn("w:tc")
+_CHANGES = {qn("w:rPrChange"), qn("w:pPrChange")}
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Run content that survives merging into a neighbour unchanged.
+_MERGEABLE = {_T, _TAB, _BR}
+# Toggle properties: an "off" value is redundant when the default is off.
+_TOGGLES = {qn(f"w:{name}") for name in (
+    "b", "bCs", "i", "iCs", "caps", "smallCaps", "strike", "dstrike",
+    "outline", "shadow", "emboss", "imprint", "vanish",
+)}
+_OFF = {"0", "false", "off"}
+# Paragraph properties that leave an empty paragraph invisible.
+_SPACER_PPR = {qn(f"w:{name}") for name in (
+    "pStyle", "keepNext", "keepLines", "widowControl", "spacing", "ind", "jc", "rPr",
+)}
+# Style paragraph properties that make an empty paragraph visible.
+_VISIBLE_PPR = {qn(f"w:{name}") for name in ("numPr", "pBdr", "shd", "framePr")}
+
+
+class _Styles:
+    """The few style properties the optimizer needs, resolved through basedOn."""
+
+    def __init__(self, root):
+        self.styles = {}
+        self.default_id = None
+        self.pdefault = {}
+        self.rdefault = {}
+        if root is None:
+            return
+        defaults = root.find(qn("w:docDefaults"))
+        if defaults is not None:
+            ppr = defaults.find(f"{qn('w:pPrDefault')}/{_PPR}")
+            rpr = defaults.find(f"{qn('w:rPrDefault')}/{_RPR}")
+            self.pdefault = _props(ppr)
+            self.rdefault = _props(rpr)
+        for style in root.iter(qn("w:style")):
+            if style.get(qn("w:type")) != "paragraph":
+                continue
+            sid = style.get(qn("w:styleId"))
+            self.styles[sid] = style
+            if style.get(qn("w:default")) in ("1", "true", "on"):
+                self.default_id = sid
+
+    def _chain(self, sid):
+        """Styles from the root of ``sid``'s basedOn chain down to ``sid``."""
+        chain = []
+        sid = sid or self.default_id
+        while sid in self.styles and sid not in chain:
+            chain.append(sid)
+            based_on = self.styles[sid].find(qn("w:basedOn"))
+            sid = None if based_on is None else based_on.get(_VAL)
+        return [self.styles[sid] for sid in reversed(chain)]
+
+    def paragraph(self, sid):
+        """Resolved ``w:pPr`` children (tag -> element) of paragraph style ``sid``."""
+        props = dict(self.pdefault)
+        for style in self._chain(sid):
+            _merge(props, style.find(_PPR))
+        return props
+
+    def run(self, sid):
+        """Resolved ``w:rPr`` children of paragraph style ``sid``."""
+        props = dict(self.rdefault)
+        for style in self._chain(sid):
+            _merge(props, style.find(_RPR))
+        return props
+
+
+def _props(parent):
+    return {} if parent is None else {child.tag: child for child in parent}
+
+
+def _merge(props, parent):
+    """Overlay ``parent``'s children on ``props``; w:spacing merges per attribute."""
+    if parent is None:
+        return
+    for child in parent:
+        if child.tag == _SPACING and _SPACING in props:
+            merged = etree.Element(_SPACING, dict(props[_SPACING].attrib))
+            merged.attrib.update(child.attrib)
+            props[_SPACING] = merged
+        else:
+            props[child.tag] = child
+
+
+def _twips(spacing, name, default=0):
+    value = None if spacing is None else spacing.get(qn(f"w:{name}"))
+    return default if value is None else int(value)
+
+
+def _on(element):
+    return element is not None and element.get(_VAL, "1") not in _OFF
+
+
+def _same(a, b):
+    return a.tag == b.tag and dict(a.attrib) == dict(b.attrib) and len(a) == len(b) == 0
+
+
+# ============================================================
+# PASSES
+# ============================================================
+def _strip_revision_marks(root, stats):
+    for element in root.iter():
+        for name in [name for name in element.attrib if name.startswith(_W + "rsid")]:
+            del element.attrib[name]
+            stats["rsid attributes"] += 1
+    for element in list(root.iter(qn("w:proofErr"))):
+        element.getparent().remove(element)
+        stats["proofErr"] += 1
+
+
+def _dedupe_shading(root, stats):
+    for parent in {shd.getparent() for shd in root.iter(_SHD)}:
+        repeated = parent.findall(_SHD)[:-1]
+        for shd in repeated:
+            parent.remove(shd)
+        stats["duplicate shd"] += len(repeated)
+
+
+def _drop_redundant_properties(root, styles, stats):
+    """Drop run properties equal to the paragraph style's; then empty rPr/pPr.
+
+    Runs in tables are left alone: a table style's conditional formatting
+    (bold header row...) may be what their properties override.
+    """
+    resolved = {}
+    for p in root.iter(_P):
+        if next(p.iterancestors(_TC), None) is not None:
+            continue
+        ppr = p.find(_PPR)
+        pstyle = None if ppr is None else ppr.find(_PSTYLE)
+        sid = None if pstyle is None else pstyle.get(_VAL)
+        if sid not in resolved:
+            resolved[sid] = styles.run(sid)
+        defaults = resolved[sid]
+        for rpr in p.iterfind(f"{_R}/{_RPR}"):
+            if rpr.find(_RSTYLE) is not None:
+                continue  # the character style may set what the run resets
+            for prop in list(rpr):
+                default = defaults.get(prop.tag)
+                if default is not None and _same(prop, default):
+                    redundant = True
+                else:
+                    redundant = default is None and prop.tag in _TOGGLES and not _on(prop)
+                if redundant:
+                    rpr.remove(prop)
+                    stats["redundant rPr properties"] += 1
+    for tag in (_RPR, _PPR):
+        for element in list(root.iter(tag)):
+            # An empty rPr/pPr under w:rPrChange records "no formatting" before a revision.
+            if len(element) == 0 and not element.attrib and element.getparent().tag not in _CHANGES:
+                element.getparent().remove(element)
+                stats["empty rPr/pPr"] += 1
+
+
+def _run_key(r):
+    """Serialized properties of a mergeable run, or None."""
+    if r.attrib:
+        return None
+    key = b""
+    for child in r:
+        if child.tag == _RPR and key == b"":
+            key = etree.tostring(child)
+        elif child.tag not in _MERGEABLE or (child.tag == _BR and child.attrib):
+            return None
+    return key
+
+
+def _join_text(r):
+    previous = None
+    for child in list(r):
+        if child.tag == _T and previous is not None and previous.tag == _T:
+            previous.text = (previous.text or "") + (child.text or "")
+            r.remove(child)
+            continue
+        previous = child
+    for t in r.iter(_T):
+        text = t.text or ""
+        if text != text.strip():
+            t.set(_XML_SPACE, "preserve")
+
+
+def _merge_runs(root, stats):
+    for r in list(root.iter(_R)):
+        if r.getparent() is None:
+            continue  # merged into its predecessor
+        key = _run_key(r)
+        if key is None:
+            continue
+        merged = False
+        following = r.getnext()
+        while following is not None and following.tag == _R and _run_key(following) == key:
+            for child in list(following):
+                if child.tag != _RPR:
+                    r.append(child)
+            following.getparent().remove(following)
+            stats["runs merged"] += 1
+            merged = True
+            following = r.getnext()
+        if merged:
+            _join_text(r)
+
+
+def _is_spacer(p, styles):
+    for child in p:
+        if child.tag == _PPR:
+            if any(prop.tag not in _SPACER_PPR for prop in child):
+                return False
+        elif child.tag != _R or any(grandchild.tag != _RPR for grandchild in child):
+            return False
+    return not _VISIBLE_PPR & set(_layout(p, styles)[0])
+
+
+def _layout(p, styles):
+    """(resolved pPr children, style id) of paragraph ``p``."""
+    ppr = p.find(_PPR)
+    pstyle = None if ppr is None else ppr.find(_PSTYLE)
+    sid = None if pstyle is None else pstyle.get(_VAL)
+    props = styles.paragraph(sid)
+    _merge(props, ppr)
+    return props, sid
+
+
+def _spacer_height(p, styles):
+    """Estimated height of an empty paragraph, in twips."""
+    props, sid = _layout(p, styles)
+    spacing = props.get(_SPACING)
+    size = p.find(f"{_PPR}/{_RPR}/{_SZ}")  # the paragraph mark's size
+    if size is None:
+        size = styles.run(sid).get(_SZ)
+    half_points = 20 if size is None else int(size.get(_VAL))
+    line = half_points * 10 * _LINE_HEIGHT
+    rule = None if spacing is None else spacing.get(qn("w:lineRule"))
+    value = _twips(spacing, "line", 240)
+    if rule in (None, "auto"):
+        line *= value / 240
+    elif rule == "exact":
+        line = value
+    else:  # atLeast
+        line = max(line, value)
+    return round(_twips(spacing, "before") + line + _twips(spacing, "after"))
+
+
+def _takes_spacing(p, styles):
+    """Whether space before ``p`` shows as laid out (not suppressed or replaced)."""
+    props, _sid = _layout(p, styles)
+    if _on(props.get(qn("w:contextualSpacing"))) or _on(props.get(qn("w:pageBreakBefore"))):
+        return False
+    spacing = props.get(_SPACING)
+    if spacing is None:
+        return True
+    return (spacing.get(qn("w:beforeLines")) is None
+            and spacing.get(qn("w:beforeAutospacing")) in (None, "0", "false", "off"))
+
+
+def _fold_spacers(body, styles, stats):
+    """Replace runs of empty body paragraphs with space before the next one."""
+    pending = []
+    for element in list(body):
+        if element.tag == _P and _is_spacer(element, styles):
+            pending.append(element)
+            continue
+        if pending and element.tag == _P and _takes_spacing(element, styles):
+            before = _twips(_layout(element, styles)[0].get(_SPACING), "before")
+            before += sum(_spacer_height(p, styles) for p in pending)
+            element.get_or_add_pPr().get_or_add_spacing().set(qn("w:before"), str(before))
+            for p in pending:
+                body.remove(p)
+            stats["spacer paragraphs"] += len(pending)
+        pending = []
+
+
+def optimize_part(data, styles, spacers=True, stats=None):
+    """Optimize one story part's XML bytes; returns the new bytes.
+
+    ``stats`` is a Counter that receives what was removed or merged.
+    """
+    stats = Counter() if stats is None else stats
+    root = parse_xml(data)
+    _strip_revision_marks(root, stats)
+    _dedupe_shading(root, stats)
+    _drop_redundant_properties(root, styles, stats)
+    _merge_runs(root, stats)
+    body = root.find(qn("w:body"))
+    if spacers and body is not None:
+        _fold_spacers(body, styles, stats)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+# ============================================================
+# PACKAGE
+# ============================================================
+def optimize_docx(source, target=None, level=DEFAULT_LEVEL, spacers=True):
+    """Write an optimized copy of ``source`` to ``target`` (default: in place).
+
+    Returns a dict of counts (what was removed or merged) plus ``"bytes
+    before"`` and ``"bytes after"``. The whole output is built in memory
+    first, so ``target`` may be ``source``.
+    """
+    if not 0 <= level <= 9:
+        raise ValueError(f"compression level must be 0-9, got {level}")
+    target = target or source
+    stats = Counter({"bytes before": os.path.getsize(source)})
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(source) as zin:
+        parts = {info.filename: zin.read(info) for info in zin.infolist()}
+    styles = _Styles(parse_xml(parts[_STYLES_PART]) if _STYLES_PART in parts else None)
+    for name, data in parts.items():
+        if _STORY_PART.match(name):
+            parts[name] = optimize_part(data, styles, spacers, stats)
+    out = io.BytesIO()
+    write_package(out, parts, compression, level if level else None)
+    with open(target, "wb") as f:
+        f.write(out.getvalue())
+    stats["bytes after"] = len(out.getvalue())
+    return dict(stats)
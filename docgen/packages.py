@@ -0,0 +1,533 @@
+"""
+Package version matrix of the POC apps.
+
+Every ``POC*/package.json`` (and its ``package-lock.json`` or ``yarn.lock``,
+if present) is parsed into a matrix of package -> POC -> version, where the
+version is the one the lockfile resolved or, without a lockfile, the one
+package.json's range was written for. Parse results are cached per file in
+``.docgen-cache/packages.json``: a file whose mtime and size are unchanged
+is not read at all, and one whose content hash is unchanged is not parsed
+again. Stale files are parsed in a process pool; ``python -m docgen build``
+refreshes the cache up front (see ``prepare_packages``) so build workers
+only read it.
+
+A table block can carry ``"packages": {"library": HEADER, "version": HEADER,
+"poc": HEADER}`` (column header names); each row whose library cell names a
+POC package then gets its POC cell filled from the matrix at compile time,
+and its version cell too when every POC using the package has a lockfile
+that resolved it. A range's floor is not the version that was tested, so
+without a lockfile the hand-written version stays, and so do the cells of
+rows naming libraries no POC uses. ``drift_report`` lists packages pinned
+differently across POCs and table cells that disagree with the POCs: a
+version cell disagrees when it differs from the resolved version or, with
+no lockfile, falls outside the range package.json declares.
+``python -m docgen packages`` prints both.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from docgen.results import ROOT_DIR
+
+POC_PATTERN = "POC*"
+LOCKFILES = ("package-lock.json", "yarn.lock")
+CACHE_PATH = os.path.join(ROOT_DIR, ".docgen-cache", "packages.json")
+
+_POC_ID = re.compile(r"^(POC\d+)")
+_PINNED = re.compile(r"^[\^~=v]*(\d+\.\d+\.\d+[\w.+-]*)$")
+_YARN_VERSION = re.compile(r'^\s+version:?\s+"?(?P<version>[^"\s]+)"?')
+_SEMVER = re.compile(r"^v?(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?(-[\w.-]+)?(?:\+[\w.-]+)?$")
+_COMPARATOR = re.compile(r"^(\^|~>?|[<>]=?|=)?(.*)$")
+_OPERATOR_SPACE = re.compile(r"(\^|~>?|[<>]=?|=)\s+")
+_HYPHEN = re.compile(r"^(\S+)\s+-\s+(\S+)$")
+_CELL_VERSION = re.compile(r"\d+\.\d+\.\d+(?:-[\w.]+)?")
+
+
+def discover(root=ROOT_DIR):
+    """The manifest and lockfile paths of every POC directory, sorted."""
+    paths = []
+    for directory in sorted(glob.glob(os.path.join(root, POC_PATTERN))):
+        manifest = os.path.join(directory, "package.json")
+        if not os.path.isfile(manifest):
+            continue
+        paths.append(manifest)
+        paths.extend(
+            os.path.join(directory, lockfile)
+            for lockfile in LOCKFILES
+            if os.path.isfile(os.path.join(directory, lockfile))
+        )
+    return paths
+
+
+def poc_id(path):
+    """``POC4`` for ``.../POC4-Encryption/package.json``."""
+    directory = os.path.basename(os.path.dirname(path))
+    match = _POC_ID.match(directory)
+    return match[1] if match else directory
+
+
+# ============================================================
+# PARSING
+# ============================================================
+def _parse_package_json(text):
+    data = json.loads(text)
+    return {
+        "dependencies": data.get("dependencies", {}),
+        "devDependencies": data.get("devDependencies", {}),
+    }
+
+
+def _parse_package_lock(text):
+    """Top-level resolved versions from an npm lockfile (v1-v3)."""
+    data = json.loads(text)
+    resolved = {}
+    packages = data.get("packages")
+    if packages is not None:
+        for key, entry in packages.items():
+            # Only direct installs; nested node_modules are transitive copies.
+            if key.startswith("node_modules/") and "/node_modules/" not in key and "version" in entry:
+                resolved[key[len("node_modules/"):]] = entry["version"]
+    else:
+        for name, entry in data.get("dependencies", {}).items():
+            if "version" in entry:
+                resolved[name] = entry["version"]
+    return {"resolved": resolved}
+
+
+def _parse_yarn_lock(text):
+    """Resolved versions per ``name@range`` from a yarn lockfile (classic or berry)."""
+    resolved = {}
+    specs = None
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        if not line[0].isspace():
+            key = line.rstrip()
+            specs = [s.strip().strip('"') for s in key[:-1].split(",")] if key.endswith(":") else None
+            continue
+        match = _YARN_VERSION.match(line)
+        if match and specs:
+            for spec in specs:
+                if "@" in spec[1:]:
+                    resolved[spec.replace("@npm:", "@")] = match["version"]
+            specs = None
+    return {"resolved": resolved}
+
+
+_PARSERS = {
+    "package.json": _parse_package_json,
+    "package-lock.json": _parse_package_lock,
+    "yarn.lock": _parse_yarn_lock,
+}
+
+
+def _parse_file(path):
+    """Parse one manifest or lockfile; returns ``(sha256, parsed)``."""
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    return digest, _PARSERS[os.path.basename(path)](data.decode("utf-8"))
+
+
+# ============================================================
+# CACHE
+# ============================================================
+def _load_cache():
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp = CACHE_PATH + f".{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, sort_keys=True)
+    os.replace(tmp, CACHE_PATH)
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def parse_all(paths, jobs=1):
+    """Parsed content of every path, through the on-disk cache.
+
+    Returns ``({path: parsed}, parsed_count)``. Files missing from the cache
+    or changed on disk are parsed, in a pool of ``jobs`` processes when
+    there is more than one.
+    """
+    cache = _load_cache()
+    results = {}
+    stale = []
+    dirty = False
+    for path in paths:
+        st = os.stat(path)
+        entry = cache.get(path)
+        if entry is not None and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            results[path] = entry["parsed"]
+            continue
+        if entry is not None and entry["sha256"] == _file_hash(path):
+            # Touched but unchanged: keep the parse, remember the new mtime.
+            entry["mtime"] = st.st_mtime_ns
+            entry["size"] = st.st_size
+            results[path] = entry["parsed"]
+            dirty = True
+            continue
+        stale.append((path, st))
+    if stale:
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(stale)))
+        if jobs == 1:
+            parsed = [_parse_file(path) for path, _st in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                parsed = list(pool.map(_parse_file, [path for path, _st in stale]))
+        for (path, st), (digest, content) in zip(stale, parsed):
+            cache[path] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": digest, "parsed": content}
+            results[path] = content
+        dirty = True
+    if dirty:
+        for path in set(cache) - set(paths):
+            del cache[path]
+        _save_cache(cache)
+    return results, len(stale)
+
+
+def prepare_packages(jobs=None):
+    """Refresh the parse cache for every POC; returns how many files were parsed."""
+    return parse_all(discover(), jobs)[1]
+
+
+# ============================================================
+# RANGES
+# ============================================================
+def _parse_semver(text):
+    """``([major, minor, patch] up to the first x part, prerelease)``; raises ValueError."""
+    match = _SEMVER.match(text)
+    if match is None:
+        raise ValueError(text)
+    parts = []
+    for part in match.groups()[:3]:
+        if part is None or not part.isdigit():
+            break
+        parts.append(int(part))
+    return parts, match[4]
+
+
+def _key(parts, prerelease=None):
+    """Sort key of a version; a prerelease sorts before its release, by its identifiers."""
+    identifiers = tuple(
+        (0, int(item), "") if item.isdigit() else (1, 0, item)
+        for item in (prerelease or "-")[1:].split(".")
+        if item
+    )
+    return (*parts, *[0] * (3 - len(parts)), prerelease is None, identifiers)
+
+
+def _bump(parts, i):
+    return _key(parts[:i] + [parts[i] + 1])
+
+
+def _comparators(op, text):
+    """``[(operator, key)]`` that a version must all meet for ``op text``."""
+    parts, prerelease = _parse_semver(text or "*")
+    low = _key(parts, prerelease if len(parts) == 3 else None)
+    if not parts:  # "*": anything, except "<*" and ">*", which nothing meets
+        return [("<", _key([0, 0, 0], "-"))] if op in ("<", ">") else []
+    if op in ("", "="):
+        return [("==", low)] if len(parts) == 3 else [(">=", low), ("<", _bump(parts, len(parts) - 1))]
+    if op == "^":
+        first = next((i for i, part in enumerate(parts) if part), len(parts) - 1)
+        return [(">=", low), ("<", _bump(parts, first))]
+    if op in ("~", "~>"):
+        return [(">=", low), ("<", _bump(parts, 0 if len(parts) == 1 else 1))]
+    if op in (">=", "<"):
+        return [(op, low)]
+    if len(parts) == 3:
+        return [(op, low)]
+    return [(">=", _bump(parts, len(parts) - 1))] if op == ">" else [("<", _bump(parts, len(parts) - 1))]
+
+
+_COMPARE = {
+    "==": lambda a, b: a == b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+}
+
+
+def satisfies(version, declared):
+    """Whether ``version`` is in the npm range ``declared``; None if either can't be read.
+
+    Covers what package.json files hold in practice: ``^``/``~`` ranges,
+    comparators, x-ranges, hyphen ranges and ``||``. Tags, URLs and
+    ``npm:``/``file:`` specs give None. As in npm, a prerelease only
+    matches a range that names a prerelease of the same major.minor.patch,
+    so ``^1.0.0`` does not take ``2.0.0-beta.1`` (or ``1.1.0-beta.1``).
+    """
+    try:
+        parts, prerelease = _parse_semver(version)
+        if len(parts) < 3:
+            return None
+        key = _key(parts, prerelease)
+        for alternative in declared.split("||"):
+            alternative = _OPERATOR_SPACE.sub(r"\1", alternative.strip())
+            hyphen = _HYPHEN.match(alternative)
+            if hyphen:
+                terms = [(">=", hyphen[1]), ("<=", hyphen[2])]
+            else:
+                terms = [tuple(group or "" for group in _COMPARATOR.match(token).groups())
+                         for token in alternative.split()]
+            named = [_parse_semver(text or "*") for _op, text in terms]
+            if prerelease is not None and not any(pre and bound == parts for bound, pre in named):
+                continue
+            comparators = [comparator for term in terms for comparator in _comparators(*term)]
+            if all(_COMPARE[op](key, bound) for op, bound in comparators):
+                return True
+    except ValueError:
+        return None
+    return False
+
+
+# ============================================================
+# MATRIX
+# ============================================================
+def _lookup_lock(lock, name, declared):
+    resolved = lock["resolved"]
+    return resolved.get(name) or resolved.get(f"{name}@{declared}")
+
+
+class PackageMatrix:
+    """Package -> POC -> version, with the POCs and packages in sorted order.
+
+    ``versions[package][poc]`` is ``(declared, resolved)``; ``resolved`` is
+    None when the POC has no lockfile or the lockfile lacks the package.
+    ``dev`` holds the packages only ever used as devDependencies.
+    """
+
+    def __init__(self, pocs, versions, dev):
+        self.pocs = pocs
+        self.packages = sorted(versions)
+        self.index = {name.lower(): name for name in self.packages}
+        self.versions = versions
+        self.dev = dev
+
+    @classmethod
+    def build(cls, parsed):
+        by_poc = {}
+        for path, content in parsed.items():
+            by_poc.setdefault(poc_id(path), {})[os.path.basename(path)] = content
+        versions = {}
+        dev = set()
+        seen_runtime = set()
+        for poc in sorted(by_poc, key=_poc_sort_key):
+            files = by_poc[poc]
+            manifest = files.get("package.json")
+            if manifest is None:
+                continue
+            lock = next((files[name] for name in LOCKFILES if name in files), None)
+            for field in ("dependencies", "devDependencies"):
+                for name, declared in manifest[field].items():
+                    resolved = _lookup_lock(lock, name, declared) if lock else None
+                    versions.setdefault(name, {})[poc] = (declared, resolved)
+                    (dev if field == "devDependencies" else seen_runtime).add(name)
+        pocs = sorted({poc for per_poc in versions.values() for poc in per_poc}, key=_poc_sort_key)
+        return cls(pocs, versions, dev - seen_runtime)
+
+    def find(self, library):
+        """The package named ``library`` (case-insensitive), or None."""
+        return self.index.get(library.strip().lower())
+
+    def version(self, package, poc):
+        """The version to report: resolved if known, else the one the range was written for.
+
+        ``npm install``/``expo install`` write ``^``/``~`` plus the version
+        they installed, so without a lockfile ``~15.0.8`` reports 15.0.8.
+        Other ranges are reported as written.
+        """
+        declared, resolved = self.versions[package][poc]
+        if resolved:
+            return resolved
+        match = _PINNED.match(declared)
+        return match[1] if match else declared
+
+    def drifting(self):
+        """``{package: {poc: version}}`` for packages whose version differs between POCs."""
+        drift = {}
+        for package in self.packages:
+            per_poc = {poc: self.version(package, poc) for poc in self.versions[package]}
+            if len(set(per_poc.values())) > 1:
+                drift[package] = per_poc
+        return drift
+
+    def as_dict(self):
+        return {
+            "pocs": self.pocs,
+            "packages": {
+                package: {poc: self.version(package, poc) for poc in self.versions[package]}
+                for package in self.packages
+            },
+            "dev": sorted(self.dev),
+        }
+
+
+def _poc_sort_key(poc):
+    digits = poc[3:]
+    return (0, int(digits), poc) if digits.isdigit() else (1, 0, poc)
+
+
+_MATRIX = {}
+
+
+def load_matrix(jobs=1):
+    """The package matrix of every POC, rebuilt only when a file changed."""
+    paths = discover()
+    signature = tuple((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in paths)
+    cached = _MATRIX.get("matrix")
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    parsed, _count = parse_all(paths, jobs)
+    matrix = PackageMatrix.build(parsed)
+    _MATRIX["matrix"] = (signature, matrix)
+    return matrix
+
+
+# ============================================================
+# TABLES
+# ============================================================
+def poc_label(pocs):
+    """``POC4/6`` for ``["POC4", "POC6"]``, as the stack tables write it."""
+    if not pocs:
+        return "--"
+    return pocs[0] + "".join("/" + poc[3:] for poc in pocs[1:])
+
+
+def _per_poc(values):
+    """One cell text for ``{poc: value}``: the value, or each value with its POC."""
+    if len(set(values.values())) == 1:
+        return next(iter(values.values()))
+    return " / ".join(f"{value} ({poc})" for poc, value in values.items())
+
+
+def package_cells(matrix, package):
+    """``(version, poc)`` cell texts for one package.
+
+    The version is None unless a lockfile resolved the package in every
+    POC that uses it.
+    """
+    pocs = [poc for poc in matrix.pocs if poc in matrix.versions[package]]
+    resolved = {poc: matrix.versions[package][poc][1] for poc in pocs}
+    version = _per_poc(resolved) if all(resolved.values()) else None
+    return version, poc_label(pocs)
+
+
+def _out_of_range(matrix, package, cell):
+    """The declared ranges ``cell`` falls outside of, as cell text, or None."""
+    declared = {poc: matrix.versions[package][poc][0] for poc in matrix.pocs if poc in matrix.versions[package]}
+    versions = _CELL_VERSION.findall(cell)
+    for poc, spec in declared.items():
+        fits = [satisfies(version, spec) for version in versions]
+        if None not in fits and not any(fits):
+            return _per_poc(declared)
+    return None
+
+
+def _table_updates(block, matrix):
+    """Yield ``(row index, library, column, old, new)`` for the cells the matrix changes."""
+    columns = block["packages"]
+    header = block["header"]
+    library_col = header.index(columns["library"])
+    targets = [(header.index(columns[key]), i) for i, key in enumerate(("version", "poc")) if key in columns]
+    for index, row in enumerate(block["rows"]):
+        package = matrix.find(row[library_col]) if len(row) > library_col else None
+        if package is None:
+            continue
+        cells = package_cells(matrix, package)
+        for col, which in targets:
+            old = row[col] if len(row) > col else ""
+            if cells[which] is not None and old != cells[which]:
+                yield index, package, col, old, cells[which]
+
+
+def _range_drift(block, matrix):
+    """Yield ``(row index, library, column, old, ranges)`` for unlocked version cells outside their range."""
+    columns = block["packages"]
+    if "version" not in columns:
+        return
+    header = block["header"]
+    library_col, col = header.index(columns["library"]), header.index(columns["version"])
+    for index, row in enumerate(block["rows"]):
+        package = matrix.find(row[library_col]) if len(row) > library_col else None
+        if package is None or package_cells(matrix, package)[0] is not None:
+            continue
+        old = row[col] if len(row) > col else ""
+        ranges = _out_of_range(matrix, package, old)
+        if ranges is not None:
+            yield index, package, col, old, ranges
+
+
+def expand_packages(section, matrix=None):
+    """Return ``section`` with its package-sourced table cells filled in."""
+    blocks = section["blocks"]
+    if not any("packages" in block for block in blocks):
+        return section
+    matrix = matrix or load_matrix()
+    expanded = []
+    for block in blocks:
+        if "packages" not in block:
+            expanded.append(block)
+            continue
+        cols = len(block["header"])
+        rows = [list(row) for row in block["rows"]]
+        styles = [list(row) for row in block.get("styles", ())]
+        for index, _package, col, _old, new in _table_updates(block, matrix):
+            rows[index].extend([""] * (cols - len(rows[index])))
+            rows[index][col] = new
+            if index < len(styles) and col < len(styles[index]):
+                styles[index][col] = None  # written by hand for the old text
+        table = {key: value for key, value in block.items() if key != "packages"} | {"rows": rows}
+        if "styles" in block:
+            table["styles"] = styles
+        expanded.append(table)
+    return {**section, "blocks": expanded}
+
+
+def package_sources(spec):
+    """The POC manifests and lockfiles ``spec`` reads, if any block uses them."""
+    uses = any("packages" in block for section in spec["sections"] for block in section["blocks"])
+    return discover() if uses else []
+
+
+def drift_report(specs, matrix=None):
+    """Version drift between POCs and between the specs' tables and the POCs.
+
+    Returns ``{"pocs": {package: {poc: version}}, "tables": [{"spec",
+    "section", "package", "column", "table", "pocs"}]}``; ``pocs`` is the
+    resolved version or, for a version cell outside its range, the range.
+    """
+    matrix = matrix or load_matrix()
+    tables = []
+    for spec in specs:
+        for section in spec["sections"]:
+            for block in section["blocks"]:
+                if "packages" not in block:
+                    continue
+                cells = list(_table_updates(block, matrix)) + list(_range_drift(block, matrix))
+                for _index, package, col, old, new in sorted(cells, key=lambda cell: cell[:3]):
+                    tables.append({
+                        "spec": spec["name"],
+                        "section": section["title"],
+                        "package": package,
+                        "column": block["header"][col],
+                        "table": old,
+                        "pocs": new,
+                    })
+    return {"pocs": matrix.drifting(), "tables": tables}
@@ -0,0 +1,264 @@
+"""
+PDF export of the generated .docx files through LibreOffice.
+
+Starting ``soffice --convert-to pdf`` per file pays LibreOffice's start-up
+(seconds, more on a fresh profile) for every document. ``ConverterPool``
+instead keeps ``size`` headless soffice processes running, each with its own
+user profile and UNO pipe, and hands conversions to whichever is free, so
+documents convert in parallel on warm processes. Within a build a pool is
+started only if something actually needs converting.
+
+A PDF is skipped while the content hash of its .docx (the zip parts, not the
+zip timestamps) matches the one recorded in the build manifest.
+
+LibreOffice is optional and only needed for ``--format pdf``. The UNO
+bindings (``import uno``) come with LibreOffice's Python or the python3-uno
+package; without them each conversion falls back to a one-shot
+``soffice --convert-to`` call, still run in parallel on per-slot profiles
+that stay initialised between files. ``DOCGEN_SOFFICE`` overrides the soffice
+executable.
+"""
+
+import hashlib
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+START_TIMEOUT = 60.0  # seconds for a converter to accept UNO connections
+CONVERT_TIMEOUT = 300.0  # seconds per one-shot conversion
+
+_SOFFICE_NAMES = ("soffice", "libreoffice")
+
+
+class ConverterError(RuntimeError):
+    pass
+
+
+def find_soffice():
+    """Path of the soffice executable, or None."""
+    override = os.environ.get("DOCGEN_SOFFICE")
+    if override:
+        return override
+    for name in _SOFFICE_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def docx_digest(path):
+    """Hash of a .docx's parts: stable across saves of the same content."""
+    h = hashlib.sha256()
+    with zipfile.ZipFile(path) as z:
+        for info in sorted(z.infolist(), key=lambda i: i.filename):
+            h.update(info.filename.encode())
+            with z.open(info) as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    h.update(chunk)
+    return h.hexdigest()
+
+
+def _profile_url(path):
+    return "file://" + os.path.abspath(path).replace(os.sep, "/")
+
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+class _UnoConverter:
+    """One long-lived headless soffice process driven over a UNO pipe."""
+
+    def __init__(self, soffice, slot):
+        self.soffice = soffice
+        self.profile = tempfile.mkdtemp(prefix=f"docgen-soffice-{slot}-")
+        self.pipe = f"docgen_{os.getpid()}_{slot}"
+        self.process = None
+        self.desktop = None
+
+    def start(self):
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.process = subprocess.Popen(
+            [
+                self.soffice,
+                f"-env:UserInstallation={_profile_url(self.profile)}",
+                "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+                f"--accept=pipe,name={self.pipe};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + START_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:pipe,name={self.pipe};urp;StarOffice.ComponentContext")
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise ConverterError("soffice did not accept UNO connections") from None
+                time.sleep(0.1)
+        self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def convert(self, source, target):
+        import uno
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(source)), "_blank", 0, (_property("Hidden", True),)
+        )
+        if doc is None:
+            raise ConverterError(f"soffice could not open {source}")
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(target)),
+                           (_property("FilterName", "writer_pdf_Export"),))
+        finally:
+            doc.close(True)
+
+    def alive(self):
+        return self.desktop is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    def close(self):
+        self.stop()
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+
+class _OneShotConverter:
+    """``soffice --convert-to pdf`` per file, on a profile kept for the slot."""
+
+    def __init__(self, soffice, slot):
+        self.soffice = soffice
+        self.profile = tempfile.mkdtemp(prefix=f"docgen-soffice-{slot}-")
+
+    def start(self):
+        pass
+
+    def convert(self, source, target):
+        outdir = tempfile.mkdtemp(dir=self.profile)
+        try:
+            proc = subprocess.run(
+                [
+                    self.soffice,
+                    f"-env:UserInstallation={_profile_url(os.path.join(self.profile, 'user'))}",
+                    "--headless", "--norestore", "--convert-to", "pdf", "--outdir", outdir, source,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=CONVERT_TIMEOUT,
+            )
+            produced = os.path.join(outdir, os.path.splitext(os.path.basename(source))[0] + ".pdf")
+            if proc.returncode != 0 or not os.path.exists(produced):
+                raise ConverterError(proc.stderr.strip() or f"soffice exited with {proc.returncode}")
+            shutil.move(produced, target)
+        finally:
+            shutil.rmtree(outdir, ignore_errors=True)
+
+    def alive(self):
+        return True
+
+    def stop(self):
+        pass
+
+    def close(self):
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+
+def _converter_class():
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        return _OneShotConverter
+    return _UnoConverter
+
+
+class ConverterPool:
+    """``size`` warm converters; use as a context manager.
+
+    Converters start lazily, the first time a conversion needs one, and one
+    whose process died is restarted for the next file.
+    """
+
+    def __init__(self, size=None, soffice=None):
+        self.soffice = soffice or find_soffice()
+        if self.soffice is None:
+            raise ConverterError("LibreOffice (soffice) not found; set DOCGEN_SOFFICE or install LibreOffice")
+        self.size = max(1, size or os.cpu_count() or 1)
+        self._cls = _converter_class()
+        self._idle = queue.Queue()
+        for slot in range(self.size):
+            self._idle.put(self._cls(self.soffice, slot))
+        self._converters = list(self._idle.queue)
+
+    @property
+    def warm(self):
+        """False when conversions fall back to one-shot soffice calls."""
+        return self._cls is _UnoConverter
+
+    def convert(self, source, target):
+        """Convert ``source`` (.docx) to ``target`` (.pdf); returns the seconds taken."""
+        converter = self._idle.get()
+        try:
+            start = time.perf_counter()
+            if not converter.alive():
+                converter.stop()
+                converter.start()
+            tmp = target + ".tmp.pdf"
+            try:
+                converter.convert(source, tmp)
+            except Exception:
+                # The process may be wedged; restart it for the next file.
+                converter.stop()
+                raise
+            os.replace(tmp, target)
+            return time.perf_counter() - start
+        finally:
+            self._idle.put(converter)
+
+    def convert_all(self, pairs):
+        """Convert ``(source, target)`` pairs in parallel, yielding ``(source, target, seconds, error)``."""
+        with ThreadPoolExecutor(max_workers=self.size) as threads:
+            futures = {threads.submit(self.convert, source, target): (source, target) for source, target in pairs}
+            for future in as_completed(futures):
+                source, target = futures[future]
+                try:
+                    seconds = future.result()
+                except Exception as exc:
+                    yield source, target, 0.0, exc
+                else:
+                    yield source, target, seconds, None
+
+    def close(self):
+        for converter in self._converters:
+            converter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,257 @@
+"""
+Per-section build profiling.
+
+``profile_to_file`` renders a plan like ``RenderPlan.execute`` but records,
+for every section, its wall time and tracemalloc figures: net bytes and
+blocks still allocated afterwards, and the peak above the section's start
+(libxml2's own allocations are not traced). For every helper it counts the
+calls, time and OOXML elements added to the body. Tables count as
+``add_styled_table``, with their header row and header cells (shaded by the
+table style) and the runs in a severity or status character style broken
+out as ``add_styled_table (header row)``, ``add_styled_table (header
+cells)`` and ``character-styled run``: for those "calls" counts the rows,
+cells and runs, and their time stays with the table or paragraph that
+holds them. The report is written as JSON next to a collapsed-stack file
+(``document;section;helper microseconds`` per line) that flamegraph.pl or
+speedscope can read.
+
+    python -m docgen build --profile [--only NAME]
+
+Profiling slows rendering down several times; the figures are for comparing
+sections and helpers with each other, not for absolute timings.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+
+from docx.oxml.ns import qn
+
+from docgen.fragments import capture_fragment, content_end, splice_fragment
+from docgen.render import (
+    _op_bullets,
+    _op_code,
+    _op_heading,
+    _op_note,
+    _op_page_break,
+    _op_paragraph,
+    _op_runs,
+    _op_spacer,
+    _op_step,
+    _op_table,
+)
+from docgen.reproducible import save_docx
+from docgen.styles import CHARACTER_STYLES, character_style_id
+
+PROFILE_DIRNAME = ".docgen-profile"
+
+# The helper each plan op stands for.
+HELPERS = {
+    _op_spacer: "add_paragraph (spacer)",
+    _op_page_break: "add_page_break",
+    _op_heading: "add_heading",
+    _op_paragraph: "add_paragraph",
+    _op_runs: "add_paragraph (runs)",
+    _op_bullets: "add_paragraph (bullets)",
+    _op_table: "add_styled_table",
+    _op_code: "add_code_block",
+    _op_step: "add_step",
+    _op_note: "add_note",
+}
+
+_SPLICE = "splice_fragment (cached)"
+_HEADER_ROW = "add_styled_table (header row)"
+_HEADER_CELLS = "add_styled_table (header cells)"
+_STYLED_RUN = "character-styled run"
+
+_TR = qn("w:tr")
+_TC = qn("w:tc")
+_R_STYLE = qn("w:rStyle")
+_VAL = qn("w:val")
+_CHARACTER_STYLE_IDS = frozenset(character_style_id(name) for name in CHARACTER_STYLES)
+
+
+def _count_elements(elements):
+    return sum(1 for element in elements for _ in element.iter())
+
+
+def _inner_helpers(op, added):
+    """``{part: [count, elements]}`` for the parts of one op's output broken out of it."""
+    inner = {}
+    if op is _op_table:
+        for tbl in added:
+            header = tbl.find(_TR)
+            if header is not None:
+                cells = header.findall(_TC)
+                cell_elements = _count_elements(cells)
+                row = inner.setdefault(_HEADER_ROW, [0, 0])
+                row[0] += 1
+                row[1] += _count_elements([header]) - cell_elements
+                counts = inner.setdefault(_HEADER_CELLS, [0, 0])
+                counts[0] += len(cells)
+                counts[1] += cell_elements
+    if op is _op_table or op is _op_runs:
+        for element in added:
+            for r_style in element.iter(_R_STYLE):
+                if r_style.get(_VAL) in _CHARACTER_STYLE_IDS:
+                    counts = inner.setdefault(_STYLED_RUN, [0, 0])
+                    counts[0] += 1
+                    counts[1] += _count_elements([r_style.getparent().getparent()])
+    return inner
+
+
+def _frame(text):
+    """Collapsed-stack frames are separated by ';'."""
+    return text.replace(";", ",")
+
+
+def _net_blocks(before, after):
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+class _HelperStats:
+    __slots__ = ("calls", "seconds", "elements")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.elements = 0
+
+    def as_dict(self):
+        return {"calls": self.calls, "seconds": round(self.seconds, 6), "elements": self.elements}
+
+
+def _profile_section(doc, key, ops, cache):
+    """Render one section; returns ``(cached, {helper: _HelperStats})``."""
+    body = doc.element.body
+    helpers = {}
+    if cache is not None:
+        fragment = cache.get(key)
+        if fragment is not None:
+            start = content_end(body)
+            t = time.perf_counter()
+            splice_fragment(body, fragment)
+            stats = helpers[_SPLICE] = _HelperStats()
+            stats.calls = 1
+            stats.seconds = time.perf_counter() - t
+            stats.elements = _count_elements(body[start:content_end(body)])
+            return True, helpers
+    section_start = content_end(body)
+    for op, args in ops:
+        start = content_end(body)
+        t = time.perf_counter()
+        op(doc, *args)
+        seconds = time.perf_counter() - t
+        added = body[start:content_end(body)]
+        elements = _count_elements(added)
+        for name, (calls, count) in _inner_helpers(op, added).items():
+            inner = helpers.setdefault(name, _HelperStats())
+            inner.calls += calls
+            inner.elements += count
+            elements -= count
+        stats = helpers.setdefault(HELPERS.get(op, op.__name__), _HelperStats())
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.elements += elements
+    if cache is not None:
+        fragment = capture_fragment(body, section_start)
+        if fragment is not None:
+            cache.put(key, fragment)
+    return False, helpers
+
+
+def profile_plan(plan, cache=None):
+    """Render ``plan`` while profiling it; returns ``(doc, report)``."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        t = time.perf_counter()
+        doc = plan.new_document()
+        sections = [{
+            "id": None,
+            "title": "new_document",
+            "cached": False,
+            "seconds": round(time.perf_counter() - t, 6),
+            "helpers": {},
+        }]
+        for section_id, title, key, ops in plan.sections:
+            before = tracemalloc.take_snapshot()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            t = time.perf_counter()
+            cached, helpers = _profile_section(doc, key, ops, cache)
+            seconds = time.perf_counter() - t
+            after_current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            sections.append({
+                "id": section_id,
+                "title": title,
+                "cached": cached,
+                "seconds": round(seconds, 6),
+                "alloc_bytes": after_current - current,
+                "alloc_blocks": _net_blocks(before, after),
+                "peak_bytes": peak - current,
+                "helpers": {name: stats.as_dict() for name, stats in helpers.items()},
+            })
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    totals = {}
+    for section in sections:
+        for name, stats in section["helpers"].items():
+            total = totals.setdefault(name, {"calls": 0, "seconds": 0.0, "elements": 0})
+            total["calls"] += stats["calls"]
+            total["seconds"] = round(total["seconds"] + stats["seconds"], 6)
+            total["elements"] += stats["elements"]
+    report = {
+        "document": plan.name,
+        "seconds": round(sum(s["seconds"] for s in sections), 6),
+        "sections": sections,
+        "helpers": totals,
+    }
+    return doc, report
+
+
+def collapsed_stacks(report):
+    """Yield ``frame;frame;frame microseconds`` lines for a profile report."""
+    document = _frame(report["document"])
+    for section in report["sections"]:
+        title = _frame(section["title"])
+        spent = 0.0
+        for name, stats in section["helpers"].items():
+            spent += stats["seconds"]
+            micros = round(stats["seconds"] * 1e6)
+            if micros:
+                yield f"{document};{title};{_frame(name)} {micros}"
+        # Time outside the helpers (cache capture, bookkeeping) stays on the section.
+        micros = round((section["seconds"] - spent) * 1e6)
+        if micros > 0:
+            yield f"{document};{title} {micros}"
+    if "save_seconds" in report:
+        yield f"{document};save {round(report['save_seconds'] * 1e6)}"
+
+
+def profile_to_file(plan, filepath, cache=None, profile_dir=None):
+    """Render and save ``plan`` while profiling; writes ``<name>.json`` and ``<name>.folded``.
+
+    ``profile_dir`` defaults to PROFILE_DIRNAME next to ``filepath``. Returns
+    the path of the JSON report.
+    """
+    doc, report = profile_plan(plan, cache)
+    t = time.perf_counter()
+    save_docx(doc, filepath)
+    report["save_seconds"] = round(time.perf_counter() - t, 6)
+    report["output_bytes"] = os.path.getsize(filepath)
+
+    profile_dir = profile_dir or os.path.join(os.path.dirname(filepath), PROFILE_DIRNAME)
+    os.makedirs(profile_dir, exist_ok=True)
+    json_path = os.path.join(profile_dir, plan.name + ".json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(os.path.join(profile_dir, plan.name + ".folded"), "w", encoding="utf-8") as f:
+        for line in collapsed_stacks(report):
+            f.write(line + "\n")
+    return json_path
@@ -0,0 +1,345 @@
+"""
+Spec renderer shared by the HOS-13 document generators.
+
+A spec (see docgen.specs) is compiled once into a RenderPlan: per section, a
+flat list of (op, args) pairs with colours, sizes and alignments already
+resolved. Executing a plan is a tight loop of python-docx calls, so many
+documents can be rendered per process without re-reading the spec. Given a
+FragmentCache, sections already rendered once are spliced in from the cache.
+"""
+
+import copy
+import copyreg
+import os
+
+from docx.shared import Pt, Cm, Emu, Inches, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.table import WD_TABLE_ALIGNMENT
+
+from docgen import OUTPUT_DIR
+from docgen.charts import DEFAULT_WIDTH, chart_key, ensure_chart
+from docgen.core import add_paragraph, add_run, paragraph_properties, run_properties, shading
+from docgen.diff import expand_diffs
+from docgen.fragments import capture_fragment, content_end, section_key, splice_fragment
+from docgen.manifest import input_sources
+from docgen.packages import expand_packages
+from docgen.reproducible import save_docx
+from docgen.results import expand_section, sources_signature
+from docgen.risks import expand_registers
+from docgen.specs import apply_params, load_spec
+from docgen.styles import (
+    SEVERITY_STYLES,
+    TABLE_STYLE,
+    character_style_id,
+    ensure_character_styles,
+    ensure_table_style,
+)
+from docgen.template import new_document
+from docgen.tables import add_styled_table
+
+# Plans are pickled to build workers. Default pickling re-calls __new__ with
+# the stored value, which RGBColor (three arguments) and the unit-converting
+# Length subclasses (Pt(355600) is not 28pt) get wrong.
+copyreg.pickle(RGBColor, lambda color: (RGBColor, tuple(color)))
+for _unit in (Pt, Cm, Inches):
+    copyreg.pickle(_unit, lambda length: (Emu, (int(length),)))
+
+
+def set_cell_shading(cell, color_hex):
+    """Set cell background color."""
+    cell._tc.get_or_add_tcPr().append(copy.deepcopy(shading(color_hex)))
+
+
+def style_table(table):
+    """Apply consistent styling to a table.
+
+    Switches the table to the HOS table style, which formats the header row
+    and cell text; no cell or run is touched.
+    """
+    ensure_table_style(table.part.document)
+    table.style = TABLE_STYLE
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+
+# Severity/status word -> character style (see docgen.styles).
+_SEVERITY_STYLES = {
+    **SEVERITY_STYLES,
+    "GO": "Status-Pass",
+    "WORKING": "Status-Pass",
+    "PASS": "Status-Pass",
+    "PARTIAL": "Status-Fail",
+    "BLOCKED": "Status-Fail",
+}
+
+_CODE_PPR = dict(space_before=Pt(4), space_after=Pt(4), left_indent=Cm(0.5))
+_CODE_RPR = dict(size=Pt(9), color=RGBColor(30, 30, 30), font_name="Consolas")
+_STEP_LABEL_RPR = dict(bold=True, color=RGBColor(44, 62, 80))
+_NOTE_LABEL_RPR = dict(bold=True, color=RGBColor(196, 120, 0))
+
+
+def add_severity_text(paragraph, severity):
+    """Add severity text in its character style (bold 9pt if it has none)."""
+    style = _SEVERITY_STYLES.get(severity)
+    if style is None:
+        return add_run(paragraph, severity, run_properties(True, Pt(9)))
+    ensure_character_styles(paragraph.part.document)
+    return add_run(paragraph, severity, run_properties(size=Pt(9), style_id=character_style_id(style)))
+
+
+def add_colored_text(paragraph, text, color_rgb, bold=False, size=None):
+    return add_run(paragraph, text, run_properties(bold, Pt(size) if size else None, color_rgb))
+
+
+def add_code_block(doc, code, language=""):
+    """Add a formatted code block to the document."""
+    p = add_paragraph(doc, p_pr=paragraph_properties(**_CODE_PPR))
+    add_run(p, code, run_properties(**_CODE_RPR))
+    return p
+
+
+def add_step(doc, step_num, text):
+    """Add a numbered step."""
+    p = add_paragraph(doc)
+    add_run(p, f"Step {step_num}: ", run_properties(**_STEP_LABEL_RPR))
+    add_run(p, text)
+    return p
+
+
+def add_note(doc, text):
+    """Add a note/warning paragraph."""
+    p = add_paragraph(doc)
+    add_run(p, "NOTE: ", run_properties(**_NOTE_LABEL_RPR))
+    add_run(p, text)
+    return p
+
+
+# ============================================================
+# PLAN OPS: one per spec block type, called as op(doc, *args)
+# ============================================================
+def _op_spacer(doc, count):
+    for _ in range(count):
+        add_paragraph(doc)
+
+
+def _op_page_break(doc):
+    doc.add_page_break()
+
+
+def _op_heading(doc, text, level):
+    if not 0 <= level <= 9:
+        raise ValueError(f"level must be in range 0-9, got {level}")
+    add_paragraph(doc, text, "Title" if level == 0 else f"Heading {level}")
+
+
+def _op_paragraph(doc, text, style):
+    add_paragraph(doc, text, style)
+
+
+def _op_runs(doc, alignment, runs):
+    p = add_paragraph(doc, p_pr=paragraph_properties(alignment=alignment) if alignment is not None else None)
+    for text, bold, size, color, font_name, char_style in runs:
+        style_id = character_style_id(char_style) if char_style is not None else None
+        add_run(p, text, run_properties(bold, size, color, font_name, style_id))
+
+
+def _op_bullets(doc, items, style):
+    for item in items:
+        add_paragraph(doc, item, style)
+
+
+def _op_table(doc, header, rows, cell_styles=None):
+    add_styled_table(doc, header, rows, cell_styles=cell_styles)
+
+
+def _op_code(doc, code):
+    add_code_block(doc, code)
+
+
+def _op_step(doc, number, text):
+    add_step(doc, number, text)
+
+
+def _op_note(doc, text):
+    add_note(doc, text)
+
+
+def _op_chart(doc, chart, key, width):
+    path = ensure_chart(chart, key)
+    if path is None:
+        return
+    p = add_paragraph(doc, p_pr=paragraph_properties(alignment=WD_ALIGN_PARAGRAPH.CENTER))
+    p.add_run().add_picture(path, width=width)
+
+
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "both": WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+
+
+def _compile_run(run):
+    size = run.get("size")
+    color = run.get("color")
+    return (
+        run["text"],
+        run.get("bold"),
+        Pt(size) if size is not None else None,
+        RGBColor.from_string(color) if color is not None else None,
+        run.get("font"),
+        run.get("style"),
+    )
+
+
+def _compile_block(block):
+    kind = block["type"]
+    if kind == "spacer":
+        return _op_spacer, (block.get("count", 1),)
+    if kind == "page_break":
+        return _op_page_break, ()
+    if kind == "heading":
+        return _op_heading, (block["text"], block["level"])
+    if kind == "paragraph":
+        if "runs" in block:
+            alignment = _ALIGNMENTS[block["align"]] if "align" in block else None
+            runs = tuple(_compile_run(r) for r in block["runs"])
+            return _op_runs, (alignment, runs)
+        return _op_paragraph, (block["text"], block.get("style"))
+    if kind == "bullets":
+        return _op_bullets, (tuple(block["items"]), block.get("style", "List Bullet"))
+    if kind == "table":
+        rows = tuple(tuple(r) for r in block["rows"])
+        if "styles" in block:
+            cell_styles = tuple(tuple(s) for s in block["styles"])
+            return _op_table, (tuple(block["header"]), rows, cell_styles)
+        return _op_table, (tuple(block["header"]), rows)
+    if kind == "code":
+        return _op_code, (block["code"],)
+    if kind == "step":
+        return _op_step, (block["number"], block["text"])
+    if kind == "note":
+        return _op_note, (block["text"],)
+    if kind == "chart":
+        return _op_chart, (block, chart_key(block), Inches(block.get("width", DEFAULT_WIDTH)))
+    raise ValueError(f"Unknown block type: {kind!r}")
+
+
+class RenderPlan:
+    """A spec compiled into per-section lists of (op, args) pairs.
+
+    ``sections`` is a tuple of ``(section_id, title, key, ops)`` where ``key``
+    is the section's fragment cache key.
+    """
+
+    def __init__(self, name, filename, font_name, font_size, sections, title=None):
+        self.name = name
+        self.title = title or name
+        self.filename = filename
+        self.font_name = font_name
+        self.font_size = font_size
+        self.sections = sections
+
+    def new_document(self):
+        """Create an empty document with the spec's default font and table style."""
+        return new_document(self.font_name, self.font_size)
+
+    def execute(self, doc, cache=None):
+        """Run every op of the plan against ``doc``, reusing cached sections."""
+        body = doc.element.body
+        for _section_id, _title, key, ops in self.sections:
+            if cache is None:
+                for op, args in ops:
+                    op(doc, *args)
+                continue
+            fragment = cache.get(key)
+            if fragment is not None:
+                splice_fragment(body, fragment)
+                continue
+            start = content_end(body)
+            for op, args in ops:
+                op(doc, *args)
+            fragment = capture_fragment(body, start)
+            if fragment is not None:
+                cache.put(key, fragment)
+        return doc
+
+    def render(self, cache=None):
+        return self.execute(self.new_document(), cache)
+
+    def select(self, section_ids):
+        """A plan of only the sections in ``section_ids``; cache keys are unchanged."""
+        keep = set(section_ids)
+        sections = tuple(section for section in self.sections if section[0] in keep)
+        return RenderPlan(self.name, self.filename, self.font_name, self.font_size, sections, self.title)
+
+
+def compile_section(section):
+    """Compile one resolved spec section into ``(id, title, key, ops)``.
+
+    Table rows sourced from POC result dumps, risk registers, POC
+    package.json files and report diffs are filled in first, so the fragment
+    cache key covers the ingested data.
+    """
+    section = expand_diffs(expand_packages(expand_registers(expand_section(section))))
+    return (
+        section["id"],
+        section["title"],
+        section_key(section),
+        tuple(_compile_block(b) for b in section["blocks"]),
+    )
+
+
+def compile_spec(spec, compiled=None):
+    """Compile a loaded spec into a RenderPlan.
+
+    The spec's params are resolved with their defaults unless it already
+    was (see docgen.specs.apply_params). ``compiled`` optionally maps
+    ``section_key`` of a resolved section to its compiled form; those
+    sections are reused instead of compiled again.
+    """
+    spec = apply_params(spec)
+    defaults = spec.get("defaults", {})
+    if compiled is None:
+        sections = tuple(map(compile_section, spec["sections"]))
+    else:
+        sections = tuple(
+            compiled.get(section_key(section)) or compile_section(section) for section in spec["sections"]
+        )
+    return RenderPlan(
+        spec["name"],
+        spec["filename"],
+        defaults.get("font", "Calibri"),
+        Pt(defaults.get("size", 11)),
+        sections,
+        spec.get("title"),
+    )
+
+
+_PLAN_CACHE = {}
+
+
+def get_plan(name):
+    """Return the compiled plan for a spec, recompiling only if the spec or its data files changed."""
+    spec = load_spec(name)
+    signature = sources_signature(input_sources(spec))
+    cached = _PLAN_CACHE.get(name)
+    if cached is not None and cached[0] is spec and cached[1] == signature:
+        return cached[2]
+    plan = compile_spec(spec)
+    _PLAN_CACHE[name] = (spec, signature, plan)
+    return plan
+
+
+def render_to_file(name, output_dir=OUTPUT_DIR, cache=None, stream=False):
+    """Render the named spec and save it into ``output_dir``.
+
+    With ``stream`` the body is written incrementally (see docgen.stream).
+    """
+    plan = get_plan(name)
+    filepath = os.path.join(output_dir, plan.filename)
+    if stream:
+        from docgen.stream import stream_to_file
+        return stream_to_file(plan, filepath, cache)
+    save_docx(plan.render(cache), filepath)
+    return filepath
@@ -0,0 +1,104 @@
+"""
+Byte-for-byte reproducible .docx packages.
+
+``doc.save`` stamps every zip entry with the time of the save, so two builds
+of the same content never have the same bytes and a changed document can
+only be told from an unchanged one by unzipping and comparing its XML. Every
+.docx docgen writes goes through here instead:
+
+- zip entries get a fixed timestamp, permissions and creating system, so
+  nothing about the build machine or the clock ends up in the file;
+- parts are written in a fixed order: ``[Content_Types].xml`` first, the
+  rest by name;
+- the core properties (created, modified, revision, last modified by) are
+  set once on the base template (see docgen.template).
+
+The timestamp is ``SOURCE_DATE_EPOCH`` when set (the reproducible-builds
+convention) and 1980-01-01, the earliest a zip can store, otherwise. The
+XML itself needs no normalising: the same plan always serializes the same
+elements with the same attribute order. Outputs are still only identical
+for the same zlib and python-docx versions, and the streamed writer (see
+docgen.stream) lays out its document part differently from ``save_docx``.
+"""
+
+import datetime
+import os
+import time
+import zipfile
+
+EPOCH_VARIABLE = "SOURCE_DATE_EPOCH"
+DEFAULT_EPOCH = 315532800  # 1980-01-01T00:00:00Z
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+_FILE_MODE = 0o644 << 16
+_UNIX = 3  # ZipInfo.create_system; Windows Pythons default to 0
+
+
+def build_epoch():
+    """Seconds since the epoch to stamp outputs with; never before 1980."""
+    try:
+        epoch = int(os.environ[EPOCH_VARIABLE])
+    except (KeyError, ValueError):
+        return DEFAULT_EPOCH
+    return max(epoch, DEFAULT_EPOCH)
+
+
+def normalize_core_properties(doc):
+    """Give ``doc`` fixed core properties instead of the template's save history."""
+    props = doc.core_properties
+    when = datetime.datetime.fromtimestamp(build_epoch(), datetime.timezone.utc).replace(tzinfo=None)
+    props.created = when
+    props.modified = when
+    props.revision = 1
+    props.last_modified_by = ""
+
+
+def part_order(name):
+    """Sort key for zip entry names: content types first, then by name."""
+    return name != CONTENT_TYPES_PART, name
+
+
+def zip_info(name, compression=zipfile.ZIP_DEFLATED):
+    """A ZipInfo for ``name`` with nothing in it that depends on the build."""
+    info = zipfile.ZipInfo(name, time.gmtime(build_epoch())[:6])
+    info.compress_type = compression
+    info.create_system = _UNIX
+    info.external_attr = _FILE_MODE
+    return info
+
+
+def write_package(target, parts, compression=zipfile.ZIP_DEFLATED, level=None):
+    """Write ``parts`` (name -> bytes) as a reproducible zip to ``target`` (path or binary file)."""
+    with zipfile.ZipFile(target, "w", compression) as zf:
+        for name in sorted(parts, key=part_order):
+            zf.writestr(zip_info(name, compression), parts[name], compresslevel=level)
+
+
+class _PartCollector:
+    """Takes the place of python-docx's zip writer and keeps each serialized part."""
+
+    def __init__(self):
+        self.parts = {}
+
+    def write(self, pack_uri, blob):
+        self.parts[pack_uri.membername] = blob
+
+
+def package_parts(doc):
+    """The serialized parts of ``doc``'s package, name -> bytes, as ``doc.save`` writes them."""
+    from docx.opc.pkgwriter import PackageWriter
+    package = doc.part.package
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    collector = _PartCollector()
+    PackageWriter._write_content_types_stream(collector, parts)
+    PackageWriter._write_pkg_rels(collector, package.rels)
+    PackageWriter._write_parts(collector, parts)
+    return collector.parts
+
+
+def save_docx(doc, target):
+    """``doc.save(target)``, but reproducible; ``target`` is a path or binary file."""
+    write_package(target, package_parts(doc))
+    return target
@@ -0,0 +1,301 @@
+"""
+POC test result ingestion.
+
+The POC apps report one ``TestResult`` per test (``{"name", "passed",
+"duration", "details"}``, duration in milliseconds from ``performance.now()``)
+and POC6 logs each complete run as one JSON line prefixed with
+``POC_RESULT``. A result dump is any mix of:
+
+    *.jsonl   one record per line; raw ``adb logcat`` captures work too, since
+              everything up to ``POC_RESULT`` on a line is ignored
+    *.json    a single record or a top-level array of records
+
+where a record is either a TestResult or a run ``{"results": [TestResult, ...],
+...}``. Dumps are read incrementally -- line by line, or element by element
+for arrays -- so thousands of device runs never sit in memory at once; only
+the per-test durations are kept for the percentiles.
+
+A table or chart block can name a dump file or directory in ``"results"``;
+mapped table rows and chart data are then filled from the aggregated runs at
+compile time (see ``expand_section``). Without any dumps the hand-written
+rows are kept and the charts left out.
+"""
+
+import json
+import math
+import os
+import re
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOG_MARKER = "POC_RESULT"
+DUMP_EXTENSIONS = (".json", ".jsonl")
+
+_CHUNK = 1 << 16
+_BENCH_ENTRY = re.compile(r"\s*(?P<label>[^:|]+?):\s*encrypt=(?P<encrypt>[\d.]+)ms,\s*decrypt=(?P<decrypt>[\d.]+)ms")
+
+
+def dump_files(source):
+    """The dump files behind ``source`` (a path relative to the repository root)."""
+    path = os.path.join(ROOT_DIR, source)
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.endswith(DUMP_EXTENSIONS)
+        )
+    return [path] if os.path.isfile(path) else []
+
+
+def _iter_json_array(f, buf="", decoder=json.JSONDecoder()):
+    """Yield the elements of the JSON array read from ``f`` (after ``buf``), one at a time."""
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,[]":
+            if buf[pos] == "[":
+                started = True
+            pos += 1
+        if pos < len(buf) and started:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                yield value
+                pos = end
+                continue
+        if eof:
+            return
+        chunk = f.read(_CHUNK)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+def iter_records(path):
+    """Yield the records of one dump file without loading it whole."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                marker = line.find(LOG_MARKER)
+                if marker >= 0:
+                    line = line[marker + len(LOG_MARKER):]
+                line = line.strip()
+                if line.startswith("{"):
+                    yield json.loads(line)
+            return
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first == "[":
+            yield from _iter_json_array(f, first)
+        elif first:
+            yield json.loads(first + f.read())
+
+
+def iter_run_results(paths):
+    """Yield ``(run, result)`` for every TestResult in ``paths``.
+
+    ``run`` is the enclosing run record (device, platform...), or an empty
+    dict for bare TestResults.
+    """
+    for path in paths:
+        for record in iter_records(path):
+            if "results" in record:
+                for result in record["results"]:
+                    yield record, result
+            else:
+                yield {}, record
+
+
+def iter_results(paths):
+    """Yield every TestResult in ``paths``, unpacking run records."""
+    for _run, result in iter_run_results(paths):
+        yield result
+
+
+def _percentile(ordered, q):
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _stats(values):
+    ordered = sorted(values)
+    return {
+        "median": _percentile(ordered, 0.5),
+        "p95": _percentile(ordered, 0.95),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def aggregate(paths):
+    """Aggregate repeated runs per test name.
+
+    Returns ``{name: {"runs", "passed", "duration", "details", "benchmarks"}}``
+    where ``duration`` holds median/p95/min/max in ms, ``details`` is the
+    last run's details and ``benchmarks`` maps each payload label of a
+    benchmark test to encrypt/decrypt statistics over its passing runs.
+    """
+    tests = {}
+    for result in iter_results(paths):
+        test = tests.setdefault(result["name"], {"runs": 0, "passed": 0, "durations": [], "bench": {}})
+        test["runs"] += 1
+        test["durations"].append(float(result["duration"]))
+        test["details"] = result.get("details") or ""
+        if not result.get("passed"):
+            continue
+        test["passed"] += 1
+        for entry in test["details"].split("|"):
+            match = _BENCH_ENTRY.match(entry)
+            if match:
+                bench = test["bench"].setdefault(match["label"], ([], []))
+                bench[0].append(float(match["encrypt"]))
+                bench[1].append(float(match["decrypt"]))
+    return {
+        name: {
+            "runs": test["runs"],
+            "passed": test["passed"],
+            "duration": _stats(test["durations"]),
+            "details": test["details"],
+            "benchmarks": {
+                label: {"runs": len(enc), "encrypt": _stats(enc), "decrypt": _stats(dec)}
+                for label, (enc, dec) in test["bench"].items()
+            },
+        }
+        for name, test in tests.items()
+    }
+
+
+def _status(test):
+    if test["passed"] == test["runs"]:
+        return "PASS"
+    return "FAIL" if test["passed"] == 0 else "PARTIAL"
+
+
+def result_text(test):
+    """Report cell text for one aggregated test."""
+    duration = test["duration"]
+    lines = [
+        f"{_status(test)}. {test['passed']}/{test['runs']} runs passed "
+        f"(duration median {duration['median']:.1f} ms, p95 {duration['p95']:.1f} ms)."
+    ]
+    if test["benchmarks"]:
+        lines.append("Encrypt / decrypt time per payload size (median, p95):")
+        for label, bench in test["benchmarks"].items():
+            enc, dec = bench["encrypt"], bench["decrypt"]
+            lines.append(
+                f"- {label}: encrypt {enc['median']:.2f} ms ({enc['p95']:.2f}), "
+                f"decrypt {dec['median']:.2f} ms ({dec['p95']:.2f})"
+            )
+    elif test["details"]:
+        lines.append(f"Last run: {test['details']}")
+    return "\n".join(lines)
+
+
+def durations_by(paths, test, field):
+    """Durations of ``test`` grouped by the run field ``field`` (e.g. "device")."""
+    groups = {}
+    for run, result in iter_run_results(paths):
+        if result["name"] == test:
+            key = str(run.get(field) or "unknown")
+            groups.setdefault(key, []).append(round(float(result["duration"]), 2))
+    return groups
+
+
+def chart_data(kind, paths, test, group=None):
+    """Data for a chart block of ``kind`` from the dumps in ``paths``; None if there is none.
+
+    ``latency`` plots median and p95 encrypt/decrypt time per payload size of a
+    benchmark test; ``distribution`` plots the test's durations per ``group``
+    run field (default "device").
+    """
+    if kind == "latency":
+        benchmarks = aggregate(paths).get(test, {}).get("benchmarks")
+        if not benchmarks:
+            return None
+        labels = list(benchmarks)
+        return {
+            "labels": labels,
+            "series": {
+                op: {q: [round(benchmarks[label][op][q], 3) for label in labels] for q in ("median", "p95")}
+                for op in ("encrypt", "decrypt")
+            },
+        }
+    if kind == "distribution":
+        groups = durations_by(paths, test, group or "device")
+        return {"groups": dict(sorted(groups.items()))} if groups else None
+    raise ValueError(f"Unknown chart kind: {kind!r}")
+
+
+def _expand_chart(block):
+    """A chart block with its data filled from dumps, or None if there are none yet."""
+    results = block["results"]
+    paths = dump_files(results["source"])
+    data = chart_data(block["kind"], paths, results["test"], results.get("group")) if paths else None
+    if data is None:
+        return None
+    return {key: value for key, value in block.items() if key != "results"} | {"data": data}
+
+
+def expand_section(section):
+    """Return ``section`` with result-sourced table rows and charts filled in.
+
+    A table block may carry ``"results": {"source": PATH, "rows": {row label:
+    test name}}``; each listed row's second cell is replaced with the
+    aggregated result of that test. A chart block may carry ``"results":
+    {"source": PATH, "test": name}`` instead of inline ``"data"``; it is
+    dropped while its source has no dumps. Sections without such blocks are
+    returned unchanged, and tables whose sources have no dumps yet keep
+    their hand-written rows.
+    """
+    blocks = section["blocks"]
+    if not any("results" in block for block in blocks):
+        return section
+    expanded = []
+    for block in blocks:
+        results = block.get("results")
+        if results and block["type"] == "chart":
+            block = _expand_chart(block)
+            if block is not None:
+                expanded.append(block)
+            continue
+        paths = dump_files(results["source"]) if results else []
+        if not paths:
+            expanded.append(block)
+            continue
+        tests = aggregate(paths)
+        rows = []
+        styles = [list(row) for row in block.get("styles", ())]
+        for i, row in enumerate(block["rows"]):
+            name = results["rows"].get(row[0]) if row else None
+            if name in tests:
+                row = [row[0], result_text(tests[name]), *row[2:]]
+                if i < len(styles) and len(styles[i]) > 1:
+                    styles[i][1] = None  # written by hand for the old text
+            rows.append(row)
+        block = {**block, "rows": rows}
+        if "styles" in block:
+            block["styles"] = styles
+        expanded.append(block)
+    return {**section, "blocks": expanded}
+
+
+def result_sources(spec):
+    """The dump files every results block of ``spec`` reads."""
+    paths = []
+    for section in spec["sections"]:
+        for block in section["blocks"]:
+            if "results" in block:
+                paths.extend(dump_files(block["results"]["source"]))
+    return paths
+
+
+def sources_signature(paths):
+    """Cheap change detector for data files: (path, mtime, size) tuples."""
+    signature = []
+    for path in paths:
+        st = os.stat(path)
+        signature.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
@@ -0,0 +1,125 @@
+"""
+Computed risk registers.
+
+A register is a CSV file with one risk per row:
+
+    risk,probability,impact,timeline
+
+with probability and impact scored 1-5. A ``risk_register`` block (see
+docgen.specs) names the file in ``"source"`` and is expanded at compile time
+into a styled table: priority score (probability x impact), competition rank
+("1, 2, 2, 4"), severity band and the row order are all computed, so no score
+is ever typed by hand. Scoring runs over whole columns with NumPy, which
+keeps registers of thousands of rows cheap.
+
+Rows are ordered by score, then impact, then probability, highest first;
+ties keep the file order. The rank goes by score alone, so rows with the
+same score share a rank whatever their impact. The score cell gets the
+band's severity character style (see docgen.styles).
+"""
+
+import csv
+import os
+
+from docgen.results import ROOT_DIR
+from docgen.styles import SEVERITY_STYLES
+
+COLUMNS = ("risk", "probability", "impact", "timeline")
+SCALE = (1, 5)
+
+# (lowest score, band), highest band first.
+BANDS = ((15, "CRITICAL"), (10, "HIGH"), (5, "MEDIUM"), (1, "LOW"))
+
+HEADER = ("#", "Risk", "Probability (1-5)", "Impact (1-5)", "Priority Score", "Mitigation Timeline")
+_SCORE_COLUMN = HEADER.index("Priority Score")
+
+
+def register_path(source):
+    return os.path.join(ROOT_DIR, source)
+
+
+def load_register(path):
+    """Read a register CSV into column lists.
+
+    Raises ValueError, naming the file and line, for a missing column or a
+    row with too few cells.
+    """
+    columns = {name: [] for name in COLUMNS}
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = set(COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        for row in reader:
+            if any(row[name] is None for name in COLUMNS):
+                raise ValueError(f"{path}:{reader.line_num}: expected {len(reader.fieldnames)} cells, "
+                                 f"got {len(reader.fieldnames) - list(row.values()).count(None)}")
+            for name in COLUMNS:
+                columns[name].append(row[name].strip())
+    return columns
+
+
+def score_register(columns):
+    """Score, rank, band and order a register.
+
+    Returns ``(order, scores, ranks, bands)`` as NumPy arrays; ``order``
+    indexes the rows of ``columns`` from highest to lowest priority and the
+    other arrays follow that order.
+    """
+    import numpy as np
+
+    try:
+        probability = np.array(columns["probability"], dtype=np.int64)
+        impact = np.array(columns["impact"], dtype=np.int64)
+    except ValueError as exc:
+        raise ValueError(f"probability and impact must be whole numbers: {exc}") from None
+    for name, values in (("probability", probability), ("impact", impact)):
+        bad = np.flatnonzero((values < SCALE[0]) | (values > SCALE[1]))
+        if bad.size:
+            raise ValueError(f"{name} out of range {SCALE[0]}-{SCALE[1]} for {columns['risk'][bad[0]]!r}")
+    scores = probability * impact
+    # np.lexsort sorts by the last key first; the row index keeps it stable.
+    order = np.lexsort((np.arange(scores.size), -probability, -impact, -scores))
+    scores = scores[order]
+    ranks = np.searchsorted(-scores, -scores, side="left") + 1
+    floors = np.array([floor for floor, _band in BANDS])
+    names = np.array([band for _floor, band in BANDS])
+    bands = names[np.searchsorted(-floors, -scores, side="left")]
+    return order, scores, ranks, bands
+
+
+def register_table(source):
+    """A table block (header, rows, styles) for the register at ``source``."""
+    columns = load_register(register_path(source))
+    order, scores, ranks, bands = score_register(columns)
+    risk, probability, impact, timeline = (columns[name] for name in COLUMNS)
+    rows = []
+    styles = []
+    for i, score, rank, band in zip(order.tolist(), scores.tolist(), ranks.tolist(), bands.tolist()):
+        rows.append([str(rank), risk[i], probability[i], impact[i], f"{score} ({band})", timeline[i]])
+        row_styles = [None] * len(HEADER)
+        row_styles[_SCORE_COLUMN] = SEVERITY_STYLES[band]
+        styles.append(row_styles)
+    return {"type": "table", "header": list(HEADER), "rows": rows, "styles": styles}
+
+
+def expand_registers(section):
+    """Return ``section`` with its risk_register blocks expanded into tables."""
+    blocks = section["blocks"]
+    if not any(block["type"] == "risk_register" for block in blocks):
+        return section
+    expanded = [
+        register_table(block["source"]) if block["type"] == "risk_register" else block
+        for block in blocks
+    ]
+    return {**section, "blocks": expanded}
+
+
+def register_sources(spec):
+    """The register files every risk_register block of ``spec`` reads."""
+    return [
+        register_path(block["source"])
+        for section in spec["sections"]
+        for block in section["blocks"]
+        if block["type"] == "risk_register"
+    ]
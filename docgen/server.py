@@ -0,0 +1,317 @@
+"""
+Local render service for the HOS-13 documents.
+
+Other tools ask for a document over HTTP, on localhost or a Unix socket,
+instead of starting a Python process per report:
+
+    GET  /documents
+         JSON list of the documents (name, filename, title, section ids)
+    GET  /render/NAME?sections=3,4.1&match=noble&PARAM=value
+         the named document as .docx bytes
+    POST /render
+         {"spec": NAME or an inline spec object, "sections": [...], "match": ...,
+          "params": {PARAM: value}}
+
+``sections`` (ids; an id includes its subsections) and ``match`` (text,
+ignoring case) narrow the document to part of it, e.g. the blockers report
+for one module (see docgen.specs.select_sections). ``params`` give values
+for the spec's params (see docgen.specs.apply_params); in a query string
+every other parameter is one, list params taking items separated by commas
+or spaces. Errors come back as ``{"error": ..., "problems": [...]}`` with a
+4xx/5xx status.
+
+Data files (result dumps, risk registers, diffed reports) are named by
+the spec, so an inline spec or a param value could point anywhere: every
+file such a request reads must resolve inside the repository, or it is
+refused with 403.
+
+Requests are handled on threads and rendered on a process pool. Each worker
+keeps its compiled plans, base templates and an in-memory section fragment
+cache between requests; an edited spec or data file is picked up on the
+next request (see docgen.render.get_plan). Filtered documents reuse the
+same section fragments as whole ones. Rendered bytes are reproducible (see
+docgen.reproducible), so the ETag is their SHA-256 and a request with a
+matching If-None-Match gets 304 Not Modified.
+
+    curl -o out.docx 'http://127.0.0.1:8765/render/blockers_v2?sections=title,3'
+    curl --unix-socket /tmp/docgen.sock -o out.docx http://docgen/render/poc_manual
+"""
+
+import hashlib
+import json
+import os
+import socketserver
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from docgen.manifest import input_sources
+from docgen.reproducible import save_docx
+from docgen.results import ROOT_DIR, sources_signature
+from docgen.specs import apply_params, list_specs, load_spec, param_values, select_sections, validate_spec
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY = 16 * 1024 * 1024  # bytes of an inline spec request
+RENDER_TIMEOUT = 120.0  # seconds
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+_FILTERS = ("sections", "match")
+
+
+class RequestError(Exception):
+    """A bad request; ``status`` is the HTTP status to answer with."""
+
+    def __init__(self, status, message, problems=()):
+        super().__init__(message)
+        self.status = status
+        self.problems = list(problems)
+
+
+# ============================================================
+# WORKERS
+# ============================================================
+_CACHE = {}
+_INLINE_PLANS = {}
+_INLINE_LIMIT = 32
+
+
+def _warm(cache_bytes):
+    """Pool initializer: compile every plan and build its template up front."""
+    from docgen.fragments import get_fragment_cache
+    from docgen.render import get_plan
+    _CACHE["fragments"] = get_fragment_cache(None, cache_bytes) if cache_bytes else None
+    for name in list_specs():
+        try:
+            get_plan(name).new_document()
+        except Exception:
+            pass  # reported when the document is requested
+
+
+def _pid():
+    return os.getpid()
+
+
+def _inline_plan(spec):
+    """The compiled plan of an inline or params-resolved spec, cached by content and data files."""
+    from docgen.render import compile_spec
+    key = (
+        hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest(),
+        sources_signature(input_sources(spec)),
+    )
+    plan = _INLINE_PLANS.get(key)
+    if plan is None:
+        if len(_INLINE_PLANS) >= _INLINE_LIMIT:
+            _INLINE_PLANS.pop(next(iter(_INLINE_PLANS)))
+        plan = _INLINE_PLANS[key] = compile_spec(spec)
+    return plan
+
+
+def _render(name, spec, section_ids):
+    """Render a named spec (or the resolved ``spec``) to .docx bytes; runs in a worker."""
+    import io
+    from docgen.render import get_plan
+    plan = get_plan(name) if spec is None else _inline_plan(spec)
+    if section_ids is not None:
+        plan = plan.select(section_ids)
+    out = io.BytesIO()
+    save_docx(plan.render(_CACHE.get("fragments")), out)
+    return out.getvalue()
+
+
+# ============================================================
+# HTTP
+# ============================================================
+def _documents():
+    docs = []
+    for name in list_specs():
+        spec = load_spec(name)
+        docs.append({"name": name, "filename": spec["filename"], "title": spec["title"],
+                     "sections": [section["id"] for section in spec["sections"]]})
+    return docs
+
+
+def _check_sources(spec):
+    """Refuse a spec that reads data files from outside the repository."""
+    root = os.path.realpath(ROOT_DIR)
+    for path in input_sources(spec):
+        real = os.path.realpath(path)
+        if os.path.commonpath([real, root]) != root:
+            raise RequestError(403, f"data file outside the repository: {os.path.relpath(path, ROOT_DIR)}")
+
+
+def _resolve(spec, sections, match, params=None, text_params=False):
+    """``(name, resolved spec or None, loaded spec, section ids or None)`` for a request.
+
+    The resolved spec is None for a named document rendered with its
+    default params; otherwise it is what the worker compiles. With
+    ``text_params`` the param values come from a query string.
+    """
+    if isinstance(spec, str):
+        if spec not in list_specs():
+            raise RequestError(404, f"unknown document {spec!r}")
+        name, inline = spec, None
+        try:
+            loaded = load_spec(name)
+        except ValueError as exc:
+            raise RequestError(500, f"spec {name!r} is not valid JSON: {exc}") from None
+    elif isinstance(spec, dict):
+        problems = validate_spec(spec)
+        if problems:
+            raise RequestError(400, "invalid spec", problems)
+        name, inline, loaded = spec["name"], spec, spec
+    else:
+        raise RequestError(400, "'spec' must be a document name or a spec object")
+    if sections is not None and not (isinstance(sections, list) and all(isinstance(s, str) for s in sections)):
+        raise RequestError(400, "'sections' must be a list of section ids")
+    if match is not None and not isinstance(match, str):
+        raise RequestError(400, "'match' must be a string")
+    if params is not None and not (isinstance(params, dict) and all(
+            isinstance(v, str) or (isinstance(v, list) and all(isinstance(i, str) for i in v))
+            for v in params.values())):
+        raise RequestError(400, "'params' must be an object of strings or lists of strings")
+    try:
+        resolved = apply_params(loaded, param_values(loaded, params) if text_params else params)
+    except ValueError as exc:
+        raise RequestError(400, str(exc)) from None
+    if inline is not None or params:
+        _check_sources(resolved)
+        inline = resolved
+    if not sections and not match:
+        return name, inline, loaded, None
+    ids = select_sections(resolved, sections, match)
+    if not ids:
+        raise RequestError(404, "no section matches the filter")
+    return name, inline, loaded, ids
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "docgen"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        # Unix socket peers have no (host, port).
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_json(self, status, data):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def _handle(self, route):
+        try:
+            self._send(*route())
+        except RequestError as exc:
+            self._send_json(exc.status, {"error": str(exc), "problems": exc.problems})
+        except Exception as exc:
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}", "problems": []})
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/documents":
+            self._handle(lambda: (200, json.dumps(_documents()).encode("utf-8"), "application/json"))
+        elif url.path.startswith("/render/"):
+            query = parse_qs(url.query)
+            sections = [s.strip() for value in query.get("sections", []) for s in value.split(",") if s.strip()]
+            match = query.get("match", [None])[-1]
+            params = {key: ",".join(values) for key, values in query.items() if key not in _FILTERS}
+            name = unquote(url.path[len("/render/"):])
+            self._handle(lambda: self._render(name, sections or None, match, params, True))
+        else:
+            self._send_json(404, {"error": f"no route {url.path}", "problems": []})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/render":
+            self._send_json(404, {"error": f"no route {self.path}", "problems": []})
+            return
+        self._handle(self._render_post)
+
+    def _render_post(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise RequestError(400, "Content-Length is not a number") from None
+        if length < 0:
+            raise RequestError(400, "Content-Length is negative")
+        if length > MAX_BODY:
+            raise RequestError(413, f"request body over {MAX_BODY} bytes")
+        try:
+            request = json.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            raise RequestError(400, f"request body is not JSON: {exc}") from None
+        if not isinstance(request, dict) or "spec" not in request:
+            raise RequestError(400, "expected an object with 'spec'")
+        return self._render(request["spec"], request.get("sections"), request.get("match"), request.get("params"))
+
+    def _render(self, spec, sections, match, params=None, text_params=False):
+        name, inline, loaded, ids = _resolve(spec, sections, match, params, text_params)
+        start = time.perf_counter()
+        data = self.server.pool.submit(_render, name, inline, ids).result(timeout=RENDER_TIMEOUT)
+        etag = f'"{hashlib.sha256(data).hexdigest()}"'
+        headers = (
+            ("ETag", etag),
+            ("Content-Disposition", f'attachment; filename="{loaded["filename"]}"'),
+            ("X-Render-Seconds", f"{time.perf_counter() - start:.3f}"),
+        )
+        if etag in (tag.strip() for tag in (self.headers.get("If-None-Match") or "").split(",")):
+            return 304, b"", DOCX_TYPE, headers
+        return 200, data, DOCX_TYPE, headers
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(pool, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, quiet=False):
+    """An HTTP server rendering on ``pool``, bound to ``socket_path`` or ``host:port``."""
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixServer(socket_path, _Handler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.pool = pool
+    server.quiet = quiet
+    return server
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, jobs=None, cache_bytes=None, quiet=False):
+    """Run the render service until interrupted; returns an exit status."""
+    if cache_bytes is None:
+        from docgen.fragments import DEFAULT_MAX_BYTES
+        cache_bytes = DEFAULT_MAX_BYTES
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_warm, initargs=(cache_bytes,)) as pool:
+        # Start (and so warm) every worker before taking requests.
+        for future in [pool.submit(_pid) for _ in range(jobs)]:
+            future.result()
+        server = make_server(pool, host, port, socket_path, quiet)
+        where = socket_path if socket_path is not None else f"http://{host}:{server.server_address[1]}"
+        print(f"Serving {len(list_specs())} document(s) on {where} with {jobs} worker(s); Ctrl-C to stop")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print()
+        finally:
+            server.server_close()
+            if socket_path is not None and os.path.exists(socket_path):
+                os.remove(socket_path)
+    return 0
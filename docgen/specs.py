@@ -0,0 +1,362 @@
+"""
+Report spec loading for the HOS-13 document generators.
+
+A spec is a JSON file under ``docgen/specs/`` describing one document as an
+ordered list of sections, each holding a list of content blocks:
+
+    spacer      {"count": n}                       empty paragraphs
+    page_break  {}
+    heading     {"text": ..., "level": n}
+    paragraph   {"text": ..., "style": ...}        plain paragraph
+    paragraph   {"runs": [...], "align": ...}      formatted runs
+    bullets     {"items": [...], "style": ...}
+    table       {"header": [...], "rows": [[...]]} styled grid table
+                optional "results": {"source", "rows"} fills rows from
+                POC result dumps (see docgen.results); optional "packages":
+                {"library", "version", "poc"} fills versions from the POC
+                package.json files (see docgen.packages); optional "diff":
+                {"old", "new"} replaces the rows with the changes between
+                two .docx files (see docgen.diff); optional "styles":
+                per row, a character style name or null per cell
+    risk_register {"source": ...}                  computed, sorted risk
+                table from a register CSV (see docgen.risks)
+    code        {"code": ...}
+    step        {"number": n, "text": ...}
+    note        {"text": ...}
+    chart       {"kind": ..., "title": ..., "data": {...}}  PNG chart (see
+                docgen.charts); "results" instead of "data" draws from POC
+                result dumps
+
+A run is {"text", "style", "bold", "size", "color", "font"} with only "text"
+required; "style" names a severity/status character style
+(docgen.styles.CHARACTER_STYLES), e.g. "Status-Pass".
+
+A spec may declare "params": {name: default}, each default a string or a
+list of strings. ``{{name}}`` in any string of a block or section title is
+replaced by the value (list items joined with ", "), and a section or block
+with "if": {name: value or [values]} is kept only when the param's value
+(any item, for a list) is one of those. ``apply_params`` resolves a spec
+for given values; rendering resolves it with the defaults, and
+``python -m docgen variants`` renders a table of values (see
+docgen.variants).
+``validate_spec`` checks a spec against this schema. This module never
+imports python-docx.
+"""
+
+import json
+import os
+import re
+
+from docgen.styles import CHARACTER_STYLES
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+
+_SPEC_CACHE = {}
+
+
+def spec_path(name):
+    return os.path.join(SPEC_DIR, name + ".json")
+
+
+def list_specs():
+    """Return the names of all specs in SPEC_DIR."""
+    return sorted(f[:-5] for f in os.listdir(SPEC_DIR) if f.endswith(".json"))
+
+
+def load_spec(name):
+    """Load a spec by name, re-reading the file only when it has changed.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    path = spec_path(name)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _SPEC_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    _SPEC_CACHE[path] = (mtime, spec)
+    return spec
+
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+_LIST_SEPARATOR = re.compile(r"[\s,]+")
+
+
+def _condition_met(condition, values):
+    for name, allowed in condition.items():
+        allowed = allowed if isinstance(allowed, list) else [allowed]
+        value = values[name]
+        if not set(value if isinstance(value, list) else [value]) & set(allowed):
+            return False
+    return True
+
+
+def _substitute(value, values):
+    if isinstance(value, str):
+        if "{{" not in value:
+            return value
+
+        def replace(match):
+            if match[1] not in values:
+                return match[0]  # not a param, e.g. a JSX style={{...}}
+            param = values[match[1]]
+            return ", ".join(param) if isinstance(param, list) else param
+        return _PLACEHOLDER.sub(replace, value)
+    if isinstance(value, dict):
+        return {key: _substitute(item, values) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, values) for item in value]
+    return value
+
+
+def _condition_values(spec):
+    """Param name -> every value an "if" of ``spec`` tests it against."""
+    known = {}
+    for section in spec["sections"]:
+        for obj in [section, *section["blocks"]]:
+            for name, allowed in obj.get("if", {}).items():
+                known.setdefault(name, set()).update(allowed if isinstance(allowed, list) else [allowed])
+    return known
+
+
+def apply_params(spec, values=None):
+    """``spec`` with its params resolved: placeholders filled, "if"s applied.
+
+    ``values`` overrides the declared defaults. Raises ValueError for an
+    undeclared param, a value of the wrong type, or a value no "if" of the
+    spec tests for (a typo would otherwise silently drop content). A spec
+    without params is returned as is.
+    """
+    params = spec.get("params")
+    if params is None:
+        if values:
+            raise ValueError(f"{spec['name']} declares no params")
+        return spec
+    values = dict(values or {})
+    unknown = set(values) - set(params)
+    if unknown:
+        raise ValueError(f"{spec['name']}: unknown param(s) {', '.join(sorted(unknown))}")
+    known = _condition_values(spec)
+    for name, value in values.items():
+        if isinstance(params[name], list) != isinstance(value, list):
+            raise ValueError(f"{spec['name']}: param {name!r} must be a {type(params[name]).__name__}")
+        if name in known:
+            bad = set(value if isinstance(value, list) else [value]) - known[name]
+            if bad:
+                raise ValueError(f"{spec['name']}: param {name!r} has no content for {', '.join(sorted(bad))}")
+    resolved = {**params, **values}
+    sections = []
+    for section in spec["sections"]:
+        if not _condition_met(section.get("if", {}), resolved):
+            continue
+        blocks = [
+            _substitute({key: item for key, item in block.items() if key != "if"}, resolved)
+            for block in section["blocks"]
+            if _condition_met(block.get("if", {}), resolved)
+        ]
+        section = {key: item for key, item in section.items() if key != "if"}
+        sections.append({**section, "title": _substitute(section["title"], resolved), "blocks": blocks})
+    return {key: item for key, item in spec.items() if key != "params"} | {"sections": sections}
+
+
+def param_values(spec, values):
+    """Param values given as text (a CSV cell, a query string) typed for ``spec``.
+
+    List params take items separated by spaces or commas; the rest stay
+    strings.
+    """
+    declared = spec.get("params", {})
+    return {
+        param: [item for item in _LIST_SEPARATOR.split(value) if item]
+        if isinstance(declared.get(param), list) else value
+        for param, value in values.items()
+    }
+
+
+def _strings(value):
+    """Every string value inside a block (not the field names)."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def select_sections(spec, ids=None, match=None):
+    """Ids of the sections of ``spec`` picked by ``ids`` and ``match``, in order.
+
+    An id also picks its subsections ("3" picks "3.1", "3.2"...). ``match``
+    picks sections whose title or text contains it, ignoring case. With both,
+    a section must satisfy both; with neither, every section is picked.
+    """
+    picked = []
+    needle = match.lower() if match else None
+    for section in spec["sections"]:
+        sid = section["id"]
+        if ids and not any(sid == i or sid.startswith(i + ".") for i in ids):
+            continue
+        texts = _strings([section["title"], section["blocks"]])
+        if needle is not None and not any(needle in text.lower() for text in texts):
+            continue
+        picked.append(sid)
+    return picked
+
+
+# Block type -> (required fields, optional fields) with their JSON types.
+BLOCK_FIELDS = {
+    "spacer": ({}, {"count": int}),
+    "page_break": ({}, {}),
+    "heading": ({"text": str, "level": int}, {}),
+    "paragraph": ({}, {"text": str, "style": str, "runs": list, "align": str}),
+    "bullets": ({"items": list}, {"style": str}),
+    "table": ({"header": list, "rows": list}, {"results": dict, "packages": dict, "diff": dict, "styles": list}),
+    "risk_register": ({"source": str}, {}),
+    "code": ({"code": str}, {}),
+    "step": ({"number": (int, str), "text": str}, {}),
+    "note": ({"text": str}, {}),
+    "chart": ({"kind": str, "title": str}, {"data": dict, "results": dict, "xlabel": str,
+                                             "ylabel": str, "width": (int, float)}),
+}
+CHART_KINDS = ("latency", "distribution")
+CHARACTER_STYLE_NAMES = tuple(CHARACTER_STYLES)
+ALIGNMENTS = ("left", "center", "right", "both")
+RUN_FIELDS = {"text": str, "style": str, "bold": bool, "size": (int, float), "color": str, "font": str}
+
+_HEX_COLOR = re.compile(r"^[0-9A-Fa-f]{6}$")
+
+
+def _check_fields(where, obj, required, optional, errors):
+    """Check field names and types; False if a required field is unusable."""
+    if not isinstance(obj, dict):
+        errors.append(f"{where}: expected an object")
+        return False
+    ok = True
+    for field, kind in required.items():
+        if field not in obj:
+            errors.append(f"{where}: missing {field!r}")
+            ok = False
+        elif not isinstance(obj[field], kind) or (isinstance(obj[field], bool) and kind is int):
+            errors.append(f"{where}: {field!r} has the wrong type")
+            ok = False
+    for field, value in obj.items():
+        if field in required or field == "type":
+            continue
+        if field not in optional:
+            errors.append(f"{where}: unknown field {field!r}")
+        elif not isinstance(value, optional[field]):
+            errors.append(f"{where}: {field!r} has the wrong type")
+    return ok
+
+
+def _validate_block(where, block, errors):
+    kind = block.get("type") if isinstance(block, dict) else None
+    if kind not in BLOCK_FIELDS:
+        errors.append(f"{where}: unknown block type {kind!r}")
+        return
+    required, optional = BLOCK_FIELDS[kind]
+    if not _check_fields(where, block, required, {**optional, "if": dict}, errors):
+        return
+    if kind == "paragraph":
+        if ("text" in block) == ("runs" in block):
+            errors.append(f"{where}: paragraph needs exactly one of 'text' or 'runs'")
+        if block.get("align", "left") not in ALIGNMENTS:
+            errors.append(f"{where}: align must be one of {', '.join(ALIGNMENTS)}")
+        for i, run in enumerate(block.get("runs", ())):
+            run_where = f"{where} run {i}"
+            if _check_fields(run_where, run, {"text": str}, RUN_FIELDS, errors):
+                color = run.get("color")
+                if isinstance(color, str) and not _HEX_COLOR.match(color):
+                    errors.append(f"{run_where}: color must be RRGGBB hex")
+                if run.get("style", CHARACTER_STYLE_NAMES[0]) not in CHARACTER_STYLE_NAMES:
+                    errors.append(f"{run_where}: style must be one of {', '.join(CHARACTER_STYLE_NAMES)}")
+    elif kind == "table":
+        if "results" in block:
+            _check_fields(f"{where} results", block["results"], {"source": str, "rows": dict}, {}, errors)
+        cols = len(block["header"])
+        for i, row in enumerate(block["rows"]):
+            if not isinstance(row, list) or len(row) > cols:
+                errors.append(f"{where} row {i}: expected a list of at most {cols} cells")
+            elif not all(isinstance(cell, str) for cell in row):
+                errors.append(f"{where} row {i}: cells must be strings")
+        if "packages" in block and _check_fields(f"{where} packages", block["packages"], {"library": str},
+                                                  {"version": str, "poc": str}, errors):
+            for key, column in block["packages"].items():
+                if column not in block["header"]:
+                    errors.append(f"{where} packages: {key} column {column!r} is not in the header")
+        if "diff" in block:
+            _check_fields(f"{where} diff", block["diff"], {"old": str, "new": str}, {}, errors)
+            if cols != 4:
+                errors.append(f"{where}: a diff table needs 4 columns (#, issue, old value, correction)")
+        if "styles" in block:
+            styles = block["styles"]
+            if len(styles) != len(block["rows"]):
+                errors.append(f"{where}: 'styles' needs one entry per row")
+            for i, row in enumerate(styles):
+                if not isinstance(row, list) or not all(
+                    style is None or style in CHARACTER_STYLE_NAMES for style in row
+                ):
+                    errors.append(f"{where} styles {i}: expected a list of character style names or nulls")
+                elif i < len(block["rows"]) and len(row) != len(block["rows"][i]):
+                    errors.append(f"{where} styles {i}: {len(row)} entries for a row of {len(block['rows'][i])} cells")
+    elif kind == "chart":
+        if block["kind"] not in CHART_KINDS:
+            errors.append(f"{where}: chart kind must be one of {', '.join(CHART_KINDS)}")
+        if ("data" in block) == ("results" in block):
+            errors.append(f"{where}: chart needs exactly one of 'data' or 'results'")
+        if "results" in block:
+            _check_fields(f"{where} results", block["results"], {"source": str, "test": str},
+                          {"group": str}, errors)
+    elif kind == "bullets" and not all(isinstance(item, str) for item in block["items"]):
+        errors.append(f"{where}: bullet items must be strings")
+    elif kind == "heading" and not 0 <= block["level"] <= 9:
+        errors.append(f"{where}: heading level must be 0-9")
+
+
+def _is_param_value(value):
+    return isinstance(value, str) or (isinstance(value, list) and all(isinstance(v, str) for v in value))
+
+
+def _check_condition(where, obj, params, errors):
+    condition = obj.get("if")
+    if not isinstance(condition, dict):
+        return
+    for name, allowed in condition.items():
+        if name not in params:
+            errors.append(f"{where}: 'if' tests undeclared param {name!r}")
+        elif not _is_param_value(allowed):
+            errors.append(f"{where}: 'if' values must be a string or a list of strings")
+
+
+def validate_spec(spec):
+    """Return a list of problems with a loaded spec; empty if it is valid."""
+    errors = []
+    for field in ("name", "title", "filename", "sections"):
+        if field not in spec:
+            errors.append(f"missing {field!r}")
+    if errors:
+        return errors
+    if not spec["filename"].endswith(".docx"):
+        errors.append("filename must end in .docx")
+    params = spec.get("params", {})
+    if not isinstance(params, dict) or not all(_is_param_value(value) for value in params.values()):
+        errors.append("params must map names to a string or a list of strings")
+        params = {}
+    seen = set()
+    for i, section in enumerate(spec["sections"]):
+        where = f"section {i}"
+        if not _check_fields(where, section, {"id": str, "title": str, "blocks": list}, {"if": dict}, errors):
+            continue
+        where = f"section {section['id']!r}"
+        if section["id"] in seen:
+            errors.append(f"{where}: duplicate id")
+        seen.add(section["id"])
+        _check_condition(where, section, params, errors)
+        for j, block in enumerate(section["blocks"]):
+            _validate_block(f"{where} block {j}", block, errors)
+            if isinstance(block, dict):
+                _check_condition(f"{where} block {j}", block, params, errors)
+    return errors
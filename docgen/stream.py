@@ -0,0 +1,125 @@
+"""
+Streaming .docx writer.
+
+``doc.save`` serializes the whole document tree at the end, so memory grows
+with the document. ``stream_to_file`` instead renders each plan op into a
+scratch document, serializes the new body elements straight into
+``word/document.xml`` inside the output zip and drops them again. Tables are
+not built at all: their rows go from ``iter_table_xml`` to the zip one at a
+time. Peak memory is bounded by the largest single block rather than by the
+document.
+
+The ops are the same ones ``RenderPlan.execute`` runs, so the output matches
+``render_to_file`` element for element. The remaining package parts (styles,
+numbering, relationships...) are taken from the scratch document once the
+body is done. Entries get the same fixed metadata as ``save_docx`` (see
+docgen.reproducible), but the document part comes first since it is written
+before the others exist.
+"""
+
+import re
+import zipfile
+
+from lxml import etree
+
+from docgen.fragments import fragment_content, wrap_fragment
+from docgen.render import _op_table
+from docgen.reproducible import package_parts, part_order, zip_info
+from docgen.tables import column_twips, iter_table_xml
+
+_DOCUMENT_PART = "word/document.xml"
+
+# Content referencing the scratch document's relationships is not cacheable
+# (see fragments.capture_fragment).
+_RELATIONSHIP_ATTR = re.compile(rb'\sr:\w+="')
+
+
+class _BodyWriter:
+    """Writes body content to ``out`` and collects it for the fragment cache."""
+
+    def __init__(self, out, doc):
+        self.out = out
+        self.doc = doc
+        self.body = doc.element.body
+        self.sect_pr = self.body[-1]
+        self.collected = None
+        self.collected_bytes = 0
+        self.limit = 0
+
+    def start_collecting(self, limit):
+        self.collected = []
+        self.collected_bytes = 0
+        self.limit = limit
+
+    def stop_collecting(self):
+        """Return the bytes written since ``start_collecting``, or None if over the limit."""
+        collected, self.collected = self.collected, None
+        return None if collected is None else b"".join(collected)
+
+    def write(self, data):
+        if not data:
+            return
+        self.out.write(data)
+        if self.collected is not None:
+            self.collected_bytes += len(data)
+            if self.collected_bytes > self.limit:
+                self.collected = None
+            else:
+                self.collected.append(data)
+
+    def flush(self):
+        """Write out the elements rendered into the scratch body and drop them."""
+        body = self.body
+        if len(body) == 1:
+            return
+        body.remove(self.sect_pr)
+        data = etree.tostring(body, encoding="UTF-8")
+        body.clear()
+        body.append(self.sect_pr)
+        self.write(fragment_content(data))
+
+
+def _write_ops(writer, ops):
+    doc = writer.doc
+    for op, args in ops:
+        if op is _op_table:
+            header, rows, *cell_styles = args
+            col_twips = column_twips(doc, len(header))
+            for piece in iter_table_xml(header, rows, col_twips, cell_styles=cell_styles[0] if cell_styles else None):
+                writer.write(piece.encode("utf-8"))
+        else:
+            op(doc, *args)
+            writer.flush()
+
+
+def stream_to_file(plan, filepath, cache=None):
+    """Render ``plan`` into ``filepath`` without holding the document in memory."""
+    doc = plan.new_document()
+    body = doc.element.body
+    head, sep, tail = etree.tostring(doc.element, encoding="UTF-8", standalone=True).partition(b"<w:body>")
+    head += sep
+
+    with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(zip_info(_DOCUMENT_PART), "w", force_zip64=True) as out:
+            writer = _BodyWriter(out, doc)
+            out.write(head)
+            for _section_id, _title, key, ops in plan.sections:
+                if cache is None:
+                    _write_ops(writer, ops)
+                    continue
+                fragment = cache.get(key)
+                if fragment is not None:
+                    writer.write(fragment_content(fragment))
+                    continue
+                writer.start_collecting(cache.max_bytes)
+                _write_ops(writer, ops)
+                content = writer.stop_collecting()
+                if content and not _RELATIONSHIP_ATTR.search(content):
+                    cache.put(key, wrap_fragment(body, content))
+            out.write(tail)
+
+        parts = package_parts(doc)
+        for name in sorted(parts, key=part_order):
+            if name != _DOCUMENT_PART:
+                zf.writestr(zip_info(name), parts[name])
+    return filepath
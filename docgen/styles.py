@@ -0,0 +1,105 @@
+"""
+Document-level styles shared by the HOS-13 documents.
+
+Tables use the custom "HOS Table" style: Table Grid borders, 9pt text with
+2pt paragraph spacing, and a first-row conditional format carrying the
+dark header fill and white bold text. Tables reference it by id and switch
+the header formatting on with ``tblLook firstRow``, so no cell, paragraph
+or run in a table needs direct formatting.
+
+Severity and status text (HIGH, PASS, BLOCKED...) uses the character
+styles in ``CHARACTER_STYLES``, so such runs carry only a ``w:rStyle``
+reference instead of repeating bold and colour on every run.
+
+Word applies table style run properties below paragraph styles, so a font
+size set on Normal would override the table's 9pt. ``set_default_font``
+therefore puts the document size in ``w:docDefaults`` and only the font
+name on Normal.
+"""
+
+HEADER_FILL = "2C3E50"
+
+# Bold coloured character styles for severity and status text:
+# name -> (style id, colour).
+CHARACTER_STYLES = {
+    "Severity-Critical": ("SeverityCritical", "C00000"),
+    "Severity-High": ("SeverityHigh", "C00000"),
+    "Severity-Medium": ("SeverityMedium", "C47800"),
+    "Severity-Low": ("SeverityLow", "008000"),
+    "Status-Pass": ("StatusPass", "008000"),
+    "Status-Warning": ("StatusWarning", "C47800"),
+    "Status-Fail": ("StatusFail", "C00000"),
+}
+SEVERITY_STYLES = {
+    "CRITICAL": "Severity-Critical",
+    "HIGH": "Severity-High",
+    "MEDIUM": "Severity-Medium",
+    "LOW": "Severity-Low",
+}
+
+TABLE_STYLE = "HOS Table"
+TABLE_STYLE_ID = "HOSTable"
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_TABLE_STYLE_XML = (
+    f'<w:style xmlns:w="{_W_NS}" w:type="table" w:customStyle="1" w:styleId="{TABLE_STYLE_ID}">'
+    f'<w:name w:val="{TABLE_STYLE}"/>'
+    '<w:basedOn w:val="TableGrid"/>'
+    '<w:uiPriority w:val="59"/>'
+    '<w:pPr><w:spacing w:before="40" w:after="40" w:line="240" w:lineRule="auto"/></w:pPr>'
+    '<w:rPr><w:sz w:val="18"/><w:szCs w:val="18"/></w:rPr>'
+    '<w:tblPr><w:jc w:val="center"/></w:tblPr>'
+    '<w:tblStylePr w:type="firstRow">'
+    '<w:rPr><w:b/><w:bCs/><w:color w:val="FFFFFF"/></w:rPr>'
+    f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{HEADER_FILL}"/></w:tcPr>'
+    "</w:tblStylePr>"
+    "</w:style>"
+)
+
+
+def ensure_table_style(doc):
+    """Add the HOS table style to ``doc`` unless it is already there."""
+    from docx.oxml.parser import parse_xml
+    styles = doc.styles.element
+    if styles.get_by_id(TABLE_STYLE_ID) is None:
+        styles.append(parse_xml(_TABLE_STYLE_XML))
+
+
+_LAST_CHARACTER_STYLE_ID = list(CHARACTER_STYLES.values())[-1][0]
+
+
+def _character_style_xml(name, style_id, color):
+    return (
+        f'<w:style xmlns:w="{_W_NS}" w:type="character" w:customStyle="1" w:styleId="{style_id}">'
+        f'<w:name w:val="{name}"/>'
+        '<w:basedOn w:val="DefaultParagraphFont"/>'
+        '<w:uiPriority w:val="1"/><w:qFormat/>'
+        f'<w:rPr><w:b/><w:color w:val="{color}"/></w:rPr>'
+        "</w:style>"
+    )
+
+
+def ensure_character_styles(doc):
+    """Add the severity/status character styles to ``doc`` unless they are already there."""
+    from docx.oxml.parser import parse_xml
+    styles = doc.styles.element
+    # They are added together, so the last one present means all are.
+    if styles.get_by_id(_LAST_CHARACTER_STYLE_ID) is not None:
+        return
+    for name, (style_id, color) in CHARACTER_STYLES.items():
+        if styles.get_by_id(style_id) is None:
+            styles.append(parse_xml(_character_style_xml(name, style_id, color)))
+
+
+def character_style_id(name):
+    """The style id of a ``CHARACTER_STYLES`` name; KeyError if unknown."""
+    return CHARACTER_STYLES[name][0]
+
+
+def set_default_font(doc, name, size):
+    """Use ``name`` for Normal text and ``size`` (a Length) as the document default."""
+    from docx.oxml.ns import qn
+    doc.styles["Normal"].font.name = name
+    rpr = doc.styles.element.find(qn("w:docDefaults")).find(qn("w:rPrDefault")).find(qn("w:rPr"))
+    rpr.get_or_add_sz().val = size
@@ -0,0 +1,110 @@
+"""
+Bulk table builder.
+
+Filling a table through python-docx (``table.rows[i].cells[j].text = ...``)
+recomputes the row grid on every ``.cells`` access and rebuilds runs on every
+assignment. ``add_styled_table`` instead emits the whole ``w:tbl`` as one XML
+string and parses it once. All formatting comes from the "HOS Table" style
+(see docgen.styles), so cells carry nothing but their width and text.
+
+``iter_table_xml`` yields the same XML piecewise (table head, one string per
+row, table tail) so very large tables can be written without building the
+whole string.
+"""
+
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from docgen.fragments import adopt, content_end
+from docgen.styles import TABLE_STYLE_ID, character_style_id, ensure_character_styles, ensure_table_style
+
+_NSDECL = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _t(text):
+    space = ' xml:space="preserve"' if text.strip() != text else ""
+    return f"<w:t{space}>{escape(text)}</w:t>"
+
+
+def _run_content(text):
+    """Mirror python-docx's run text setter: tabs and line breaks become elements."""
+    parts = []
+    buf = []
+    for char in text:
+        if char == "\t" or char in "\r\n":
+            if buf:
+                parts.append(_t("".join(buf)))
+                buf = []
+            parts.append("<w:tab/>" if char == "\t" else "<w:br/>")
+        else:
+            buf.append(char)
+    if buf:
+        parts.append(_t("".join(buf)))
+    return "".join(parts)
+
+
+def _cell_xml(tc_pr, text, style=None):
+    r_pr = f'<w:rPr><w:rStyle w:val="{character_style_id(style)}"/></w:rPr>' if style else ""
+    run = f"<w:r>{r_pr}{_run_content(text)}</w:r>" if text else ""
+    return f"<w:tc>{tc_pr}<w:p>{run}</w:p></w:tc>"
+
+
+def iter_table_xml(header, rows, col_twips, style_id=TABLE_STYLE_ID, cell_styles=None):
+    """Yield the XML of a styled table: the head, one string per row, the tail.
+
+    ``cell_styles``, if given, runs parallel to ``rows``: per row, a sequence
+    of character style names (see docgen.styles.CHARACTER_STYLES) or None,
+    one per cell, for severity highlighting; cells past the end of their
+    row's styles are unstyled. The strings use the ``w:`` prefix without
+    declaring it; they are meant to be placed inside a ``w:body``.
+    """
+    cols = len(header)
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr>'
+    grid = f'<w:gridCol w:w="{col_twips}"/>' * cols
+    yield (
+        "<w:tbl><w:tblPr>"
+        f'<w:tblStyle w:val="{style_id}"/><w:tblW w:type="auto" w:w="0"/><w:jc w:val="center"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        f"</w:tblPr><w:tblGrid>{grid}</w:tblGrid>"
+    )
+    yield "<w:tr>" + "".join(_cell_xml(tc_pr, h) for h in header) + "</w:tr>"
+    for i, row in enumerate(rows):
+        if len(row) > cols:
+            raise ValueError(f"row has {len(row)} cells, table has {cols} columns: {row!r}")
+        styles = cell_styles[i] if cell_styles is not None and i < len(cell_styles) else ()
+        cells = [_cell_xml(tc_pr, val, styles[j] if j < len(styles) else None) for j, val in enumerate(row)]
+        cells.extend(_cell_xml(tc_pr, "") for _ in range(cols - len(row)))
+        yield "<w:tr>" + "".join(cells) + "</w:tr>"
+    yield "</w:tbl>"
+
+
+def column_twips(doc, cols):
+    """Width of one column when ``cols`` columns share the text block, as python-docx sizes them."""
+    from docx.shared import Emu, Inches
+    section = doc.sections[-1]
+    page_width = section.page_width or Inches(8.5)
+    left_margin = section.left_margin or Inches(1)
+    right_margin = section.right_margin or Inches(1)
+    width = page_width - left_margin - right_margin
+    return Emu(width // cols).twips
+
+
+def add_styled_table(doc, header, rows, style_id=TABLE_STYLE_ID, cell_styles=None):
+    """Append a header-shaded grid table built in one pass; returns the Table.
+
+    ``cell_styles`` highlights cells as in ``iter_table_xml``.
+    """
+    from docx.oxml.parser import oxml_parser
+    from docx.table import Table
+    if style_id == TABLE_STYLE_ID:
+        ensure_table_style(doc)
+    if cell_styles is not None:
+        ensure_character_styles(doc)
+    xml = "".join(iter_table_xml(header, rows, column_twips(doc, len(header)), style_id, cell_styles))
+    wrapper = etree.fromstring(f"<w:body {_NSDECL}>{xml}</w:body>", oxml_parser)
+    tbl = wrapper[0]
+    body = doc.element.body
+    adopt(body, tbl, content_end(body))
+    return Table(tbl, doc._body)
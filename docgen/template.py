@@ -0,0 +1,47 @@
+"""
+Pre-styled base template for new documents.
+
+``Document()`` re-reads python-docx's default template from its zip and
+parses every part, and each document then needs the same style setup. The
+template here is built once per process and font: default font, the HOS
+table and character styles, only the table styles documents can use (the default
+template ships about a hundred that only bloat styles.xml and every copy of
+it) and fixed core properties (see docgen.reproducible). New documents are
+in-memory copies of its package.
+"""
+
+import copy
+import functools
+
+from docgen.reproducible import normalize_core_properties
+from docgen.styles import TABLE_STYLE_ID, ensure_character_styles, ensure_table_style, set_default_font
+
+KEPT_TABLE_STYLES = ("TableNormal", "TableGrid", TABLE_STYLE_ID)
+
+
+def _prune_table_styles(doc):
+    from docx.enum.style import WD_STYLE_TYPE
+    for style in list(doc.styles):
+        if style.type == WD_STYLE_TYPE.TABLE and style.style_id not in KEPT_TABLE_STYLES:
+            style.delete()
+
+
+@functools.lru_cache(maxsize=None)
+def base_template(font_name, font_size):
+    """The template document for ``font_name``/``font_size``; never render into it."""
+    from docx import Document
+    doc = Document()
+    _prune_table_styles(doc)
+    set_default_font(doc, font_name, font_size)
+    ensure_table_style(doc)
+    ensure_character_styles(doc)
+    normalize_core_properties(doc)
+    return doc
+
+
+def new_document(font_name, font_size):
+    """A fresh document cloned from the cached base template."""
+    # Copy the package rather than the Document object: proxies cached on
+    # the Document may point at sub-elements that deepcopy would detach.
+    package = copy.deepcopy(base_template(font_name, font_size).part.package)
+    return package.main_document_part.document
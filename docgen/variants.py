@@ -0,0 +1,185 @@
+"""
+Batch rendering of parameterized document variants.
+
+A variant table is a CSV file with one variant per row:
+
+    variant,spec,root,platform,pocs
+    manual-linux,poc_manual,/home/dev/HOS13,linux,POC1 POC6
+
+``variant`` names the output file (``<variant>.docx``), ``spec`` the
+document (or ``--spec`` for every row), and the other columns give values
+for the spec's params (see docgen.specs.apply_params); an empty cell keeps
+the default, and list params take items separated by spaces or commas.
+
+Variants mostly share their content, so the parent process does the shared
+work once before any worker exists: it builds the base templates, compiles
+every section of each spec's default variant and renders it into an
+in-memory fragment cache. Workers are then forked (where the platform
+allows) after ``gc.freeze()``, so they read all of that copy-on-write
+instead of each building its own; a worker only compiles and renders the
+sections a variant actually changes. Rows are fed to the pool a bounded
+number at a time and results are reduced to counts, so parent memory does
+not grow with the table, and each worker's fragment cache is capped, so
+neither does theirs. Progress lines report variants per second and the
+largest worker peak RSS.
+"""
+
+import csv
+import gc
+import multiprocessing
+import os
+import re
+import threading
+import time
+
+from docgen.bench import _peak_rss_kb
+from docgen.reproducible import save_docx
+from docgen.specs import apply_params, list_specs, load_spec, param_values
+
+VARIANT_COLUMN = "variant"
+SPEC_COLUMN = "spec"
+PROGRESS_EVERY = 1.0  # seconds between progress lines
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024  # per worker
+
+_VARIANT_NAME = re.compile(r"^[\w.-]+$")
+
+# Set up in the parent before forking (or per worker when spawning).
+_STATE = {}
+
+
+def iter_variants(path, spec_name=None):
+    """Yield ``(variant, spec name, param values)`` per row of the table at ``path``.
+
+    Raises ValueError for a missing column, a bad or repeated variant name,
+    or a missing or unknown spec.
+    """
+    seen = set()
+    specs = set(list_specs())
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or ()
+        if VARIANT_COLUMN not in columns:
+            raise ValueError(f"{path}: missing column {VARIANT_COLUMN!r}")
+        if spec_name is None and SPEC_COLUMN not in columns:
+            raise ValueError(f"{path}: missing column {SPEC_COLUMN!r} (or pass a spec)")
+        params = [column for column in columns if column not in (VARIANT_COLUMN, SPEC_COLUMN)]
+        for line, row in enumerate(reader, start=2):
+            variant = (row[VARIANT_COLUMN] or "").strip()
+            if not _VARIANT_NAME.match(variant):
+                raise ValueError(f"{path}:{line}: variant name {variant!r} is not a plain file name")
+            if variant in seen:
+                raise ValueError(f"{path}:{line}: variant {variant!r} repeated")
+            seen.add(variant)
+            name = spec_name or (row[SPEC_COLUMN] or "").strip()
+            if not name:
+                raise ValueError(f"{path}:{line}: no spec for variant {variant!r}")
+            if name not in specs:
+                raise ValueError(f"{path}:{line}: unknown spec {name!r}")
+            values = {param: (row[param] or "").strip() for param in params if (row[param] or "").strip()}
+            yield variant, name, values
+
+
+def _warm(names, cache_bytes):
+    """Compile and render each spec's default variant into a fresh fragment cache."""
+    from docgen.fragments import FragmentCache
+    from docgen.render import compile_section
+    cache = FragmentCache(cache_bytes)
+    compiled = {}
+    for name in names:
+        spec = load_spec(name)
+        for section in apply_params(spec)["sections"]:
+            entry = compile_section(section)
+            compiled[entry[2]] = entry
+        _plan(spec, {}, compiled).render(cache)
+    _STATE.update(cache=cache, compiled=compiled, names=tuple(names))
+
+
+def _init_worker(names, cache_bytes):
+    if _STATE.get("names") != tuple(names):  # spawned, not forked
+        _warm(names, cache_bytes)
+
+
+def _plan(spec, values, compiled):
+    from docgen.render import compile_spec
+    return compile_spec(apply_params(spec, param_values(spec, values)), compiled)
+
+
+def _render_variant(task):
+    """Render one variant; returns ``(variant, seconds, error, peak RSS KiB)``."""
+    variant, name, values, output_dir = task
+    start = time.perf_counter()
+    try:
+        plan = _plan(load_spec(name), values, _STATE["compiled"])
+        save_docx(plan.render(_STATE["cache"]), os.path.join(output_dir, variant + ".docx"))
+    except Exception as exc:
+        return variant, 0.0, f"{type(exc).__name__}: {exc}", _peak_rss_kb()
+    return variant, time.perf_counter() - start, None, _peak_rss_kb()
+
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
+
+
+def _mb(kb):
+    return "n/a" if kb is None else f"{kb / 1024:.0f} MB"
+
+
+def run_variants(table, output_dir, spec_name=None, names=None, jobs=None, cache_bytes=DEFAULT_CACHE_BYTES):
+    """Render every variant of ``table`` into ``output_dir``; returns an exit status.
+
+    ``names`` are the specs to warm up in the parent (default: every spec
+    the table names). Raises ValueError for a malformed table.
+    """
+    # A first pass checks the whole table before anything is rendered.
+    total = 0
+    seen = []
+    for _variant, name, _values in iter_variants(table, spec_name):
+        total += 1
+        if name not in seen:
+            seen.append(name)
+    names = seen if names is None else names
+    if not total:
+        print(f"No variants in {table}")
+        return 0
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    start = time.perf_counter()
+    _warm(names, cache_bytes)
+    print(f"Warmed {', '.join(names)} in {time.perf_counter() - start:.2f}s "
+          f"({len(_STATE['compiled'])} sections, {_mb(_peak_rss_kb())} RSS)")
+
+    # Bound the rows queued ahead of the workers: Pool would otherwise read
+    # the whole table into its task queue.
+    window = threading.BoundedSemaphore(jobs * 16)
+
+    def tasks():
+        for variant, name, values in iter_variants(table, spec_name):
+            window.acquire()
+            yield variant, name, values, output_dir
+
+    gc.collect()
+    gc.freeze()  # keep the collector from writing to (and so copying) shared pages
+    done = failed = 0
+    peak = None
+    start = last = time.perf_counter()
+    try:
+        with _context().Pool(jobs, _init_worker, (names, cache_bytes)) as pool:
+            for variant, _seconds, error, rss in pool.imap_unordered(_render_variant, tasks(), chunksize=4):
+                window.release()
+                done += 1
+                peak = rss if peak is None or (rss is not None and rss > peak) else peak
+                if error is not None:
+                    failed += 1
+                    print(f"  FAILED  {variant}: {error}")
+                now = time.perf_counter()
+                if now - last >= PROGRESS_EVERY:
+                    last = now
+                    print(f"  {done}/{total} variants, {done / (now - start):.1f}/s, worker peak RSS {_mb(peak)}")
+    finally:
+        gc.unfreeze()
+    seconds = time.perf_counter() - start
+    rate = done / seconds if seconds else 0.0
+    print(f"Rendered {done - failed} of {done} variant(s) into {output_dir} in {seconds:.2f}s "
+          f"({rate:.1f} variants/s, {jobs} worker(s), worker peak RSS {_mb(peak)})")
+    return 1 if failed else 0
@@ -0,0 +1,129 @@
+"""
+Watch mode: rebuild a document as soon as one of its inputs changes.
+
+``watch`` keeps one interpreter running with everything a build would load
+again from scratch -- python-docx, the base template, compiled plans, the
+fragment cache, the package matrix -- and polls the inputs of each document
+(its spec, result dumps, risk registers and POC package.json/lockfiles;
+the same files the build manifest hashes, see docgen.manifest). When one
+changes only that document is rebuilt, in-process: its plan is recompiled
+and only the sections whose content changed are rendered again, so an edit
+to one section is typically back on disk well within a second.
+
+Polling uses (mtime, size) only, so it needs no platform file-event API.
+Edits to the rendering modules themselves are reported but need a restart,
+since the running code cannot be swapped safely.
+"""
+
+import os
+import time
+
+from docgen.build import _build_one, _label, build
+from docgen.manifest import RENDER_MODULES, Manifest, input_hash, input_sources
+from docgen.results import sources_signature
+from docgen.specs import load_spec, spec_path, validate_spec
+
+DEFAULT_INTERVAL = 0.25  # seconds between polls
+SETTLE = 0.05  # seconds to wait for an editor to finish writing
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def watched_files(name):
+    """The spec of ``name`` and every data file it reads."""
+    return [spec_path(name)] + input_sources(load_spec(name))
+
+
+def _signature(name):
+    """(mtime, size) of every input of ``name``; a string if they cannot be read."""
+    try:
+        return sources_signature(watched_files(name))
+    except (OSError, ValueError) as exc:  # a file mid-save, malformed JSON
+        return f"error: {exc}"
+
+
+def _code_signature():
+    return sources_signature([os.path.join(_PACKAGE_DIR, module) for module in RENDER_MODULES])
+
+
+def _rebuild(name, output_dir, manifest, formats, cache_bytes, stream):
+    """Rebuild every format of ``name``; returns True if all succeeded."""
+    try:
+        errors = validate_spec(load_spec(name))
+    except (OSError, ValueError) as exc:
+        errors = [str(exc)]
+    if errors:
+        print(f"  {name}: not rebuilt, {len(errors)} problem(s)")
+        for error in errors:
+            print(f"    {error}")
+        return False
+    ok = True
+    digest = input_hash(name)
+    for fmt in formats:
+        try:
+            filepath, seconds = _build_one(name, output_dir, cache_bytes, stream, False, fmt)
+        except Exception as exc:
+            ok = False
+            print(f"  FAILED  {_label(name, fmt)}: {exc}")
+        else:
+            same = manifest.record(name, digest, fmt)
+            print(f"  {seconds:7.2f}s  {_label(name, fmt)} -> {filepath}" + (" (identical)" if same else ""))
+    manifest.save()
+    return ok
+
+
+def watch(names, output_dir, formats=("docx",), cache_bytes=None, stream=False, interval=DEFAULT_INTERVAL,
+          polls=None):
+    """Build ``names`` once, then rebuild each one whenever its inputs change.
+
+    Runs until interrupted, or for ``polls`` polls when given. Returns an
+    exit status: 1 if the last build of any document failed.
+    """
+    if cache_bytes is None:
+        from docgen.fragments import DEFAULT_MAX_BYTES
+        cache_bytes = DEFAULT_MAX_BYTES
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = Manifest.load(output_dir)
+    signatures = {name: _signature(name) for name in names}
+    code = _code_signature()
+    failed = set()
+
+    # Initial build: whatever the manifest says is stale, in-process so the
+    # caches it fills stay warm for the rebuilds.
+    digests = {name: input_hash(name) for name in names}
+    stale = [(name, fmt) for name in names for fmt in formats if not manifest.is_current(name, digests[name], fmt)]
+    for name, fmt, filepath, seconds, error in build(stale, output_dir, 1, cache_bytes, stream):
+        if error is not None:
+            failed.add(name)
+            print(f"  FAILED  {_label(name, fmt)}: {error}")
+        else:
+            manifest.record(name, digests[name], fmt)
+            print(f"  {seconds:7.2f}s  {_label(name, fmt)} -> {filepath}")
+    manifest.save()
+    print(f"Watching {len(names)} document(s) every {interval:g}s; Ctrl-C to stop")
+
+    count = 0
+    try:
+        while polls is None or count < polls:
+            count += 1
+            time.sleep(interval)
+            current = _code_signature()
+            if current != code:
+                code = current
+                print("docgen source changed; restart watch to render with it")
+            changed = [name for name in names if _signature(name) != signatures[name]]
+            if not changed:
+                continue
+            time.sleep(SETTLE)
+            for name in changed:
+                signatures[name] = _signature(name)
+                start = time.perf_counter()
+                print(f"{time.strftime('%H:%M:%S')} {name} changed")
+                if _rebuild(name, output_dir, manifest, formats, cache_bytes, stream):
+                    failed.discard(name)
+                    print(f"  rebuilt in {time.perf_counter() - start:.2f}s")
+                else:
+                    failed.add(name)
+    except KeyboardInterrupt:
+        print()
+    return 1 if failed else 0
@@ -2,539 +2,26 @@
 Generate Version 2 Word Documents for HOS-13:
 1. Family OS React Native Library Evaluation Report v2
 2. Family OS Technical Blockers & Mitigation Report v2
-"""
-
-from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.style import WD_STYLE_TYPE
-import os
-
-OUTPUT_DIR = r"d:\Data_Delimited\Family_OS\jira\HOS13"
-
-
-def set_cell_shading(cell, color_hex):
-    """Set cell background color."""
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color_hex)
-    shading.set(qn('w:val'), 'clear')
-    cell._tc.get_or_add_tcPr().append(shading)
-
-
-def style_table(table):
-    """Apply consistent styling to a table."""
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    for row_idx, row in enumerate(table.rows):
-        for cell in row.cells:
-            for paragraph in cell.paragraphs:
-                paragraph.paragraph_format.space_before = Pt(2)
-                paragraph.paragraph_format.space_after = Pt(2)
-                for run in paragraph.runs:
-                    run.font.size = Pt(9)
-            if row_idx == 0:
-                set_cell_shading(cell, "2C3E50")
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-                        run.font.bold = True
-
-
-def add_severity_text(paragraph, severity):
-    """Add colored severity text."""
-    run = paragraph.add_run(severity)
-    run.font.bold = True
-    run.font.size = Pt(9)
-    if severity in ("HIGH", "CRITICAL"):
-        run.font.color.rgb = RGBColor(192, 0, 0)
-    elif severity == "MEDIUM":
-        run.font.color.rgb = RGBColor(196, 120, 0)
-    elif severity == "LOW":
-        run.font.color.rgb = RGBColor(0, 128, 0)
-    elif severity in ("GO", "WORKING", "PASS"):
-        run.font.color.rgb = RGBColor(0, 128, 0)
-    elif severity in ("PARTIAL", "BLOCKED"):
-        run.font.color.rgb = RGBColor(192, 0, 0)
 
+The content lives in docgen/specs/library_eval_v2.json and
+docgen/specs/blockers_v2.json; docgen.render turns them into .docx files.
+"""
 
-def add_colored_text(paragraph, text, color_rgb, bold=False, size=None):
-    run = paragraph.add_run(text)
-    run.font.color.rgb = color_rgb
-    run.font.bold = bold
-    if size:
-        run.font.size = Pt(size)
-    return run
+from docgen.render import (  # noqa: F401 -- helpers re-exported for existing callers
+    OUTPUT_DIR,
+    add_colored_text,
+    add_severity_text,
+    render_to_file,
+    set_cell_shading,
+    style_table,
+)
 
 
 # ============================================================
 # DOCUMENT 1: React Native Library Evaluation Report v2
 # ============================================================
-def generate_library_eval_v2():
-    doc = Document()
-
-    # Configure default style
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = 'Calibri'
-    font.size = Pt(11)
-
-    # === TITLE PAGE ===
-    for _ in range(6):
-        doc.add_paragraph("")
-
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = title.add_run("Family OS")
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(44, 62, 80)
-
-    subtitle = doc.add_paragraph()
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = subtitle.add_run("React Native Library Evaluation Report")
-    run.font.size = Pt(22)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(44, 62, 80)
-
-    doc.add_paragraph("")
-
-    version = doc.add_paragraph()
-    version.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = version.add_run("Version 2.0 | February 17, 2026")
-    run.font.size = Pt(12)
-    run.font.color.rgb = RGBColor(100, 100, 100)
-
-    doc.add_paragraph("")
-
-    # Update badge
-    update_note = doc.add_paragraph()
-    update_note.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = update_note.add_run("UPDATED WITH POC/SPIKE VALIDATION RESULTS")
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 128, 0)
-
-    doc.add_paragraph("")
-
-    details = doc.add_paragraph()
-    details.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    details.add_run("Technical Stack: React Native (Expo Development Builds) + TypeScript 5.x\n").font.size = Pt(10)
-    details.add_run("Target Platforms: iOS 13+ / Android API 23+\n").font.size = Pt(10)
-    details.add_run("Backend: Bun + Hono + tRPC + Drizzle ORM + PostgreSQL + Redis\n").font.size = Pt(10)
-    details.add_run("AI: Gemini (MCP, A2UI, A2A)\n").font.size = Pt(10)
-    details.add_run("POC Environment: React Native 0.81.5 | Expo SDK 54 | Android (arm64-v8a)").font.size = Pt(10)
-
-    doc.add_page_break()
-
-    # === SECTION 1: EXECUTIVE SUMMARY ===
-    doc.add_heading("1. Executive Summary", level=1)
-
-    doc.add_paragraph(
-        "This report provides a comprehensive evaluation of React Native libraries required to implement "
-        "Family OS, a unified household coordination platform combining calendar management, task tracking, "
-        "shared lists, expense tracking, document vault, family feed, and meal planning capabilities. "
-        "The evaluation focuses on production-ready libraries compatible with Expo Development Builds "
-        "targeting iOS 13+ and Android API 23+."
-    )
-
-    doc.add_paragraph("")
-
-    # V2 UPDATE BOX
-    update_heading = doc.add_heading("Version 2.0 Update: POC/Spike Validation Completed", level=2)
-
-    doc.add_paragraph(
-        "This Version 2 report incorporates hands-on POC (Proof of Concept) and spike testing results "
-        "conducted February 14-17, 2026 under JIRA task HOS-13. Six dedicated POC projects were built "
-        "and tested on physical Android devices using Expo Development Builds. The results validate, "
-        "correct, and extend the theoretical analysis from Version 1.0."
-    )
-
-    doc.add_paragraph("POC Projects Executed:", style='List Bullet')
-    poc_list = [
-        "POC1-Calendar: expo-calendar + react-native-calendars + react-native-big-calendar",
-        "POC2-PDFViewer: react-native-pdf + react-native-blob-util",
-        "POC3-CameraOCR: expo-camera + @react-native-ml-kit/text-recognition",
-        "POC4-Encryption: react-native-quick-crypto + expo-secure-store (BLOCKED -- Nitro Module failure)",
-        "POC5-WebSocket: Native WebSocket API + Zustand state management",
-        "POC6-NobleCiphers: @noble/ciphers + expo-crypto + expo-secure-store (VALIDATED -- All 5 tests passed)",
-    ]
-    for item in poc_list:
-        doc.add_paragraph(item, style='List Bullet 2')
-
-    doc.add_paragraph("")
-
-    doc.add_heading("Key Findings (Updated from V1):", level=3)
-
-    findings = [
-        ("External Calendar Sync: ", "VALIDATED via POC1. ", "expo-calendar v15.0.8 confirmed working for device-local calendar access (permissions, read/write events, recurring events). Calendar UI packages (react-native-calendars v1.1314.0 for month view, react-native-big-calendar v4.19.0 for week/timeline view) render correctly with color-coded family member dots and overlap detection. Note: react-native-calendar-events (recommended in Calendar Packages Analysis) is DEPRECATED and incompatible -- replaced with expo-calendar."),
-        ("Document Handling: ", "VALIDATED via POC2. ", "react-native-pdf v7.0.3 (updated from v6.7.5 in V1 report) confirmed working with Expo config plugins. Tested with 1-page simple PDF, 6-page W-9 form, and 100+ page tax instructions. Pinch-to-zoom, multi-page scrolling, and load timing all functional. Requires Development Build (not Expo Go)."),
-        ("OCR: ", "VALIDATED via POC3. ", "@react-native-ml-kit/text-recognition v2.0.0 (updated from v0.11.1 in V1 report) provides on-device OCR with excellent accuracy. Camera capture via expo-camera v17.0.10 and gallery selection via expo-image-picker v17.0.10 both functional. OCR extracts text blocks with coordinates, line details, and character counts."),
-        ("Encryption (Primary): ", "BLOCKED via POC4. ", "react-native-quick-crypto v1.0.11 encountered persistent runtime crash 'Cannot read property PKCS1 of undefined' due to Nitro Module initialization failure (UNRESOLVED despite 7 fix attempts). See Technical Blockers Report V2 for full error documentation."),
-        ("Encryption (Fallback): ", "VALIDATED via POC6. ", "@noble/ciphers v1.3.0 (pure JavaScript, Cure53-audited, 593K+ weekly npm downloads) confirmed fully working on physical Android device. POC6-NobleCiphers executed 5 tests: (1) Random Bytes Generation -- PASS, (2) AES-256-GCM Encrypt/Decrypt Round-Trip -- PASS, (3) Wrong Key / Tampered Data / Wrong Nonce Detection -- PASS, (4) Secure Store Integration with expo-secure-store -- PASS, (5) Performance Benchmark (100B to 100KB) -- PASS. Required crypto-polyfill using expo-crypto for Hermes engine compatibility (React Native's Hermes does not provide Web Crypto API). @noble/ciphers is the RECOMMENDED encryption library for Family OS Document Vault."),
-        ("Real-time Sync: ", "VALIDATED via POC5. ", "React Native's built-in WebSocket API works seamlessly with Zustand v5.0.11 (updated from v4.x in V1 report) for state management. Echo server testing confirmed send/receive, JSON parsing, and auto-reconnect capabilities. No additional WebSocket library needed."),
-    ]
-
-    for label, status, detail in findings:
-        p = doc.add_paragraph()
-        run = p.add_run(label)
-        run.font.bold = True
-        run = p.add_run(status)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(0, 128, 0) if "VALIDATED" in status and "PARTIALLY" not in status else RGBColor(196, 120, 0)
-        p.add_run(detail)
-
-    doc.add_page_break()
-
-    # === SECTION 2: POC RESULTS SUMMARY ===
-    doc.add_heading("2. POC/Spike Validation Results", level=1)
-
-    doc.add_paragraph(
-        "Six separate Expo + TypeScript projects were created, each targeting a specific critical area "
-        "identified in the V1 report. All POCs used React Native 0.81.5, Expo SDK 54.0.33, and TypeScript 5.9.2. "
-        "Testing was performed on physical Android devices with Development Builds (not Expo Go). "
-        "POC6 was created as a dedicated validation of @noble/ciphers after POC4's react-native-quick-crypto "
-        "encountered an unresolved Nitro Module failure."
-    )
-
-    # === POC1 ===
-    doc.add_heading("2.1 POC1: Calendar (expo-calendar + UI Packages)", level=2)
-
-    table = doc.add_table(rows=7, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "GO -- Fully Working"),
-        ("Libraries Tested", "expo-calendar v15.0.8, react-native-calendars v1.1314.0, react-native-big-calendar v4.19.0, react-native-paper v5.15.0, dayjs v1.11.19"),
-        ("Tests Performed", "Calendar permissions, list device calendars, read events, create events, recurring events, month view with colored dots, week/timeline view with overlap detection"),
-        ("Key Findings", "expo-calendar works perfectly for device-local calendar sync. react-native-calendars renders month view with multi-dot color coding per family member. react-native-big-calendar renders week/timeline with overlapping event support and swipe navigation."),
-        ("V1 Correction", "react-native-calendar-events (recommended in Calendar Packages Analysis doc) is DEPRECATED (~5 years old). Replaced with expo-calendar as the recommended device calendar API."),
-        ("Production Recommendation", "Use expo-calendar for device calendar integration. Use react-native-calendars for month view UI. Use react-native-big-calendar for week/day/timeline views. All three are production-ready."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # === POC2 ===
-    doc.add_heading("2.2 POC2: PDF Viewer (react-native-pdf)", level=2)
-
-    table = doc.add_table(rows=7, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "GO -- Fully Working"),
-        ("Libraries Tested", "react-native-pdf v7.0.3, react-native-blob-util v0.24.7, @config-plugins/react-native-pdf v12.0.0, @config-plugins/react-native-blob-util v12.0.0"),
-        ("Tests Performed", "Simple PDF (1 page), W-9 form (6 pages with form fields), tax instructions (100+ pages). Tested: load timing, pinch-to-zoom, multi-page scrolling, modal overlay preview, error handling."),
-        ("Key Findings", "react-native-pdf v7.0.3 works reliably with Expo Development Builds via config plugins. Load timing measured for performance baseline. Large documents (100+ pages) scroll smoothly."),
-        ("V1 Correction", "Version updated from ~6.7.5 (V1) to 7.0.3 (actual tested version). Config plugins (@config-plugins/react-native-pdf, @config-plugins/react-native-blob-util) are REQUIRED for Expo compatibility -- not mentioned in V1."),
-        ("Production Recommendation", "Use react-native-pdf v7.0.3 with config plugins for Document Vault PDF preview. Requires Development Build. Implement fallback 'Download PDF' button for edge cases."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # === POC3 ===
-    doc.add_heading("2.3 POC3: Camera + OCR (expo-camera + ML Kit)", level=2)
-
-    table = doc.add_table(rows=7, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "GO -- Fully Working"),
-        ("Libraries Tested", "@react-native-ml-kit/text-recognition v2.0.0, expo-camera v17.0.10, expo-image-picker v17.0.10, expo-media-library v18.2.1"),
-        ("Tests Performed", "Camera capture, gallery image selection, ML Kit OCR text extraction, text block coordinate extraction, processing time measurement, block-level detail logging."),
-        ("Key Findings", "On-device ML Kit OCR provides fast, accurate text extraction. Processing time measured in milliseconds. Extracts text blocks with coordinates, line details, and character counts. Both camera and gallery input paths work. 3-screen workflow (Home -> Camera -> Results) validated."),
-        ("V1 Correction", "Version updated from ~0.11.1 (V1) to 2.0.0 (actual tested version) for @react-native-ml-kit/text-recognition. expo-camera updated from ~15.0.14 to 17.0.10. expo-image-picker updated from ~15.0.7 to 17.0.10."),
-        ("Production Recommendation", "Use @react-native-ml-kit/text-recognition v2.0.0 for receipt/invitation OCR. Combine with Gemini AI for structured data extraction (merchant, items, amounts, dates). On-device processing means no cloud costs for OCR step."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # === POC4 ===
-    doc.add_heading("2.4 POC4: Encryption (react-native-quick-crypto + @noble/ciphers)", level=2)
-
-    table = doc.add_table(rows=11, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "BLOCKED (Primary Library) -- Fallback Library Identified"),
-        ("Primary Library", "react-native-quick-crypto v1.0.11 (Nitro Modules / native C++ via JSI)"),
-        ("Fallback Library", "@noble/ciphers (pure JavaScript, audited, no native module required)"),
-        ("Supporting Libraries", "expo-secure-store v15.0.8, expo-build-properties v1.0.10"),
-        ("Tests Designed", "Random bytes generation, AES-256-GCM encrypt/decrypt round-trip, wrong key detection (Issue #798), secure key storage with expo-secure-store, performance testing (100B to 100KB). Tests could NOT be executed due to persistent runtime error. NOTE: These same 5 tests were successfully executed in POC6 using @noble/ciphers -- all PASSED."),
-        ("Error 1: Build Failure (RESOLVED)", "CMake/ninja infinite loop: 'ninja: error: manifest build.ninja still dirty after 100 tries'. Affected armeabi-v7a (32-bit ARM) architecture only on Windows. Known react-native-quick-crypto bug with Nitro Module CMake configuration.\n\nFIX: Build for arm64-v8a only:\ngradlew.bat app:installDebug -PreactNativeArchitectures=arm64-v8a -x lint -x test\n\nThis error is RESOLVED. Modern Android devices (2018+) all support arm64-v8a."),
-        ("Error 2: Runtime Crash (UNRESOLVED)", "TypeError: Cannot read property 'PKCS1' of undefined. The Nitro Module (native C++ crypto engine) compiles successfully but fails to initialize at JavaScript runtime. The app crashes immediately when any crypto function is called.\n\nAll attempted fixes FAILED:\n1. Added react-native-quick-crypto to app.json plugins array\n2. Installed expo-build-properties v1.0.10\n3. Enabled Hermes JS engine (jsEngine: hermes in app.json)\n4. Deleted android/.cxx, android/build, android/app/build directories\n5. Deleted entire android folder and ran npx expo prebuild --clean\n6. Multiple full native rebuilds with arm64-v8a flag\n7. Verified: nitro-modules v0.33.9 installed, quick-crypto in gradle dependency tree, Hermes enabled in gradle.properties, native .so files present\n\nDespite all fixes, the Nitro Module native code compiles but fails to bind to the JavaScript runtime. This is classified as a PERSISTENT TECHNICAL BLOCKER."),
-        ("Recommended Fallback: @noble/ciphers", "@noble/ciphers is a pure JavaScript cryptography library that provides AES-256-GCM encryption without requiring any native modules.\n\nKey advantages:\n- Pure JS: No native build issues, works in Expo Go AND Development Builds\n- Audited: Independently security-audited by Cure53\n- Popular: 593,000+ weekly npm downloads\n- Full AES-256-GCM support: encrypt, decrypt, auth tag verification\n- Tree-shakeable: Import only what you need (minimal bundle impact)\n- Used in production E2E encryption apps\n- Part of the @noble ecosystem (noble-hashes, noble-curves)\n- Zero dependencies\n\nCombine with expo-secure-store for key storage (iOS Keychain / Android KeyStore)."),
-        ("V1 Correction", "Version updated from ~0.7.5 (V1) to 1.0.11 (actual version). The v1.0.x release introduced Nitro Modules architecture (native C++ via JSI), a complete rewrite from the v0.7.x NativeModule approach. V1 did not anticipate the Nitro Module initialization issues or the need for expo-build-properties as a dependency."),
-        ("Production Recommendation", "DUAL-PATH APPROACH:\n\nPath A (If resolved): If react-native-quick-crypto's Nitro Module initialization issue is fixed in a future release (or a working configuration is found), re-adopt it as the primary encryption library for maximum performance (native C++ crypto operations).\n\nPath B (Recommended for now): Use @noble/ciphers as the encryption library. It provides the same AES-256-GCM functionality as a pure JavaScript implementation with no native module dependencies. While slightly slower than native crypto for very large files, it is more than sufficient for Family OS Document Vault use cases (typical document sizes under 10MB).\n\nBoth paths use expo-secure-store for key storage."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # === POC5 ===
-    doc.add_heading("2.5 POC5: WebSocket + Zustand (Real-time Sync)", level=2)
-
-    table = doc.add_table(rows=7, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "GO -- Fully Working"),
-        ("Libraries Tested", "Native WebSocket API (built-in), Zustand v5.0.11"),
-        ("Tests Performed", "WebSocket connection to echo servers (Postman Echo, WebSocket.org), text message send/receive, structured JSON family update messages, auto-reconnect on connection loss, Zustand store updates from WebSocket messages, connection status tracking, message history."),
-        ("Key Findings", "React Native's built-in WebSocket works out of the box -- no third-party library needed. Zustand v5.0.11 integrates seamlessly for state management. Auto-reconnect and message type classification (sent/received/system) work as expected. Reconnect count tracking functional."),
-        ("V1 Correction", "Zustand version updated from 4.x (V1) to 5.0.11 (actual tested version). V1 listed 'Native WebSocket + Zustand' as MEDIUM risk -- POC confirms it is LOW risk with straightforward implementation."),
-        ("Production Recommendation", "Use React Native's built-in WebSocket API with Zustand for real-time family sync. Implement exponential backoff for reconnection. Use Bun's native WebSocket server on backend for optimal performance. No additional WebSocket client library required."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # === POC6 ===
-    doc.add_heading("2.6 POC6: Encryption Fallback (@noble/ciphers + expo-crypto)", level=2)
-
-    table = doc.add_table(rows=13, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Aspect", "Details"),
-        ("Status", "GO -- Fully Working (All 5 Tests PASSED)"),
-        ("Libraries Tested", "@noble/ciphers v1.3.0, expo-crypto v14.1.5, expo-secure-store v15.0.8"),
-        ("Purpose", "Validate @noble/ciphers as a working encryption fallback after POC4's react-native-quick-crypto was blocked by persistent Nitro Module PKCS1 initialization failure. POC6 executes the same 5 encryption tests designed for POC4."),
-        ("Test 1: Random Bytes Generation", "PASS. Generated 16, 32, and 64-byte random values using @noble/ciphers randomBytes (backed by expo-crypto polyfill). Verified uniqueness across multiple generations. Validates that cryptographically secure random number generation works correctly for key and nonce generation in Document Vault."),
-        ("Test 2: AES-256-GCM Encrypt/Decrypt Round-Trip", "PASS. Encrypted test data ('Hello, Family OS! Sensitive document content here...') with AES-256-GCM using a 256-bit key and 12-byte nonce. Decrypted ciphertext matched original plaintext exactly. Verified ciphertext differs from plaintext (encryption is real). This is the core encryption operation for Document Vault file encryption."),
-        ("Test 3: Wrong Key / Tampered Data / Wrong Nonce Detection", "PASS. Three sub-tests:\n(a) Decryption with wrong key correctly THREW an error (auth tag verification failed)\n(b) Decryption of tampered ciphertext correctly THREW an error\n(c) Decryption with wrong nonce correctly THREW an error\n\nThis proves @noble/ciphers handles GCM authentication tag verification correctly by default -- unlike react-native-quick-crypto's Issue #798 where decipher.final() may NOT throw. No additional application-level mitigation needed."),
-        ("Test 4: Secure Store Integration", "PASS. Generated AES-256 key, stored in expo-secure-store (iOS Keychain / Android KeyStore), retrieved from secure store, used retrieved key to decrypt previously encrypted data. Validates the full key management workflow for Document Vault: generate key -> store securely -> retrieve -> decrypt."),
-        ("Test 5: Performance Benchmark", "PASS. Measured encrypt/decrypt timing for four payload sizes:\n- 100 bytes: Sub-millisecond (instant)\n- 1 KB: Sub-millisecond (instant)\n- 10 KB: Sub-millisecond (instant)\n- 100 KB: Low single-digit milliseconds\n\nPerformance is more than sufficient for Family OS Document Vault use cases (typical documents under 10MB). Note: expo-crypto has a 1024-byte limit per getRandomBytes() call -- the crypto-polyfill chunks larger requests automatically."),
-        ("Polyfill Requirement", "React Native's Hermes JavaScript engine does NOT provide the Web Crypto API (crypto.getRandomValues). A crypto-polyfill.ts file was created that uses expo-crypto (OS-level CSPRNG: SecRandomCopyBytes on iOS, java.security.SecureRandom on Android) to polyfill globalThis.crypto.getRandomValues. This polyfill MUST be imported before any @noble/ciphers imports. The polyfill also handles expo-crypto's 1024-byte-per-call limit by chunking larger requests."),
-        ("Project Relevance to Family OS", "Document Vault requires AES-256-GCM encryption for sensitive family documents (tax returns, medical records, legal documents, insurance policies). POC6 validates that @noble/ciphers can:\n- Generate cryptographically secure keys and nonces\n- Encrypt/decrypt documents with AES-256-GCM\n- Detect tampering, wrong keys, and wrong nonces (security)\n- Integrate with expo-secure-store for key management\n- Handle documents up to 100KB+ with acceptable performance"),
-        ("V1 Correction", "@noble/ciphers was listed as 'latest' in V1 package stack. Actual tested and confirmed version is 1.3.0. Added expo-crypto v14.1.5 as a required dependency for the Hermes polyfill (not mentioned in V1)."),
-        ("Production Recommendation", "Use @noble/ciphers v1.3.0 as the PRIMARY encryption library for Family OS Document Vault. Combined with expo-crypto for random bytes and expo-secure-store for key storage, this provides a complete encryption solution with no native module dependencies. Create an EncryptionService abstraction layer to allow future swapping to react-native-quick-crypto if its Nitro Module issue is resolved. Include crypto-polyfill.ts in the project entry point (before any crypto imports)."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 3: UPDATED PACKAGE STACK ===
-    doc.add_heading("3. Updated Recommended Package Stack (V2)", level=1)
-
-    doc.add_paragraph(
-        "This section updates the V1 package recommendations with actual tested versions from the POC/spike "
-        "validation. Changes from V1 are highlighted. All versions listed have been verified to work with "
-        "React Native 0.81.5 and Expo SDK 54."
-    )
-
-    table = doc.add_table(rows=28, cols=6)
-    table.style = 'Table Grid'
-    headers = ["Feature Area", "Selected Library", "V1 Version", "V2 Tested Version", "POC", "Notes"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    rows_data = [
-        ("Calendar Sync (MVP)", "expo-calendar", "~13.0.0", "15.0.8", "POC1", "UPDATED. Device-local sync confirmed working."),
-        ("Calendar UI (Month)", "react-native-calendars", "N/A", "1.1314.0", "POC1", "NEW. Color-coded dots, date selection."),
-        ("Calendar UI (Week)", "react-native-big-calendar", "4.19.0", "4.19.0", "POC1", "Verified. Week/day/timeline views."),
-        ("Calendar Sync (Post-MVP)", "Google Calendar API + MS Graph", "v3 / v1.0", "v3 / v1.0", "--", "No change. Custom implementation."),
-        ("PDF Viewing", "react-native-pdf", "~6.7.5", "7.0.3", "POC2", "UPDATED. Requires config plugins."),
-        ("PDF Blob Util", "react-native-blob-util", "N/A", "0.24.7", "POC2", "NEW. Required dependency for PDF."),
-        ("File Storage", "expo-file-system + GCS", "~17.0.1", "~17.0.1", "--", "No change."),
-        ("File Picking", "expo-document-picker", "~12.0.2", "~12.0.2", "--", "No change."),
-        ("File Sharing", "expo-sharing", "~12.0.1", "~12.0.1", "--", "No change."),
-        ("OCR Engine", "@react-native-ml-kit/text-recognition", "~0.11.1", "2.0.0", "POC3", "MAJOR UPDATE. v2 confirmed working."),
-        ("Camera", "expo-camera", "~15.0.14", "17.0.10", "POC3", "UPDATED."),
-        ("Image Picker", "expo-image-picker", "~15.0.7", "17.0.10", "POC3", "UPDATED."),
-        ("Image Editing", "expo-image-manipulator", "~12.0.5", "~12.0.5", "--", "No change."),
-        ("Encryption (Primary)", "react-native-quick-crypto", "~0.7.5", "1.0.11", "POC4", "BLOCKED. Nitro Module PKCS1 init failure. See blockers."),
-        ("Encryption (Fallback/Recommended)", "@noble/ciphers", "N/A", "1.3.0", "POC6", "NEW. Pure JS, Cure53-audited, AES-256-GCM. VALIDATED in POC6 (all 5 tests passed). Recommended as primary."),
-        ("Crypto Polyfill", "expo-crypto", "N/A", "14.1.5", "POC6", "NEW. Required for Hermes engine polyfill (crypto.getRandomValues). OS-level CSPRNG."),
-        ("Key Storage", "expo-secure-store", "~13.0.2", "15.0.8", "POC4/6", "UPDATED. Validated in POC6 for @noble/ciphers key storage."),
-        ("Build Properties", "expo-build-properties", "N/A", "1.0.10", "POC4", "NEW. Required for quick-crypto (if used)."),
-        ("Biometric Auth", "expo-local-authentication", "~14.0.1", "~14.0.1", "--", "No change."),
-        ("Charts", "victory-native", "~37.3.2", "~41.x+", "--", "UPDATED version note. Requires @shopify/react-native-skia."),
-        ("State Management", "Zustand", "4.x", "5.0.11", "POC5", "MAJOR UPDATE. v5 confirmed working."),
-        ("Real-time Sync", "Native WebSocket", "Built-in", "Built-in", "POC5", "Confirmed. No library needed."),
-        ("Text-to-Speech", "expo-speech", "~12.0.2", "~12.0.2", "--", "No change."),
-        ("Audio Recording", "expo-av", "~14.0.7", "~14.0.7", "--", "No change."),
-        ("Date/Time", "date-fns + date-fns-tz", "~4.1.0 / ~3.2.0", "~4.1.0 / ~3.2.0", "--", "No change."),
-        ("Local Database", "@op-engineering/op-sqlite", "~9.0.0", "~9.0.0", "--", "No change."),
-    ]
-    for i, row_data in enumerate(rows_data):
-        for j, val in enumerate(row_data):
-            table.rows[i + 1].cells[j].text = val
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 4: V1 DOCUMENT CORRECTIONS ===
-    doc.add_heading("4. V1 Document Corrections Applied", level=1)
-
-    doc.add_paragraph(
-        "During POC testing, the following issues from the V1 report and supporting documents were identified "
-        "and corrected in this V2 release:"
-    )
-
-    table = doc.add_table(rows=11, cols=4)
-    table.style = 'Table Grid'
-    headers = ["#", "Issue", "V1 Value", "V2 Correction"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    corrections = [
-        ("1", "Calendar library recommendation inconsistency", "Library Eval recommends expo-calendar; Calendar Packages Analysis recommends react-native-calendar-events", "CORRECTED: expo-calendar is the correct choice. react-native-calendar-events is deprecated (~5 years old) and incompatible with Expo SDK 52+."),
-        ("2", "Calendar Packages Analysis scoring", "react-native-calendar-events rated 'Production Grade 5/5', 'Last Update: November 2024'", "CORRECTED: Rating and date were inaccurate. Library is unmaintained. Replaced with expo-calendar recommendation."),
-        ("3", "react-native-quick-crypto version", "Listed as ~0.7.5", "CORRECTED: Actual current version is 1.0.11. Major version jump with breaking changes (Nitro Modules)."),
-        ("4", "victory-native version", "Listed as ~37.3.2", "CORRECTED: Victory Native XL has moved to 41.x+. Requires @shopify/react-native-skia as peer dependency (not mentioned in V1)."),
-        ("5", "@shopify/react-native-skia dependency", "Not mentioned", "ADDED: victory-native requires Skia. This adds ~2MB to bundle size and requires native build."),
-        ("6", "react-native-pdf version", "Listed as ~6.7.5", "CORRECTED: Actual tested version is 7.0.3. Requires @config-plugins/react-native-pdf and @config-plugins/react-native-blob-util."),
-        ("7", "Encryption blocker #798", "Not documented in Technical Blockers Report", "ADDED to Technical Blockers Report V2: Wrong key may not throw error on decipher.final(). Needs application-level auth tag verification. Note: @noble/ciphers handles this correctly (confirmed in POC6 Test 3)."),
-        ("8", "Missing POC4 build/runtime errors", "Not applicable (V1 was theoretical)", "ADDED to Technical Blockers Report V2: Two new blockers -- CMake ninja loop on Windows (RESOLVED) and Nitro Module PKCS1 initialization failure (UNRESOLVED despite all fixes). @noble/ciphers validated via POC6."),
-        ("9", "@noble/ciphers version", "Listed as 'latest' (no specific version)", "CORRECTED: Actual tested and validated version is 1.3.0 (confirmed working in POC6 with all 5 tests passing)."),
-        ("10", "expo-crypto dependency not mentioned", "Not mentioned in V1", "ADDED: expo-crypto v14.1.5 is REQUIRED for the Hermes engine crypto polyfill. Provides OS-level CSPRNG for globalThis.crypto.getRandomValues. Has 1024-byte limit per call (polyfill handles chunking)."),
-    ]
-    for i, (num, issue, v1, v2) in enumerate(corrections):
-        table.rows[i + 1].cells[0].text = num
-        table.rows[i + 1].cells[1].text = issue
-        table.rows[i + 1].cells[2].text = v1
-        table.rows[i + 1].cells[3].text = v2
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 5: TECHNICAL CONFIDENCE (UPDATED) ===
-    doc.add_heading("5. Technical Confidence Assessment (Updated)", level=1)
-
-    doc.add_heading("5.1 Overall Feasibility", level=2)
-    p = doc.add_paragraph()
-    p.add_run("Confidence Level: ").font.bold = True
-    add_colored_text(p, "HIGH (Upgraded from V1)", RGBColor(0, 128, 0), bold=True)
-
-    doc.add_paragraph(
-        "POC validation has significantly increased confidence from the V1 theoretical assessment. 5 out of 6 "
-        "POCs passed validation. POC4 (react-native-quick-crypto) encountered a persistent Nitro Module "
-        "initialization failure. However, POC6 was created specifically to validate @noble/ciphers as the "
-        "encryption fallback -- all 5 encryption tests PASSED on physical Android device, confirming that "
-        "AES-256-GCM encryption, auth tag verification, secure key storage integration, and performance "
-        "benchmarks all work correctly. With POC6's validation, ALL critical functional areas now have "
-        "confirmed working solutions. All POC code (POC1 through POC6) is available in the repository."
-    )
-
-    doc.add_heading("5.2 POC Verdict Summary", level=2)
-
-    table = doc.add_table(rows=7, cols=4)
-    table.style = 'Table Grid'
-    headers = ["POC", "Area", "Verdict", "Production Risk"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    verdicts = [
-        ("POC1", "Calendar Sync + UI", "GO", "LOW"),
-        ("POC2", "PDF Viewer", "GO", "LOW"),
-        ("POC3", "Camera + OCR", "GO", "LOW"),
-        ("POC4", "Encryption (quick-crypto)", "BLOCKED -- Nitro Module PKCS1 failure", "HIGH (library unusable)"),
-        ("POC5", "WebSocket + Zustand", "GO", "LOW"),
-        ("POC6", "Encryption (@noble/ciphers)", "GO -- All 5 tests PASSED", "LOW"),
-    ]
-    for i, (poc, area, verdict, risk) in enumerate(verdicts):
-        table.rows[i + 1].cells[0].text = poc
-        table.rows[i + 1].cells[1].text = area
-        table.rows[i + 1].cells[2].text = verdict
-        table.rows[i + 1].cells[3].text = risk
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    doc.add_heading("5.3 Areas Safe for Immediate Implementation (Confirmed by POC)", level=2)
-    safe_areas = [
-        "Calendar & Scheduling: expo-calendar + react-native-calendars + react-native-big-calendar (POC1 validated)",
-        "Document Vault PDF Preview: react-native-pdf v7.0.3 with config plugins (POC2 validated)",
-        "OCR Scanning: @react-native-ml-kit/text-recognition v2.0.0 + expo-camera (POC3 validated)",
-        "Document Vault Encryption: @noble/ciphers v1.3.0 + expo-crypto + expo-secure-store (POC6 validated -- all 5 tests passed)",
-        "Real-time Sync: Native WebSocket + Zustand v5.0.11 (POC5 validated)",
-        "Voice Assistant TTS: expo-speech (stable, not POC'd but well-established)",
-        "Charts & Analytics: victory-native (well-established, not POC'd)",
-    ]
-    for area in safe_areas:
-        doc.add_paragraph(area, style='List Bullet')
-
-    doc.add_heading("5.4 Areas Requiring Caution (POC4 Findings)", level=2)
-    caution = [
-        "Encryption -- Primary Library BLOCKED: react-native-quick-crypto v1.0.11 has a persistent Nitro Module initialization failure (PKCS1 undefined). All documented fixes were attempted and failed (POC4). The native C++ module compiles but does not bind to the JavaScript runtime. This is an unresolved blocker as of February 2026.",
-        "Encryption -- Fallback VALIDATED (POC6): @noble/ciphers v1.3.0 was validated in a dedicated POC6 with all 5 encryption tests passing on physical Android device. AES-256-GCM encryption/decryption, wrong key detection, tampered data detection, expo-secure-store integration, and performance benchmarks (100B to 100KB) all confirmed working. @noble/ciphers is now the RECOMMENDED encryption library for Family OS.",
-        "Encryption -- Crypto Polyfill Required: React Native's Hermes engine does NOT provide the Web Crypto API. A crypto-polyfill using expo-crypto (OS-level CSPRNG) must be imported before any @noble/ciphers code. The polyfill also handles expo-crypto's 1024-byte-per-call limit by chunking larger requests. This polyfill was validated in POC6.",
-        "Encryption -- Dual-Path Strategy: If react-native-quick-crypto releases a fix for the Nitro Module initialization issue in the future, the team can re-evaluate and switch back for native performance benefits. The encryption utility module should be designed with an abstraction layer to allow swapping between the two libraries without changing application code.",
-        "Wrong Key Detection (Issue #798): If react-native-quick-crypto is used in the future, decipher.final() may not throw with incorrect key. Application-level auth tag verification required as mitigation. Note: @noble/ciphers handles auth tag verification correctly by default (confirmed in POC6 Test 3).",
-    ]
-    for area in caution:
-        doc.add_paragraph(area, style='List Bullet')
-
-    doc.add_paragraph("")
-
-    # === SECTION 6: FINAL ASSESSMENT ===
-    doc.add_heading("6. Final Assessment", level=1)
-
-    p = doc.add_paragraph()
-    p.add_run("Overall Verdict: ").font.bold = True
-    add_colored_text(p, "GO -- Proceed to Production Development", RGBColor(0, 128, 0), bold=True)
-
-    doc.add_paragraph(
-        "The POC/spike validation under HOS-13 confirms that the Family OS React Native library stack is "
-        "production-ready. 5 out of 6 POCs passed validation fully. POC4 (react-native-quick-crypto) encountered "
-        "a persistent Nitro Module failure, but POC6 was created to validate @noble/ciphers as the encryption "
-        "alternative -- all 5 encryption tests passed on physical Android device. With POC6's validation, "
-        "ALL critical functional areas (Calendar, PDF, OCR, Encryption, Real-time Sync) now have confirmed "
-        "working library solutions."
-    )
-
-    doc.add_paragraph(
-        "For encryption, @noble/ciphers v1.3.0 is the VALIDATED and RECOMMENDED library. Combined with "
-        "expo-crypto for the Hermes crypto polyfill and expo-secure-store for key management, this provides "
-        "a complete, zero-native-dependency encryption solution. POC6 confirmed: AES-256-GCM encrypt/decrypt, "
-        "auth tag verification (wrong key, tampered data, wrong nonce all correctly detected), secure store "
-        "integration, and performance up to 100KB payloads. If react-native-quick-crypto resolves its Nitro "
-        "Module issue in a future release, the team can re-evaluate switching to native crypto."
-    )
-
-    doc.add_paragraph(
-        "The POC code (POC1 through POC6) is preserved in the HOS13 directory of the repository and can "
-        "serve as reference implementations during production development."
-    )
-
-    doc.add_paragraph("")
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.add_run("--- End of Report ---").font.color.rgb = RGBColor(150, 150, 150)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("Generated on February 17, 2026")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("V2 updated with POC/Spike results from HOS-13 (POC1-POC6)")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-
-    filepath = os.path.join(OUTPUT_DIR, "Family_OS_React_Native_Library_Evaluation_Report_v2.docx")
-    doc.save(filepath)
+def generate_library_eval_v2(output_dir=OUTPUT_DIR):
+    filepath = render_to_file("library_eval_v2", output_dir)
     print(f"Saved: {filepath}")
     return filepath
 
@@ -542,438 +29,8 @@ def generate_library_eval_v2():
 # ============================================================
 # DOCUMENT 2: Technical Blockers & Mitigation Report v2
 # ============================================================
-def generate_blockers_v2():
-    doc = Document()
-
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = 'Calibri'
-    font.size = Pt(11)
-
-    # === TITLE PAGE ===
-    for _ in range(6):
-        doc.add_paragraph("")
-
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = title.add_run("Family OS")
-    run.font.size = Pt(28)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(44, 62, 80)
-
-    subtitle = doc.add_paragraph()
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = subtitle.add_run("Technical Blockers & Mitigation Report")
-    run.font.size = Pt(22)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(44, 62, 80)
-
-    doc.add_paragraph("")
-
-    severity = doc.add_paragraph()
-    severity.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = severity.add_run("PRODUCTION RISK ANALYSIS")
-    run.font.size = Pt(14)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(192, 0, 0)
-
-    doc.add_paragraph("")
-
-    version = doc.add_paragraph()
-    version.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = version.add_run("Version 2.0 | February 17, 2026")
-    run.font.size = Pt(12)
-    run.font.color.rgb = RGBColor(100, 100, 100)
-
-    doc.add_paragraph("")
-
-    update_note = doc.add_paragraph()
-    update_note.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = update_note.add_run("UPDATED WITH POC/SPIKE VALIDATION FINDINGS")
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(196, 120, 0)
-
-    doc.add_paragraph("")
-
-    details = doc.add_paragraph()
-    details.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    details.add_run("Architecture: React Native (Expo) + Bun + Hono + tRPC + PostgreSQL RLS\n").font.size = Pt(10)
-    details.add_run("AI Stack: Google Gemini (MCP, A2UI, A2A)\n").font.size = Pt(10)
-    details.add_run("Target Scale: 100 -> 5,000+ families\n").font.size = Pt(10)
-    details.add_run("POC Environment: React Native 0.81.5 | Expo SDK 54 | Android (arm64-v8a)").font.size = Pt(10)
-
-    doc.add_page_break()
-
-    # === SECTION 1: EXECUTIVE SUMMARY ===
-    doc.add_heading("1. Executive Summary", level=1)
-
-    doc.add_heading("1.1 Purpose & Criticality", level=2)
-    doc.add_paragraph(
-        "This report identifies technical blockers, architectural risks, and mitigation strategies for Family OS, "
-        "a production-grade AI-powered household coordination platform. Early blocker identification is critical "
-        "because cross-module automation creates cascading failure risks, multi-tenant architecture with RLS can "
-        "leak sensitive household data, AI-powered automation requires guardrails, mobile OS constraints limit "
-        "real-time capabilities, and scale amplifies risks."
-    )
-
-    doc.add_heading("1.2 Version 2.0 Update: New Blockers from POC Validation", level=2)
-    doc.add_paragraph(
-        "This V2 report adds three new technical blockers discovered during hands-on POC testing (HOS-13, "
-        "February 14-17, 2026). These blockers were not identified in the V1 theoretical analysis because they "
-        "only manifest during actual build and runtime on physical devices. Blocker #19 has been resolved. "
-        "Blocker #20 remains UNRESOLVED for react-native-quick-crypto, but a dedicated POC6 was created to "
-        "validate @noble/ciphers as the encryption fallback -- all 5 encryption tests PASSED on physical "
-        "Android device. Blocker #21 has a documented mitigation (and does not apply to @noble/ciphers)."
-    )
-
-    p = doc.add_paragraph()
-    p.add_run("New blockers added in V2:").font.bold = True
-
-    new_blockers = [
-        "BLOCKER #19: react-native-quick-crypto CMake/Ninja Infinite Loop on Windows (MEDIUM severity -- RESOLVED)",
-        "BLOCKER #20: react-native-quick-crypto Nitro Module PKCS1 Initialization Failure (CRITICAL severity -- UNRESOLVED, fallback: @noble/ciphers)",
-        "BLOCKER #21: AES-256-GCM Wrong Key Detection Failure -- Issue #798 (LOW severity -- Mitigation documented)",
-    ]
-    for b in new_blockers:
-        doc.add_paragraph(b, style='List Bullet')
-
-    doc.add_page_break()
-
-    # === SECTION 2: ORIGINAL BLOCKERS (V1) ===
-    doc.add_heading("2. Identified Technical Blockers (from V1)", level=1)
-
-    doc.add_paragraph(
-        "The following blockers were identified in V1 (February 13, 2026) during architecture review and library "
-        "evaluation. All 18 original blockers remain valid. Refer to V1 report for full details."
-    )
-
-    doc.add_heading("2.1 External Calendar & Document Processing Blockers", level=2)
-
-    table = doc.add_table(rows=5, cols=4)
-    table.style = 'Table Grid'
-    headers = ["Area", "Blocker Description", "Severity", "Status in V2"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    v1_blockers = [
-        ("Calendar Sync", "No React Native library for CalDAV/iCloud sync. Custom implementation required.", "HIGH", "UNCHANGED. POC1 confirmed expo-calendar works for device-local MVP. External sync remains Post-MVP."),
-        ("OAuth Token Refresh", "Access tokens expire (1 hour for Google). Background refresh fails when app suspended.", "HIGH", "UNCHANGED. Post-MVP concern."),
-        ("Calendar Conflict Resolution", "Two-way sync creates conflicts when event edited in both systems.", "MEDIUM", "UNCHANGED. Post-MVP concern."),
-        ("PDF Encryption Performance", "Decrypting 50MB PDF in memory causes crashes on older devices.", "HIGH", "POC4 BLOCKED. react-native-quick-crypto has persistent Nitro Module failure (PKCS1 error). Fallback: @noble/ciphers (pure JS, AES-256-GCM). See new blockers #19-21."),
-    ]
-    for i, (area, desc, sev, status) in enumerate(v1_blockers):
-        table.rows[i + 1].cells[0].text = area
-        table.rows[i + 1].cells[1].text = desc
-        table.rows[i + 1].cells[2].text = sev
-        table.rows[i + 1].cells[3].text = status
-    style_table(table)
-
-    doc.add_paragraph("")
-    doc.add_paragraph(
-        "Note: All other V1 blockers (AI System Risks, Mobile Platform Constraints, Security & Compliance, "
-        "Scaling Risks) remain unchanged in V2. Refer to V1 report sections 3.2-3.5 for full details."
-    )
-
-    doc.add_page_break()
-
-    # === SECTION 3: NEW BLOCKERS FROM POC ===
-    doc.add_heading("3. New Technical Blockers (Discovered in POC Validation)", level=1)
-
-    doc.add_paragraph(
-        "The following three blockers were discovered during hands-on POC4 (Encryption) testing and were not "
-        "present in the V1 theoretical analysis. Each blocker includes root cause, error details, and verified fix."
-    )
-
-    # --- BLOCKER #19 ---
-    doc.add_heading("3.1 BLOCKER #19: react-native-quick-crypto CMake/Ninja Build Loop (Windows)", level=2)
-
-    table = doc.add_table(rows=10, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Field", "Details"),
-        ("Blocker ID", "#19 (NEW in V2)"),
-        ("Severity", "MEDIUM"),
-        ("Area", "Encryption -- Build System"),
-        ("Affected Library", "react-native-quick-crypto v1.0.11"),
-        ("Error Message", "ninja: error: manifest 'build.ninja' still dirty after 100 tries"),
-        ("Root Cause", "CMake + Ninja build system enters infinite regeneration loop when building for armeabi-v7a (32-bit ARM) architecture on Windows. This is a known issue with react-native-quick-crypto's native Nitro Module build configuration. The CMake build files reference dependencies that trigger continuous re-generation for the 32-bit target."),
-        ("Impact", "Build fails completely on Windows when targeting 32-bit ARM. Cannot produce APK that includes armeabi-v7a support. Affects development workflow on Windows machines."),
-        ("Verified Fix", "Build only for arm64-v8a (64-bit ARM) architecture by passing the architecture flag to Gradle:\n\ngradlew.bat app:installDebug -PreactNativeArchitectures=arm64-v8a -x lint -x test\n\nThis skips the problematic 32-bit build entirely. Since modern Android devices (2018+) all support arm64-v8a, this has minimal production impact."),
-        ("Production Impact", "LOW. Modern Android devices are 64-bit. Google Play requires arm64-v8a support since August 2019. Dropping armeabi-v7a only affects very old devices (pre-2018). For production builds, use CI/CD on Linux/macOS where this issue does not occur."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # --- BLOCKER #20 ---
-    doc.add_heading("3.2 BLOCKER #20: react-native-quick-crypto Nitro Module PKCS1 Initialization Failure (UNRESOLVED)", level=2)
-
-    table = doc.add_table(rows=13, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Field", "Details"),
-        ("Blocker ID", "#20 (NEW in V2)"),
-        ("Severity", "CRITICAL (Upgraded from HIGH -- error persists despite all fixes)"),
-        ("Status", "UNRESOLVED -- Fallback library (@noble/ciphers) VALIDATED in POC6 (all 5 tests PASSED)"),
-        ("Area", "Encryption -- Runtime Initialization"),
-        ("Affected Library", "react-native-quick-crypto v1.0.11 (Nitro Modules v0.33.9)"),
-        ("Error Message", "TypeError: Cannot read property 'PKCS1' of undefined\n\nThis error occurs immediately when any crypto function from react-native-quick-crypto is invoked. The native Nitro Module (C++ crypto engine compiled via CMake) builds successfully and produces .so files, but fails to bind to the JavaScript runtime at initialization."),
-        ("Root Cause Analysis", "react-native-quick-crypto v1.0.11 uses Nitro Modules (margelo/nitro) -- a new native module architecture that replaces the older NativeModule/TurboModule approach with direct C++ to JSI bindings. The module compiles native .so libraries successfully, and they are present in the APK (verified in gradle dependency tree). However, the JavaScript-to-native bridge fails to initialize at runtime.\n\nPotential contributing factors:\n- Nitro Modules v0.33.9 may have compatibility issues with React Native 0.81.5 + Expo SDK 54\n- The New Architecture (Fabric/TurboModules) interop with Nitro Modules may have undocumented requirements\n- Windows-specific build artifacts may corrupt the JSI binding layer\n- Hermes engine initialization timing may conflict with Nitro Module registration"),
-        ("All Attempted Fixes (ALL FAILED)", "The following fixes were attempted systematically, each with a full clean rebuild cycle:\n\n1. Added react-native-quick-crypto to app.json plugins array -- FAILED\n2. Installed expo-build-properties v1.0.10 -- FAILED\n3. Enabled Hermes JavaScript engine (jsEngine: hermes in app.json) -- FAILED\n4. Deleted android/.cxx, android/build, android/app/build cache directories -- FAILED\n5. Deleted entire android/ folder + npx expo prebuild --clean -- FAILED\n6. Multiple full native rebuilds with arm64-v8a architecture flag -- FAILED\n7. Verified all dependencies present: nitro-modules v0.33.9 installed, quick-crypto v1.0.11 in gradle dependency tree, Hermes enabled in gradle.properties, native .so files compiled and present in APK -- STILL FAILED\n\nConclusion: The PKCS1 error persists across all configurations. This is classified as a persistent technical blocker that cannot be resolved with current library versions."),
-        ("How to Resolve (Future)", "This error may be resolvable when:\n\n1. react-native-quick-crypto releases a patch for Expo SDK 54 + React Native 0.81.5 compatibility\n2. Nitro Modules (margelo/nitro) releases an updated version with improved Expo interop\n3. Expo SDK 55+ improves native module initialization for Nitro-based libraries\n4. The library maintainers document specific version requirements for Nitro + Expo combinations\n\nMonitor the react-native-quick-crypto GitHub issues for resolution. If a fix is released, re-test with: npm install react-native-quick-crypto@latest && npx expo prebuild --clean && rebuild."),
-        ("Impact", "CRITICAL. All encryption functionality via react-native-quick-crypto is completely blocked. The POC4 test suite (AES-256-GCM encrypt/decrypt, random bytes, key storage) could NOT be executed. The Document Vault encryption feature cannot use this library in its current state."),
-        ("Recommended Fallback: @noble/ciphers (VALIDATED in POC6)", "@noble/ciphers is the VALIDATED and RECOMMENDED replacement for react-native-quick-crypto.\n\nLibrary Details:\n- Name: @noble/ciphers\n- Tested Version: 1.3.0 (validated in POC6)\n- Type: Pure JavaScript (no native modules, no JSI, no Nitro)\n- Security: Independently audited by Cure53\n- Downloads: 593,000+ weekly on npm\n- AES-256-GCM: Full support (encrypt, decrypt, auth tag verification)\n- Bundle Size: Tree-shakeable, import only what you need\n- Compatibility: Works with Expo Go, Development Builds, and bare React Native\n- Dependencies: Zero\n- Ecosystem: Part of @noble suite (noble-hashes, noble-curves, noble-ciphers)\n\nPOC6 Validation Results (All 5 Tests PASSED on Physical Android Device):\n- Test 1: Random Bytes Generation (16, 32, 64 bytes + uniqueness check) -- PASS\n- Test 2: AES-256-GCM Encrypt/Decrypt Round-Trip -- PASS\n- Test 3: Wrong Key / Tampered Data / Wrong Nonce Detection -- PASS\n- Test 4: Secure Store Integration (expo-secure-store) -- PASS\n- Test 5: Performance Benchmark (100B, 1KB, 10KB, 100KB) -- PASS\n\nRequired Setup:\n- npm install @noble/ciphers expo-crypto expo-secure-store\n- Create crypto-polyfill.ts using expo-crypto to polyfill globalThis.crypto.getRandomValues (Hermes engine does not provide Web Crypto API)\n- Import crypto-polyfill.ts BEFORE any @noble/ciphers imports in the app entry point\n- Note: expo-crypto has a 1024-byte limit per getRandomBytes() call; the polyfill chunks larger requests automatically\n\nUsage:\n- Import: import { gcm } from '@noble/ciphers/aes'\n- Encrypt: gcm(key, nonce).encrypt(plaintext)\n- Decrypt: gcm(key, nonce).decrypt(ciphertext)\n- Auth tag verification is built-in (throws on tampered data or wrong key -- confirmed in POC6 Test 3)"),
-        ("Production Impact", "LOW (with @noble/ciphers validated). react-native-quick-crypto cannot be used. @noble/ciphers v1.3.0 has been VALIDATED in POC6 with all 5 encryption tests passing. Performance benchmarks from POC6 confirm sub-millisecond encryption for payloads up to 10KB and low single-digit milliseconds for 100KB -- sufficient for Family OS Document Vault. The encryption utility module should use an abstraction layer to allow future swapping if quick-crypto is fixed."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    # --- BLOCKER #21 ---
-    doc.add_heading("3.3 BLOCKER #21: AES-256-GCM Wrong Key Detection Failure (Issue #798)", level=2)
-
-    table = doc.add_table(rows=10, cols=2)
-    table.style = 'Table Grid'
-    data = [
-        ("Field", "Details"),
-        ("Blocker ID", "#21 (NEW in V2)"),
-        ("Severity", "LOW"),
-        ("Area", "Encryption -- Security Verification"),
-        ("Affected Library", "react-native-quick-crypto v1.0.11"),
-        ("Issue Reference", "GitHub Issue #798 on react-native-quick-crypto"),
-        ("Root Cause", "When decrypting AES-256-GCM ciphertext with an incorrect key, decipher.final() may NOT throw an error as expected. In standard Node.js crypto, decrypting with a wrong key should throw 'Unsupported state or unable to authenticate data'. In react-native-quick-crypto, this error may be silently swallowed, returning garbage data instead."),
-        ("Impact", "LOW for Family OS. Without explicit error throwing, the application cannot rely solely on try/catch around decipher.final() to detect tampering or wrong-key scenarios. Decrypted data may appear as garbled text rather than triggering an error. This is a security concern for Document Vault -- a user could potentially decrypt a document with the wrong key and see corrupted (but not rejected) content."),
-        ("Verified Mitigation", "Implement application-level auth tag verification:\n\n1. After encryption, store the GCM auth tag alongside the ciphertext.\n2. Before decryption, manually verify the auth tag.\n3. If verification fails, reject the decryption attempt BEFORE calling decipher.final().\n4. Additionally, add a known-plaintext header (e.g., magic bytes 'FAMILYOS_V1') to all encrypted data. After decryption, check if the header is present. If not, the key was wrong.\n\nThis provides defense-in-depth regardless of whether the library throws correctly."),
-        ("Production Impact", "LOW with mitigation applied. The auth tag verification provides equivalent security to the expected throw behavior. Add this verification to the encryption utility module during production development."),
-    ]
-    for i, (k, v) in enumerate(data):
-        table.rows[i].cells[0].text = k
-        table.rows[i].cells[1].text = v
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 4: UPDATED RISK MATRIX ===
-    doc.add_heading("4. Updated Risk Prioritization Matrix (V2)", level=1)
-
-    doc.add_paragraph(
-        "This matrix includes the three new blockers from POC validation alongside the original V1 risks. "
-        "New entries are marked with (NEW)."
-    )
-
-    table = doc.add_table(rows=18, cols=5)
-    table.style = 'Table Grid'
-    headers = ["Risk", "Probability (1-5)", "Impact (1-5)", "Priority Score", "Mitigation Timeline"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    risks = [
-        ("(NEW) Nitro Module PKCS1 Failure #20", "5", "2", "10", "MITIGATED -- @noble/ciphers VALIDATED in POC6"),
-        ("PDF Encryption Memory Crash", "4", "4", "16", "Before MVP (chunked decryption)"),
-        ("AI Hallucination (Financial)", "4", "4", "16", "Before MVP (validation layer)"),
-        ("Gemini API Rate Limits", "4", "4", "16", "Before 1,000 families"),
-        ("JWT Token Leakage", "3", "5", "15", "Before MVP (secure storage)"),
-        ("File Storage Public Exposure", "3", "5", "15", "Before MVP (GCS config)"),
-        ("iOS Background WebSocket Kill", "5", "3", "15", "MVP (accept + push notifs)"),
-        ("Cross-Module Cascade Failures", "3", "4", "12", "Phase 2"),
-        ("RLS Policy Bypass", "2", "5", "10", "Before MVP (security testing)"),
-        ("PostgreSQL Connection Exhaustion", "2", "5", "10", "Before 1,000 families"),
-        ("Concurrent Edit Conflicts", "3", "3", "9", "Phase 2"),
-        ("Google Cloud STT Cost", "3", "3", "9", "MVP (usage caps)"),
-        ("OAuth Token Refresh", "3", "3", "9", "Phase 2"),
-        ("OCR Accuracy Drops", "4", "2", "8", "MVP (confidence thresholds)"),
-        ("(NEW) CMake Ninja Loop #19", "3", "2", "6", "MVP (build for arm64 only)"),
-        ("Network Partition Split-Brain", "2", "2", "4", "MVP (UUID primary keys)"),
-        ("(NEW) Wrong Key Detection #21", "2", "2", "4", "MVP (auth tag verification)"),
-    ]
-    for i, (risk, prob, impact, score, timeline) in enumerate(risks):
-        table.rows[i + 1].cells[0].text = risk
-        table.rows[i + 1].cells[1].text = prob
-        table.rows[i + 1].cells[2].text = impact
-        table.rows[i + 1].cells[3].text = score
-        table.rows[i + 1].cells[4].text = timeline
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 5: UPDATED MITIGATION ROADMAP ===
-    doc.add_heading("5. Updated Mitigation Roadmap (V2)", level=1)
-
-    doc.add_heading("5.1 Critical Path: Must Solve Before MVP Launch", level=2)
-
-    doc.add_paragraph(
-        "All items from V1 Section 5.1 remain. The following items are ADDED based on POC findings:"
-    )
-
-    doc.add_heading("Encryption Library Migration (NEW -- Immediate):", level=3)
-    new_items = [
-        "VALIDATED: @noble/ciphers v1.3.0 has been validated in POC6 with all 5 encryption tests passing on physical Android device. Install: npm install @noble/ciphers expo-crypto expo-secure-store",
-        "CRITICAL: Include crypto-polyfill.ts in project entry point (imports expo-crypto to polyfill globalThis.crypto.getRandomValues for Hermes engine). Must be imported BEFORE any @noble/ciphers code. Reference POC6-NobleCiphers/crypto-polyfill.ts for implementation.",
-        "Create an encryption utility module with an abstraction layer (e.g., EncryptionService interface) that wraps @noble/ciphers. This allows future swapping to react-native-quick-crypto if its Nitro Module issue is resolved.",
-        "Use expo-secure-store for encryption key storage (iOS Keychain / Android KeyStore). Validated in POC6 Test 4.",
-        "Use expo-crypto (getRandomBytes) for cryptographically secure random number generation (nonces, IVs). Note: 1024-byte limit per call -- crypto-polyfill handles chunking automatically.",
-        "Test AES-256-GCM encrypt/decrypt round-trip with @noble/ciphers in CI/CD pipeline.",
-        "Monitor react-native-quick-crypto GitHub releases for Nitro Module fix. Re-evaluate when a new version is released that addresses the PKCS1 initialization issue.",
-        "If react-native-quick-crypto is used in the future: configure app.json plugins, install expo-build-properties, target arm64-v8a on Windows, implement application-level auth tag verification (Issue #798 mitigation). Note: @noble/ciphers handles auth tag verification correctly by default.",
-    ]
-    for item in new_items:
-        doc.add_paragraph(item, style='List Bullet')
-
-    doc.add_heading("5.2 V1 Mitigations (Unchanged)", level=2)
-    doc.add_paragraph(
-        "All mitigation items from V1 Sections 5.1 (Security Hardening, AI Validation Layer, Mobile Platform "
-        "Resilience, Cost Controls), 5.2 (Phase 2 Enhancements), and 5.3 (Infrastructure Scaling) remain "
-        "unchanged and valid. Refer to V1 report for full details."
-    )
-
-    doc.add_page_break()
-
-    # === SECTION 6: POC VALIDATION IMPACT ON RISK ASSESSMENT ===
-    doc.add_heading("6. POC Validation Impact on Overall Risk Assessment", level=1)
-
-    doc.add_heading("6.1 Risks Reduced by POC Validation", level=2)
-
-    table = doc.add_table(rows=6, cols=3)
-    table.style = 'Table Grid'
-    headers = ["Risk Area", "V1 Assessment", "V2 Assessment (Post-POC)"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    reduced = [
-        ("Calendar Library Compatibility", "MEDIUM -- Uncertain if expo-calendar works with Expo SDK 52+", "LOW -- POC1 confirmed expo-calendar v15.0.8 works with Expo SDK 54. React-native-calendars and big-calendar also validated."),
-        ("PDF Viewer Stability", "MEDIUM -- react-native-pdf has 'occasional Android crashes'", "LOW -- POC2 confirmed stable rendering on Android for 1-page, 6-page, and 100+ page PDFs."),
-        ("OCR Accuracy", "MEDIUM -- Theoretical accuracy claims", "LOW -- POC3 confirmed ML Kit on-device OCR provides fast, accurate text extraction with block-level coordinates."),
-        ("Encryption Fallback Viability", "HIGH -- @noble/ciphers was theoretical recommendation only", "LOW -- POC6 validated @noble/ciphers v1.3.0 with all 5 encryption tests passing: random bytes, AES-256-GCM round-trip, wrong key/tamper detection, secure store integration, performance benchmarks. Encryption is now a confirmed working solution."),
-        ("WebSocket + Zustand Integration", "MEDIUM -- Custom wrapper complexity", "LOW -- POC5 confirmed straightforward integration. No wrapper library needed. Auto-reconnect works."),
-    ]
-    for i, (area, v1, v2) in enumerate(reduced):
-        table.rows[i + 1].cells[0].text = area
-        table.rows[i + 1].cells[1].text = v1
-        table.rows[i + 1].cells[2].text = v2
-    style_table(table)
-
-    doc.add_paragraph("")
-
-    doc.add_heading("6.2 Risks Increased/Discovered by POC Validation", level=2)
-
-    table = doc.add_table(rows=4, cols=3)
-    table.style = 'Table Grid'
-    headers = ["Risk Area", "V1 Assessment", "V2 Assessment (Post-POC)"]
-    for i, h in enumerate(headers):
-        table.rows[0].cells[i].text = h
-
-    increased = [
-        ("Encryption Runtime Failure", "MEDIUM -- 'JSI-based, requires careful setup'", "MITIGATED -- react-native-quick-crypto v1.0.11 BLOCKED (Nitro Module PKCS1 failure, 7 fix attempts failed). However, POC6 validated @noble/ciphers v1.3.0 as a fully working replacement -- all 5 encryption tests passed. Risk reduced from CRITICAL to MITIGATED with validated fallback."),
-        ("Encryption Version Mismatch", "Not identified", "MEDIUM -- V1 listed ~0.7.5 but actual version is 1.0.11 (major version jump). The v1.0.x release introduced Nitro Modules architecture (native C++ via JSI), a complete rewrite from v0.7.x NativeModule approach. Lesson: always verify actual npm versions before architecture decisions."),
-        ("Wrong Key Detection", "Not identified", "LOW -- Applies only to react-native-quick-crypto (Issue #798). @noble/ciphers handles auth tag verification correctly by default (confirmed in POC6 Test 3 -- wrong key, tampered data, and wrong nonce all correctly threw errors)."),
-    ]
-    for i, (area, v1, v2) in enumerate(increased):
-        table.rows[i + 1].cells[0].text = area
-        table.rows[i + 1].cells[1].text = v1
-        table.rows[i + 1].cells[2].text = v2
-    style_table(table)
-
-    doc.add_page_break()
-
-    # === SECTION 7: FINAL GO/NO-GO ===
-    doc.add_heading("7. Technical Go / No-Go Assessment (Updated)", level=1)
-
-    doc.add_heading("7.1 Feasibility with Current Stack", level=2)
-
-    p = doc.add_paragraph()
-    p.add_run("Verdict: ").font.bold = True
-    add_colored_text(p, "GO (with conditions)", RGBColor(0, 128, 0), bold=True)
-
-    doc.add_paragraph(
-        "Family OS is technically feasible with the current architecture. POC validation has confirmed ALL "
-        "critical areas have working solutions. 5 out of 6 POCs passed (POC1-3, POC5-6). POC4 "
-        "(react-native-quick-crypto) is BLOCKED, but POC6 (@noble/ciphers) VALIDATED encryption as fully "
-        "working with all 5 tests passing. Every critical functional area -- Calendar, PDF, OCR, Encryption, "
-        "and Real-time Sync -- now has a confirmed, tested library solution."
-    )
-
-    doc.add_heading("7.2 Updated Confidence Rating", level=2)
-
-    p = doc.add_paragraph()
-    p.add_run("Confidence Rating: ").font.bold = True
-    add_colored_text(p, "HIGH (9/10) -- Upgraded from V1 (8/10)", RGBColor(0, 128, 0), bold=True)
-
-    doc.add_paragraph("Confidence adjustments from V1:")
-
-    adjustments = [
-        "+0.5: POC validation confirmed 5/6 POCs pass on actual devices (not just theoretical analysis)",
-        "+0.5: Calendar, PDF, OCR, WebSocket risks all reduced from MEDIUM to LOW based on hands-on testing",
-        "-1.0: react-native-quick-crypto (POC4) has persistent unresolved Nitro Module failure; library is BLOCKED",
-        "+1.0: POC6 VALIDATED @noble/ciphers as fully working encryption solution -- all 5 tests passed on physical device, completely mitigating the POC4 blocker",
-        "Net: +1.0 from V1 baseline. All critical areas now have validated, working solutions.",
-    ]
-    for adj in adjustments:
-        doc.add_paragraph(adj, style='List Bullet')
-
-    doc.add_heading("7.3 Conditions for Production Launch (Updated)", level=2)
-
-    conditions = [
-        "Complete all 'Critical Path: Must Solve Before MVP Launch' items (V1 Section 5.1 + V2 Section 5.1)",
-        "Implement encryption using @noble/ciphers v1.3.0 with AES-256-GCM (VALIDATED in POC6 -- encrypt/decrypt round-trip confirmed working)",
-        "Include crypto-polyfill.ts in project entry point for Hermes engine compatibility (reference POC6-NobleCiphers/crypto-polyfill.ts)",
-        "Create EncryptionService abstraction layer to allow future library swapping (if react-native-quick-crypto is fixed)",
-        "Auth tag verification: CONFIRMED working in POC6 Test 3 (wrong key, tampered data, wrong nonce all correctly throw errors)",
-        "Pass penetration testing for RLS bypass, JWT manipulation, file access, encryption integrity",
-        "Load testing: 500 concurrent users, validate no connection pool exhaustion",
-        "Encryption performance testing with @noble/ciphers on target devices (iPhone 8, Android API 23) for files up to 10MB (POC6 benchmarked up to 100KB successfully)",
-        "AI validation layer tested with 100+ real receipts/invitations",
-        "Monitoring dashboard operational with automated alerts",
-        "Document encryption library decision (@noble/ciphers) and the react-native-quick-crypto blocker in developer onboarding guide",
-        "Monitor react-native-quick-crypto releases for Nitro Module fix -- re-evaluate if v1.1+ is released",
-    ]
-    for c in conditions:
-        doc.add_paragraph(c, style='List Bullet')
-
-    doc.add_paragraph("")
-
-    p = doc.add_paragraph()
-    p.add_run("Architectural Approval: ").font.bold = True
-    add_colored_text(p, "GRANTED (Conditional)", RGBColor(0, 128, 0), bold=True)
-
-    doc.add_paragraph(
-        "Once conditions are met, architecture is approved for production deployment with up to 1,000 families. "
-        "Re-assessment required before scaling to 5,000+ families."
-    )
-
-    doc.add_paragraph("")
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.add_run("--- End of Technical Risk Assessment ---").font.color.rgb = RGBColor(150, 150, 150)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("Generated on February 17, 2026")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("V2 updated with POC/Spike findings from HOS-13 (POC1-POC6)")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("POC6 validated @noble/ciphers as encryption solution -- all 5 tests PASSED")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run("Approved for architectural review and production planning")
-    run.font.color.rgb = RGBColor(150, 150, 150)
-    run.font.size = Pt(9)
-
-    filepath = os.path.join(OUTPUT_DIR, "Family_OS_Technical_Blockers_and_Mitigation_Report_v2.docx")
-    doc.save(filepath)
+def generate_blockers_v2(output_dir=OUTPUT_DIR):
+    filepath = render_to_file("blockers_v2", output_dir)
     print(f"Saved: {filepath}")
     return filepath
 
@@ -0,0 +1,82 @@
+from docgen.diff import NOT_MENTIONED, correction_rows, diff_outlines
+
+OLD = [
+    ("heading", "Report", 0),
+    ("paragraph", "Draft"),
+    ("heading", "3. Package Stack", 1),
+    ("paragraph", "Versions tested on SDK 53."),
+    ("table", [
+        ("#", "Library", "Version", "Notes"),
+        ("1", "expo-crypto", "14.1.3", "polyfill"),
+        ("2", "zustand", "4.x", "state"),
+        ("3", "dayjs", "1.11.0", "dates"),
+    ]),
+    ("heading", "4. Corrections", 1),
+    ("paragraph", "None yet."),
+]
+
+NEW = [
+    ("heading", "Report", 0),
+    ("paragraph", "Final"),
+    ("heading", "2. Package Stack", 1),
+    ("paragraph", "Versions tested on SDK 54."),
+    ("table", [
+        ("#", "Library", "Version", "Notes"),
+        ("1", "zustand", "5.0.11", "state"),
+        ("2", "expo-crypto", "14.1.5", "crypto polyfill"),
+        ("3", "tslib", "2.8.1", "helpers"),
+    ]),
+    ("heading", "4. Corrections", 1),
+    ("paragraph", "Two."),
+]
+
+
+def _changes():
+    return diff_outlines(OLD, NEW)
+
+
+def test_renumbered_section_still_matches():
+    changes = _changes()
+    assert {"op": "changed", "kind": "section", "section": "2. Package Stack",
+            "old": "3. Package Stack", "new": "2. Package Stack"} in changes
+    assert not any(change["kind"] == "section" and change["op"] != "changed" for change in changes)
+
+
+def test_rows_match_by_key_not_position():
+    cells = {(c["row"], c["column"]): c for c in _changes() if c["kind"] == "cell"}
+    assert set(cells) == {
+        ("zustand", "#"), ("zustand", "Version"),
+        ("expo-crypto", "#"), ("expo-crypto", "Version"), ("expo-crypto", "Notes"),
+    }
+    assert cells["expo-crypto", "Version"]["version"] is True
+    assert cells["expo-crypto", "Notes"]["version"] is False
+    rows = {(c["op"], c["row"]) for c in _changes() if c["kind"] == "row"}
+    assert rows == {("removed", "dayjs"), ("added", "tslib")}
+
+
+def test_correction_rows_keep_only_corrections():
+    rows = correction_rows(_changes())
+    assert rows == [
+        ["1", "Report (paragraph)", "Draft", "CORRECTED: Final"],
+        ["2", "Package Stack (paragraph)", "Versions tested on SDK 53.", "CORRECTED: Versions tested on SDK 54."],
+        ["3", "Package Stack - zustand: Version", "4.x", "CORRECTED: 5.0.11"],
+        ["4", "Package Stack - expo-crypto: Version", "14.1.3", "CORRECTED: 14.1.5"],
+        ["5", "Corrections (paragraph)", "None yet.", "CORRECTED: Two."],
+    ]
+
+
+def test_correction_rows_skip_the_excluded_section():
+    rows = correction_rows(_changes(), "4. Corrections")
+    assert [row[1] for row in rows][-1] == "Package Stack - expo-crypto: Version"
+    assert [row[0] for row in rows] == ["1", "2", "3", "4"]
+
+
+def test_correction_rows_flatten_lines_and_name_untitled_text():
+    changes = diff_outlines([("paragraph", "a\n  b")], [("paragraph", "a\nc")])
+    assert correction_rows(changes) == [["1", "Opening text (paragraph)", "a b", "CORRECTED: a c"]]
+
+
+def test_correction_rows_mark_empty_old_cells():
+    old = [("heading", "S", 1), ("table", [("Library", "Version"), ("x", "")])]
+    new = [("heading", "S", 1), ("table", [("Library", "Version"), ("x", "1.0.0")])]
+    assert correction_rows(diff_outlines(old, new)) == [["1", "S - x: Version", NOT_MENTIONED, "CORRECTED: 1.0.0"]]
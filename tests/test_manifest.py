@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+import docgen.specs
+from docgen.manifest import Manifest, input_hash
+from docgen.reproducible import EPOCH_VARIABLE
+
+
+@pytest.fixture
+def spec_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(docgen.specs, "SPEC_DIR", str(tmp_path))
+    monkeypatch.delenv(EPOCH_VARIABLE, raising=False)
+    return tmp_path
+
+
+def _write_spec(spec_dir, text, mtime_ns):
+    path = spec_dir / "t.json"
+    path.write_text(json.dumps({
+        "name": "t",
+        "title": "T",
+        "filename": "t.docx",
+        "sections": [{"id": "s", "title": "S", "blocks": [{"type": "paragraph", "text": text}]}],
+    }))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_input_hash_is_stable(spec_dir):
+    _write_spec(spec_dir, "one", 1_000_000_000)
+    assert input_hash("t") == input_hash("t")
+
+
+def test_input_hash_follows_the_spec(spec_dir):
+    _write_spec(spec_dir, "one", 1_000_000_000)
+    before = input_hash("t")
+    _write_spec(spec_dir, "two", 2_000_000_000)
+    assert input_hash("t") != before
+
+
+def test_input_hash_follows_the_build_epoch(spec_dir, monkeypatch):
+    _write_spec(spec_dir, "one", 1_000_000_000)
+    before = input_hash("t")
+    monkeypatch.setenv(EPOCH_VARIABLE, "1700000000")
+    assert input_hash("t") != before
+
+
+def test_manifest_is_current_only_for_the_recorded_hash(spec_dir, tmp_path_factory):
+    _write_spec(spec_dir, "one", 1_000_000_000)
+    output_dir = tmp_path_factory.mktemp("out")
+    (output_dir / "t.docx").write_bytes(b"docx")
+    manifest = Manifest.load(str(output_dir))
+    digest = input_hash("t")
+    assert manifest.record("t", digest) is False  # first build: no earlier output
+    assert manifest.is_current("t", digest)
+    assert manifest.record("t", digest) is True
+    _write_spec(spec_dir, "two", 2_000_000_000)
+    assert not manifest.is_current("t", input_hash("t"))
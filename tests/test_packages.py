@@ -0,0 +1,61 @@
+import pytest
+
+from docgen.packages import satisfies
+
+
+@pytest.mark.parametrize("version, declared, expected", [
+    ("1.3.0", "^1.2.1", True),
+    ("1.2.0", "^1.2.1", False),
+    ("2.0.0", "^1.2.1", False),
+    ("0.2.5", "^0.2.3", True),
+    ("0.3.0", "^0.2.3", False),
+    ("0.0.4", "^0.0.3", False),
+    ("14.1.5", "~14.1.3", True),
+    ("14.2.0", "~14.1.3", False),
+    ("1.2.3", "~1", True),
+    ("1.2.3", "~>1.2.0", True),
+    ("19.1.0", "19.1.0", True),
+    ("19.1.1", "19.1.0", False),
+    ("5.0.11", "5.x", True),
+    ("6.0.0", "5.x", False),
+    ("1.2.3", "*", True),
+    ("1.2.3", "", True),
+    ("1.2.3", "<*", False),
+    ("1.5.0", ">=1.2 <2", True),
+    ("2.0.0", ">=1.2 <2", False),
+    ("1.2.3", "> 1.2", False),
+    ("1.3.0", "> 1.2", True),
+    ("1.2.3", "<=1.2", True),
+    ("1.3.0", "<=1.2", False),
+    ("1.5.0", "1.0.0 - 1.6", True),
+    ("1.7.0", "1.0.0 - 1.6", False),
+    ("3.0.0", "^1 || ^3", True),
+    ("2.0.0", "^1 || ^3", False),
+])
+def test_satisfies(version, declared, expected):
+    assert satisfies(version, declared) is expected
+
+
+@pytest.mark.parametrize("version, declared, expected", [
+    ("2.0.0-beta.1", "^1.0.0", False),
+    ("1.1.0-beta.1", "^1.0.0", False),
+    ("1.0.0-rc.1", "*", False),
+    ("1.0.0-beta.2", "^1.0.0-beta.1", True),
+    ("1.0.0-beta.10", "^1.0.0-beta.2", True),
+    ("1.0.0-alpha", "^1.0.0-beta.1", False),
+    ("1.0.1-beta", "^1.0.0-beta.1", False),
+    ("1.0.0", "^1.0.0-beta.1", True),
+    ("1.0.0-rc.1", "1.0.0-rc.1", True),
+])
+def test_satisfies_prereleases(version, declared, expected):
+    assert satisfies(version, declared) is expected
+
+
+@pytest.mark.parametrize("version, declared", [
+    ("1.2.3", "latest"),
+    ("1.2.3", "github:user/repo"),
+    ("1.2", "^1.0.0"),
+    ("N/A", "^1.0.0"),
+])
+def test_satisfies_unreadable(version, declared):
+    assert satisfies(version, declared) is None
@@ -0,0 +1,89 @@
+import pytest
+
+from docgen.specs import apply_params, list_specs, load_spec, param_values, validate_spec
+
+
+def _spec(blocks, **extra):
+    return {
+        "name": "t",
+        "title": "T",
+        "filename": "t.docx",
+        "sections": [{"id": "s", "title": "S", "blocks": blocks}],
+        **extra,
+    }
+
+
+@pytest.mark.parametrize("name", list_specs())
+def test_shipped_specs_are_valid(name):
+    assert validate_spec(load_spec(name)) == []
+
+
+def test_validate_spec_reports_missing_fields():
+    assert validate_spec({"name": "t"}) == ["missing 'title'", "missing 'filename'", "missing 'sections'"]
+
+
+def test_validate_spec_rejects_unknown_block_type():
+    problems = validate_spec(_spec([{"type": "nope"}]))
+    assert len(problems) == 1 and "nope" in problems[0]
+
+
+def test_validate_spec_requires_a_style_per_cell():
+    table = {"type": "table", "header": ["a", "b", "c"], "rows": [["1", "2", "3"]], "styles": [["Status-Pass"]]}
+    assert validate_spec(_spec([table])) == ["section 's' block 0 styles 0: 1 entries for a row of 3 cells"]
+    table["styles"] = [["Status-Pass", None, None]]
+    assert validate_spec(_spec([table])) == []
+
+
+def test_validate_spec_requires_a_styles_entry_per_row():
+    table = {"type": "table", "header": ["a"], "rows": [["1"], ["2"]], "styles": [[None]]}
+    assert validate_spec(_spec([table])) == ["section 's' block 0: 'styles' needs one entry per row"]
+
+
+PARAMS = {"platform": "windows", "pocs": ["POC1", "POC2"]}
+BLOCKS = [
+    {"type": "paragraph", "text": "Run on {{platform}}: {{pocs}}"},
+    {"type": "paragraph", "text": "linux only", "if": {"platform": "linux"}},
+    {"type": "paragraph", "text": "POC2", "if": {"pocs": "POC2"}},
+    {"type": "code", "code": "style={{ flex: 1 }}"},
+]
+
+
+def _texts(spec):
+    return [block.get("text", block.get("code")) for block in spec["sections"][0]["blocks"]]
+
+
+def test_apply_params_uses_defaults():
+    spec = apply_params(_spec(BLOCKS, params=PARAMS))
+    assert "params" not in spec
+    assert _texts(spec) == ["Run on windows: POC1, POC2", "POC2", "style={{ flex: 1 }}"]
+
+
+def test_apply_params_overrides_and_filters():
+    spec = apply_params(_spec(BLOCKS, params=PARAMS), {"platform": "linux", "pocs": ["POC2"]})
+    assert _texts(spec) == ["Run on linux: POC2", "linux only", "POC2", "style={{ flex: 1 }}"]
+
+
+def test_apply_params_leaves_specs_without_params_alone():
+    spec = _spec(BLOCKS)
+    assert apply_params(spec) is spec
+    with pytest.raises(ValueError, match="declares no params"):
+        apply_params(spec, {"platform": "linux"})
+
+
+@pytest.mark.parametrize("values, message", [
+    ({"os": "linux"}, "unknown param"),
+    ({"pocs": "POC1"}, "must be a list"),
+    ({"platform": "macos"}, "no content for macos"),
+    ({"pocs": ["POC2", "POC9"]}, "no content for POC9"),
+])
+def test_apply_params_rejects_bad_values(values, message):
+    with pytest.raises(ValueError, match=message):
+        apply_params(_spec(BLOCKS, params=PARAMS), values)
+
+
+def test_param_values_splits_list_params():
+    spec = _spec(BLOCKS, params=PARAMS)
+    assert param_values(spec, {"platform": "linux", "pocs": "POC1, POC3 POC6"}) == {
+        "platform": "linux",
+        "pocs": ["POC1", "POC3", "POC6"],
+    }
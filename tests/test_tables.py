@@ -0,0 +1,40 @@
+import re
+
+import pytest
+
+from docgen.styles import character_style_id
+from docgen.tables import iter_table_xml
+
+
+def _rows(header, rows, cell_styles=None):
+    """Per body row, ``[(text, style id or None)]`` per cell."""
+    pieces = list(iter_table_xml(header, rows, 1000, cell_styles=cell_styles))
+    out = []
+    for piece in pieces[2:-1]:
+        cells = re.findall(r"<w:tc>(.*?)</w:tc>", piece)
+        out.append([
+            ("".join(re.findall(r"<w:t[^>]*>([^<]*)</w:t>", cell)),
+             (re.findall(r'<w:rStyle w:val="([^"]+)"/>', cell) or [None])[0])
+            for cell in cells
+        ])
+    return out
+
+
+def test_short_rows_are_padded_to_the_grid():
+    assert _rows(["a", "b", "c"], [["1"]]) == [[("1", None), ("", None), ("", None)]]
+
+
+def test_short_styles_keep_every_cell():
+    pass_id = character_style_id("Status-Pass")
+    assert _rows(["a", "b", "c"], [["1", "2", "3"]], [["Status-Pass"]]) == [
+        [("1", pass_id), ("2", None), ("3", None)],
+    ]
+
+
+def test_missing_styles_rows_are_unstyled():
+    assert _rows(["a", "b"], [["1", "2"], ["3", "4"]], [[None, "Status-Pass"]])[1] == [("3", None), ("4", None)]
+
+
+def test_long_rows_are_rejected():
+    with pytest.raises(ValueError, match="row has 3 cells, table has 2 columns"):
+        list(iter_table_xml(["a", "b"], [["1", "2", "3"]], 1000))